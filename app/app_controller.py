@@ -1,62 +1,122 @@
 # engine/app_controller.py
 
+from concurrent.futures import ThreadPoolExecutor
+
+from core.profiler import profiler
 from data.QK_data_manager import QKHistoricalData
+from data.fetch_request import QKFetchRequest
+from indicators.indicator_cache import IndicatorCache
 from strategies.QK_strategy_manager import StrategyManager
+from strategies.signal_filter import SignalFilter
+from strategies.strategy_plan import StrategyPlan
 
 
 class AppController:
     """
     Central application orchestrator.
     Executes pipeline for ONE ticker.
+
+    Reentrant: per-call state lives in an immutable QKFetchRequest and a
+    compiled (read-only) StrategyPlan, so run_pipeline can serve many
+    tickers from parallel threads. `strategy_manager` is kept for
+    interactive use and is not touched by the pipeline.
     """
 
     def __init__(
         self,
         data_manager: QKHistoricalData,
         strategy_manager: StrategyManager,
+        indicator_cache: IndicatorCache | None = None,
     ):
         self.data_manager = data_manager
         self.strategy_manager = strategy_manager
+        # shared by every run → unchanged candles skip indicator compute
+        self.indicator_cache = indicator_cache or IndicatorCache()
 
     def run_pipeline(
         self,
         *,
-        api,
+        api=None,
         ticker: str,
-        fetch_config,
-        indicators,
-        strategies,
+        fetch_config=None,
+        indicators=(),
+        strategies=(),
+        signal_filter: SignalFilter | None = None,
+        request: QKFetchRequest | None = None,
+        plan: StrategyPlan | None = None,
     ):
-        # ---------- RESET STRATEGY STATE ----------
-        self.strategy_manager.clear()
-
-        # ---------- APPLY FETCH CONFIG ----------
-        self.data_manager.set_params(
-            from_date=fetch_config["from_date"],
-            to_date=fetch_config["to_date"],
-            interval=fetch_config["interval"],
-            unit=fetch_config["unit"],
-            intraday_interval=fetch_config.get("intraday_interval"),
-        )
-
-        # ---------- API SWITCH ----------
-        self.data_manager.switch_api(api)
+        """
+        Returns the computed frame, or None if `signal_filter`
+        rejected the ticker.
+        Pass a pre-compiled `plan` to skip per-ticker setup.
+        """
+        with profiler.ticker(ticker):
+            return self._run_pipeline(
+                ticker=ticker,
+                request=request or QKFetchRequest.from_config(api, fetch_config),
+                plan=plan or StrategyPlan.compile(
+                    indicators, strategies, cache=self.indicator_cache
+                ),
+                signal_filter=signal_filter,
+            )
 
+    def _run_pipeline(
+        self,
+        *,
+        ticker: str,
+        request: QKFetchRequest,
+        plan: StrategyPlan,
+        signal_filter: SignalFilter | None,
+    ):
         # ---------- FETCH ----------
-        if fetch_config["mode"] == "intraday":
-            df = self.data_manager.fetch_intraday(ticker)
-        else:
-            df = self.data_manager.fetch_historical(ticker)
+        df = self.data_manager.fetch(ticker, request)
 
-        # ---------- REGISTER INDICATORS ----------
-        for ind in indicators:
-            self.strategy_manager._indicator_manager.add(ind)
-
-        # ---------- REGISTER STRATEGIES ----------
-        for strat in strategies:
-            self.strategy_manager.add(strat)
+        # ---------- SIGNAL FILTER (TAIL EVALUATION) ----------
+        # only the last N bars matter for the filter → compute over the
+        # minimal suffix first, full history only for tickers that pass
+        if signal_filter is not None and signal_filter.enabled:
+            tail_df = plan.run(df, tail=signal_filter.bars(df))
+            if not signal_filter.passes(tail_df, plan.signal_columns):
+                return None
 
         # ---------- EXECUTION ----------
-        df = self.strategy_manager.run(df)
+        df = plan.run(df)
 
         return df
+
+    def run_many(
+        self,
+        tickers,
+        *,
+        request: QKFetchRequest,
+        indicators,
+        strategies,
+        signal_filter: SignalFilter | None = None,
+        max_workers: int = 4,
+    ):
+        """
+        Run the pipeline for many tickers on a thread pool.
+        Yields (ticker, df | None, error | None) in ticker order.
+        """
+        # 🔥 compile once, run many
+        plan = StrategyPlan.compile(
+            indicators, strategies, cache=self.indicator_cache
+        )
+
+        def job(ticker):
+            try:
+                df = self.run_pipeline(
+                    ticker=ticker,
+                    request=request,
+                    plan=plan,
+                    signal_filter=signal_filter,
+                )
+                return ticker, df, None
+            except Exception as e:
+                return ticker, None, e
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="qk-pipeline",
+        ) as pool:
+            yield from pool.map(job, tickers)
@@ -0,0 +1,491 @@
+# backtest/event_backtester.py
+import heapq
+import itertools
+import time as _time
+from dataclasses import dataclass
+from datetime import time
+from enum import IntEnum
+
+import numpy as np
+import pandas as pd
+
+from core.market_calendar import NSE, MarketCalendar
+from core.market_panel import MarketPanel
+from strategies.base.signal_type import Signal
+
+
+class EventKind(IntEnum):
+    # same-bar order: fills at the open, then intrabar exits,
+    # then square-off at the close, then new signals at the close
+    FILL = 0
+    EXIT = 1
+    SQUARE_OFF = 2
+
+
+class ExitReason(IntEnum):
+    SIGNAL = 0
+    STOP = 1
+    TARGET = 2
+    SQUARE_OFF = 3
+    END = 4
+
+
+SIGNAL_VALUES = {Signal.BUY: 1, Signal.SELL: -1, Signal.HOLD: 0}
+
+
+def signal_matrix(panel: MarketPanel, frames: dict[str, pd.DataFrame], column: str) -> np.ndarray:
+    """
+    Strategy output frames (timestamp + Signal column) → (time × symbol)
+    int8 array on the panel grid: +1 BUY, -1 SELL, 0 HOLD.
+    """
+    numeric = {
+        s: pd.DataFrame({
+            "timestamp": df["timestamp"],
+            column: df[column].map(SIGNAL_VALUES).fillna(0).astype(np.int8),
+        })
+        for s, df in frames.items()
+    }
+    return panel.align(numeric, column, fill=0).astype(np.int8)
+
+
+@dataclass(frozen=True)
+class BacktestConfig:
+    """
+    quantity=None → size each entry as floor(capital_per_trade / price).
+    stop_loss / take_profit are fractions of the average entry price.
+    max_participation caps each fill at that share of the bar's volume;
+    the rest keeps working on later bars (partial fills).
+    square_off=None → no intraday square-off (positions may be carried).
+    """
+    initial_capital: float = 1_000_000.0
+    capital_per_trade: float = 100_000.0
+    quantity: int | None = None
+    stop_loss: float | None = None
+    take_profit: float | None = None
+    allow_short: bool = True
+    max_participation: float | None = None
+    cost_bps: float = 0.0
+    square_off: time | None = time(15, 20)
+    calendar: MarketCalendar = NSE
+
+
+class _Log:
+    """
+    Growable columnar log in preallocated numpy arrays (doubling).
+    """
+
+    def __init__(self, dtypes: dict, capacity: int = 1024):
+        self._cols = {k: np.empty(capacity, dtype=v) for k, v in dtypes.items()}
+        self._n = 0
+
+    def append(self, *values) -> None:
+        n = self._n
+        if n == len(next(iter(self._cols.values()))):
+            for k, arr in self._cols.items():
+                grown = np.empty(2 * len(arr), dtype=arr.dtype)
+                grown[:n] = arr
+                self._cols[k] = grown
+        for arr, v in zip(self._cols.values(), values):
+            arr[n] = v
+        self._n = n + 1
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        return {k: arr[:self._n] for k, arr in self._cols.items()}
+
+
+@dataclass(frozen=True)
+class BacktestResult:
+    trades: pd.DataFrame
+    fills: pd.DataFrame
+    equity: pd.Series
+    exposure: pd.Series
+    events: int
+    wall_s: float
+
+    def stats(self) -> dict:
+        pnl = self.trades["pnl"].to_numpy()
+        eq = self.equity.to_numpy()
+        peak = np.maximum.accumulate(eq)
+        return {
+            "trades": int(len(pnl)),
+            "win_rate": float((pnl > 0).mean()) if len(pnl) else None,
+            "total_pnl": float(pnl.sum()),
+            "final_equity": float(eq[-1]) if len(eq) else None,
+            "max_drawdown": float(((eq - peak) / peak).min()) if len(eq) else None,
+            "events": self.events,
+            "wall_s": round(self.wall_s, 3),
+        }
+
+
+class EventBacktester:
+    """
+    Event-driven intraday backtest over an aligned MarketPanel.
+
+    Signals are read at the bar close and become market orders filled at
+    the next bar's open. Stops / targets are matched against each bar's
+    OHLC (gaps fill at the open; stop wins a same-bar tie). Open positions
+    are squared off at the session cutoff bar's close; with
+    square_off=None (required for daily panels) orders and positions
+    carry across sessions.
+
+    Throughput: bar data stays in (time × symbol) numpy arrays; only
+    actionable moments become events in a heap. A stop / target is
+    scheduled by a vectorized forward search for its first touch, not by
+    visiting every bar. Fills and trades land in preallocated logs and the
+    equity curve is rebuilt from fills in one vectorized pass.
+    """
+
+    def __init__(self, config: BacktestConfig = BacktestConfig()):
+        self.config = config
+
+    def run(self, panel: MarketPanel, signals: np.ndarray) -> BacktestResult:
+        wall0 = _time.perf_counter()
+        cfg = self.config
+        T, N = panel.shape
+
+        if signals.shape != (T, N):
+            raise ValueError(f"signals shape {signals.shape} != panel shape {(T, N)}")
+
+        self._panel = panel
+        self._open = panel.open
+        self._high = panel.high
+        self._low = panel.low
+        self._close = panel.filled_close()
+        self._volume = panel.volume
+        self._valid = panel.valid
+        self._T = T
+
+        session, _, cut = cfg.calendar.session_layout(panel.timestamps, cfg.square_off)
+        if cfg.square_off is not None and T > 1 and session[-1] == T - 1:
+            # one bar per session: the cutoff bar is the signal bar, nothing could fill
+            raise ValueError("square_off needs intraday bars; use square_off=None for daily panels")
+        self._session = session.tolist()
+        # without square-off positions only close on exits / end of data
+        self._cut = cut.tolist() if cfg.square_off is not None else [T - 1] * T
+
+        # ---- per-symbol state (plain lists: cheap scalar access per event) ----
+        self._pos = [0] * N
+        self._avg = [0.0] * N
+        self._entry_t = [-1] * N
+        self._last_fill_t = [-1] * N
+        self._working = [0] * N
+        self._order_ver = [0] * N
+        self._exit_ver = [0] * N
+        self._order_session = [0] * N
+        self._peak_qty = [0] * N
+        self._entry_value = [0.0] * N
+        self._exit_value = [0.0] * N
+        self._trade_cost = [0.0] * N
+        self._pending_reason = [0] * N
+
+        self._fills = _Log({"t": np.int64, "j": np.int64, "qty": np.int64, "price": np.float64, "cost": np.float64})
+        self._trades = _Log({
+            "j": np.int64, "entry_t": np.int64, "exit_t": np.int64, "side": np.int8,
+            "qty": np.int64, "entry_px": np.float64, "exit_px": np.float64,
+            "pnl": np.float64, "reason": np.int8,
+        })
+
+        self._heap: list[tuple] = []
+        self._seq = itertools.count()
+
+        # ---- event loop: signals stream in time order, derived events via heap ----
+        sig_t, sig_j = np.nonzero(signals)
+        sig_s = signals[sig_t, sig_j]
+        sig_t, sig_j, sig_s = sig_t.tolist(), sig_j.tolist(), sig_s.tolist()
+
+        heap = self._heap
+        i, n_sig, events = 0, len(sig_t), 0
+
+        while i < n_sig or heap:
+            if heap and (i >= n_sig or heap[0][0] <= sig_t[i]):
+                t, kind, _, j, ver = heapq.heappop(heap)
+                events += 1
+                if kind == EventKind.FILL:
+                    self._on_fill(t, j, ver)
+                elif kind == EventKind.EXIT:
+                    self._on_exit(t, j, ver)
+                else:
+                    self._on_square_off(t, j, ver)
+            else:
+                t, j, s = sig_t[i], sig_j[i], sig_s[i]
+                i += 1
+                # fast path: signal agrees with the position and nothing is working
+                pos = self._pos[j]
+                if self._working[j] == 0 and ((s > 0 and pos > 0) or (s < 0 and pos < 0)):
+                    continue
+                events += 1
+                self._on_signal(t, j, s)
+
+        return self._result(events, _time.perf_counter() - wall0)
+
+    # ---------------- SCHEDULING ----------------
+
+    def _push(self, t: int, kind: EventKind, j: int, ver: int) -> None:
+        heapq.heappush(self._heap, (t, int(kind), next(self._seq), j, ver))
+
+    def _schedule_exits(self, t: int, j: int) -> None:
+        """
+        After the position changed at bar t: find the first bar (from t on)
+        where its stop / target trades, plus the square-off bar.
+        """
+        cfg = self.config
+        self._exit_ver[j] += 1
+        ver = self._exit_ver[j]
+
+        pos = self._pos[j]
+        if pos == 0:
+            return
+
+        end = self._cut[t]
+        side = 1 if pos > 0 else -1
+        avg = self._avg[j]
+
+        hit_t = end + 1
+        reason = None
+        if cfg.stop_loss is not None or cfg.take_profit is not None:
+            lo = self._low[t:end + 1, j]
+            hi = self._high[t:end + 1, j]
+
+            if cfg.stop_loss is not None:
+                stop = avg * (1 - side * cfg.stop_loss)
+                touched = lo <= stop if side > 0 else hi >= stop
+                k = int(touched.argmax())
+                if touched[k]:
+                    hit_t, reason = t + k, ExitReason.STOP
+
+            if cfg.take_profit is not None:
+                target = avg * (1 + side * cfg.take_profit)
+                touched = hi >= target if side > 0 else lo <= target
+                k = int(touched.argmax())
+                # strict: on a same-bar tie the stop is assumed first
+                if touched[k] and t + k < hit_t:
+                    hit_t, reason = t + k, ExitReason.TARGET
+
+        if reason is not None:
+            self._pending_reason[j] = reason
+            self._push(hit_t, EventKind.EXIT, j, ver)
+        else:
+            self._push(end, EventKind.SQUARE_OFF, j, ver)
+
+    # ---------------- HANDLERS ----------------
+
+    def _on_signal(self, t: int, j: int, s: int) -> None:
+        cfg = self.config
+        # no orders after the cutoff (they could never fill in-session)
+        if t >= self._cut[t] or t + 1 >= self._T:
+            return
+
+        pos = self._pos[j]
+        if s > 0:
+            target = 0 if pos < 0 else self._entry_qty(t, j)
+        else:
+            if pos > 0:
+                target = 0
+            elif cfg.allow_short:
+                target = -self._entry_qty(t, j)
+            else:
+                return
+
+        if pos != 0 and target != 0:
+            return  # already positioned this way
+
+        self._working[j] = target - pos
+        self._order_ver[j] += 1
+        self._order_session[j] = self._session[t]
+        if self._working[j] != 0:
+            self._push(t + 1, EventKind.FILL, j, self._order_ver[j])
+
+    def _entry_qty(self, t: int, j: int) -> int:
+        if self.config.quantity is not None:
+            return self.config.quantity
+        px = self._close[t, j]
+        return int(self.config.capital_per_trade // px) if px > 0 else 0
+
+    def _on_fill(self, t: int, j: int, ver: int) -> None:
+        if ver != self._order_ver[j] or self._working[j] == 0:
+            return
+
+        # intraday orders never carry past the session cutoff
+        # (without square-off they keep working across sessions)
+        if self.config.square_off is not None and (
+            self._session[t] != self._order_session[j] or t > self._cut[t]
+        ):
+            self._working[j] = 0
+            return
+
+        if not self._valid[t, j]:
+            if t + 1 < self._T:
+                self._push(t + 1, EventKind.FILL, j, ver)
+            return
+
+        want = self._working[j]
+        qty = want
+        mp = self.config.max_participation
+        if mp is not None:
+            cap = int(self._volume[t, j] * mp)
+            qty = want if abs(want) <= cap else (cap if want > 0 else -cap)
+
+        if qty != 0:
+            self._fill(t, j, qty, float(self._open[t, j]), ExitReason.SIGNAL)
+            self._working[j] = want - qty
+            self._schedule_exits(t, j)
+
+        if self._working[j] != 0 and t + 1 < self._T:
+            self._push(t + 1, EventKind.FILL, j, ver)
+
+    def _on_exit(self, t: int, j: int, ver: int) -> None:
+        if ver != self._exit_ver[j] or self._pos[j] == 0:
+            return
+
+        cfg = self.config
+        pos = self._pos[j]
+        side = 1 if pos > 0 else -1
+        avg = self._avg[j]
+        reason = self._pending_reason[j]
+
+        if reason == ExitReason.STOP:
+            level = avg * (1 - side * cfg.stop_loss)
+        else:
+            level = avg * (1 + side * cfg.take_profit)
+
+        # a gap through the level fills at the open (not on the entry bar)
+        px = level
+        o = float(self._open[t, j])
+        if t > self._last_fill_t[j]:
+            if reason == ExitReason.STOP:
+                px = min(o, level) if side > 0 else max(o, level)
+            else:
+                px = max(o, level) if side > 0 else min(o, level)
+
+        self._cancel_working(j)
+        self._fill(t, j, -pos, px, reason)
+        self._exit_ver[j] += 1
+
+    def _on_square_off(self, t: int, j: int, ver: int) -> None:
+        if ver != self._exit_ver[j] or self._pos[j] == 0:
+            return
+
+        reason = ExitReason.SQUARE_OFF if self.config.square_off is not None else ExitReason.END
+        self._cancel_working(j)
+        self._fill(t, j, -self._pos[j], float(self._close[t, j]), reason)
+        self._exit_ver[j] += 1
+
+    def _cancel_working(self, j: int) -> None:
+        self._working[j] = 0
+        self._order_ver[j] += 1
+
+    # ---------------- BOOKKEEPING ----------------
+
+    def _fill(self, t: int, j: int, qty: int, px: float, reason: ExitReason) -> None:
+        cost = abs(qty) * px * self.config.cost_bps / 1e4
+        self._fills.append(t, j, qty, px, cost)
+        self._last_fill_t[j] = t
+
+        pos = self._pos[j]
+        new = pos + qty
+
+        if pos == 0:
+            self._entry_t[j] = t
+            self._avg[j] = px
+            self._entry_value[j] = abs(qty) * px
+            self._exit_value[j] = 0.0
+            self._trade_cost[j] = cost
+            self._peak_qty[j] = abs(qty)
+        elif (pos > 0) == (qty > 0):
+            self._avg[j] = (self._avg[j] * abs(pos) + px * abs(qty)) / abs(new)
+            self._entry_value[j] += abs(qty) * px
+            self._peak_qty[j] = abs(new)
+        else:
+            self._exit_value[j] += abs(qty) * px
+
+        if pos != 0:
+            self._trade_cost[j] += cost
+        self._pos[j] = new
+
+        if new == 0:
+            side = 1 if pos > 0 else -1
+            qty_total = self._peak_qty[j]
+            entry_px = self._entry_value[j] / qty_total
+            exit_px = self._exit_value[j] / qty_total
+            # net of costs on both legs
+            pnl = side * (self._exit_value[j] - self._entry_value[j]) - self._trade_cost[j]
+            self._trades.append(j, self._entry_t[j], t, side, qty_total, entry_px, exit_px, pnl, reason)
+
+    def _result(self, events: int, wall_s: float) -> BacktestResult:
+        panel = self._panel
+        T, N = panel.shape
+        f = self._fills.arrays()
+        tr = self._trades.arrays()
+
+        # ---- equity / exposure from fills, vectorized ----
+        delta = np.zeros((T, N), dtype=np.int64)
+        np.add.at(delta, (f["t"], f["j"]), f["qty"])
+        position = np.cumsum(delta, axis=0)
+
+        cash = np.zeros(T)
+        np.add.at(cash, f["t"], -f["qty"] * f["price"] - f["cost"])
+        cash = self.config.initial_capital + np.cumsum(cash)
+
+        marked = position * np.nan_to_num(self._close)
+        equity = cash + marked.sum(axis=1)
+        exposure = np.abs(marked).sum(axis=1)
+
+        index = panel.timestamps
+        symbols = np.array(panel.symbols, dtype=object)
+
+        trades = pd.DataFrame({
+            "symbol": symbols[tr["j"]],
+            "entry_time": index[tr["entry_t"]],
+            "exit_time": index[tr["exit_t"]],
+            "side": tr["side"],
+            "qty": tr["qty"],
+            "entry_px": tr["entry_px"],
+            "exit_px": tr["exit_px"],
+            "pnl": tr["pnl"],  # net of costs
+            "reason": [ExitReason(r).name for r in tr["reason"]],
+        })
+
+        fills = pd.DataFrame({
+            "timestamp": index[f["t"]],
+            "symbol": symbols[f["j"]],
+            "qty": f["qty"],
+            "price": f["price"],
+            "cost": f["cost"],
+        })
+
+        return BacktestResult(
+            trades=trades,
+            fills=fills,
+            equity=pd.Series(equity, index=index, name="equity"),
+            exposure=pd.Series(exposure, index=index, name="exposure"),
+            events=events,
+            wall_s=wall_s,
+        )
+
+
+if __name__ == "__main__":
+    from core.common_types import Unit
+    from core.synthetic_market import SyntheticMarket
+
+    market = SyntheticMarket(seed=11)
+    days = market.days("2025-01-01", "2025-12-31")
+    symbols = [f"SYN{i:03d}" for i in range(100)]
+
+    t0 = _time.perf_counter()
+    panel = market.panel(symbols, days, unit=Unit.minutes, interval=1)
+    print(f"panel {panel.shape} in {_time.perf_counter() - t0:.2f}s")
+
+    # vectorized MA-crossover signals straight on the panel arrays
+    t0 = _time.perf_counter()
+    close = pd.DataFrame(panel.close)
+    fast, slow = close.rolling(20).mean().to_numpy(), close.rolling(60).mean().to_numpy()
+    above = fast > slow
+    signals = np.zeros(panel.shape, dtype=np.int8)
+    signals[1:][above[1:] & ~above[:-1]] = 1
+    signals[1:][~above[1:] & above[:-1]] = -1
+    print(f"signals in {_time.perf_counter() - t0:.2f}s, {np.count_nonzero(signals):,} non-HOLD")
+
+    bt = EventBacktester(BacktestConfig(stop_loss=0.01, take_profit=0.02, max_participation=0.1, cost_bps=2))
+    result = bt.run(panel, signals)
+    print(result.stats())
+    print(result.trades["reason"].value_counts().to_dict())
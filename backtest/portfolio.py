@@ -0,0 +1,249 @@
+# backtest/portfolio.py
+import time as _time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from backtest.event_backtester import signal_matrix
+from core.market_calendar import NSE, MarketCalendar
+from core.market_panel import MarketPanel
+from core.time_index import epoch_ns
+
+
+@dataclass(frozen=True)
+class PortfolioConfig:
+    """
+    Equal-slot allocation: each position gets
+    min(max_weight, gross_limit / max_positions) of equity at entry.
+    Held positions are not resized (no turnover from drift).
+    periods_per_year annualizes the Sharpe ratio; None → derived from
+    the panel's bar spacing (bars per session × 252 sessions).
+    """
+    initial_capital: float = 10_000_000.0
+    max_positions: int = 20
+    max_weight: float = 0.10
+    gross_limit: float = 1.0
+    allow_short: bool = False
+    cost_bps: float = 0.0
+    periods_per_year: float | None = None
+    calendar: MarketCalendar = NSE
+
+
+def bars_per_year(timestamps, calendar: MarketCalendar = NSE) -> float:
+    """
+    Annualization factor from the typical bar spacing: 252 for daily
+    bars, 252 × bars per session for intraday ones.
+    """
+    gaps = np.diff(epoch_ns(timestamps))
+    gaps = gaps[gaps > 0]
+    if len(gaps) == 0:
+        return 252.0
+    minutes = int(np.median(gaps)) // 60_000_000_000
+    if minutes >= calendar.session_minutes:
+        return 252.0
+    return 252.0 * calendar.bars_per_session(max(minutes, 1))
+
+
+def signal_state(signals: np.ndarray, allow_short: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (time × symbol) BUY/SELL/HOLD events → desired direction per bar
+    (+1 / 0 / -1, carried forward from the last event) and bars since
+    that event (large where no event yet). Vectorized over both axes.
+    """
+    T = signals.shape[0]
+    direction = signals if allow_short else np.maximum(signals, 0)
+
+    last = np.where(signals != 0, np.arange(T)[:, None], -1)
+    np.maximum.accumulate(last, axis=0, out=last)
+
+    seen = last >= 0
+    state = np.where(seen, np.take_along_axis(direction, np.maximum(last, 0), axis=0), 0)
+    age = np.where(seen, np.arange(T)[:, None] - last, np.iinfo(np.int64).max)
+    return state.astype(np.int8), age
+
+
+@dataclass(frozen=True)
+class PortfolioResult:
+    shares: np.ndarray          # (time × symbol) held after each bar's open
+    equity: pd.Series
+    exposure: pd.DataFrame      # gross / net (fraction of equity), positions
+    symbol_pnl: pd.Series       # per-symbol contribution, before costs
+    costs: float
+    turnover: float
+    periods_per_year: float
+    wall_s: float
+
+    def stats(self) -> dict:
+        eq = self.equity.to_numpy()
+        rets = np.diff(eq) / eq[:-1]
+        peak = np.maximum.accumulate(eq)
+        return {
+            "final_equity": float(eq[-1]),
+            "total_return": float(eq[-1] / eq[0] - 1),
+            "sharpe": float(rets.mean() / rets.std() * np.sqrt(self.periods_per_year)) if rets.std() > 0 else None,
+            "max_drawdown": float(((eq - peak) / peak).min()),
+            "avg_gross": float(self.exposure["gross"].mean()),
+            "max_positions": int(self.exposure["positions"].max()),
+            "turnover": round(self.turnover, 3),
+            "costs": round(self.costs, 2),
+            "wall_s": round(self.wall_s, 3),
+        }
+
+
+class PortfolioEngine:
+    """
+    Portfolio simulation over a shared timeline for the whole universe.
+
+    Signals known at the close of bar t-1 are traded at the open of bar t.
+    Each step is vectorized across all symbols (the only Python loop is
+    over time); equity, exposure and per-symbol PnL are then computed from
+    the aligned (time × symbol) share and price arrays in one pass.
+
+    When more symbols want in than there are free slots, the freshest
+    signals win (ties → universe order). Pass `score` (time × symbol,
+    lower = preferred) to rank differently.
+    """
+
+    def __init__(self, config: PortfolioConfig = PortfolioConfig()):
+        self.config = config
+
+    def run(self, panel: MarketPanel, signals: np.ndarray, score: np.ndarray | None = None) -> PortfolioResult:
+        wall0 = _time.perf_counter()
+        cfg = self.config
+        T, N = panel.shape
+
+        state, age = signal_state(signals, cfg.allow_short)
+        rank = age if score is None else score
+
+        # NaN only before a symbol's first bar, where nothing is held
+        close = np.nan_to_num(panel.filled_close())
+        # untradable bars: mark at the carried close, never trade
+        tradable = panel.valid & np.isfinite(panel.open)
+        open_ = np.where(tradable, panel.open, close)
+
+        slot = min(cfg.max_weight, cfg.gross_limit / cfg.max_positions)
+        cost_rate = cfg.cost_bps / 1e4
+
+        shares = np.zeros((T, N), dtype=np.int64)
+        cash = np.empty(T)
+        cash_now = cfg.initial_capital
+        cash[0] = cash_now
+        costs = 0.0
+        traded = 0.0
+
+        for t in range(1, T):
+            prev = shares[t - 1]
+            want = state[t - 1]
+            ok = tradable[t]
+            px = open_[t]
+
+            held = prev != 0
+            keep = held & ((want == np.sign(prev)) | ~ok)
+            cand = (want != 0) & ~held & ok
+
+            row = np.where(keep, prev, 0)
+
+            free = cfg.max_positions - int(keep.sum())
+            if free > 0 and cand.any():
+                pick = np.flatnonzero(cand)
+                if len(pick) > free:
+                    order = np.argsort(rank[t - 1, pick], kind="stable")
+                    pick = pick[order[:free]]
+
+                equity = cash_now + float(prev @ px)
+                alloc = slot * equity
+                if not cfg.allow_short:
+                    # long-only: never spend more cash than is there
+                    freed = float(prev[~keep] @ px[~keep])
+                    budget = max(cash_now + freed, 0.0)
+                    alloc = min(alloc, budget / len(pick))
+
+                row[pick] = want[pick] * np.floor(alloc / px[pick]).astype(np.int64)
+
+            shares[t] = row
+            trade = row - prev
+            if trade.any():
+                notional = float(np.abs(trade) @ px)
+                fee = notional * cost_rate
+                cash_now -= float(trade @ px) + fee
+                costs += fee
+                traded += notional
+            cash[t] = cash_now
+
+        # ---- vectorized accounting over (time × symbol) ----
+        marked = shares * close
+        equity = cash + marked.sum(axis=1)
+        gross = np.abs(marked).sum(axis=1)
+        net = marked.sum(axis=1)
+
+        # value change minus the cash paid for trades (trades at the open)
+        trades = np.diff(shares, axis=0, prepend=0)
+        pnl = np.diff(marked, axis=0, prepend=0) - trades * open_
+        symbol_pnl = pnl.sum(axis=0)
+
+        index = panel.timestamps
+        return PortfolioResult(
+            shares=shares,
+            equity=pd.Series(equity, index=index, name="equity"),
+            exposure=pd.DataFrame({
+                "gross": gross / equity,
+                "net": net / equity,
+                "positions": (shares != 0).sum(axis=1),
+            }, index=index),
+            symbol_pnl=pd.Series(symbol_pnl, index=list(panel.symbols), name="pnl"),
+            costs=costs,
+            turnover=traded / cfg.initial_capital,
+            periods_per_year=cfg.periods_per_year or bars_per_year(index, cfg.calendar),
+            wall_s=_time.perf_counter() - wall0,
+        )
+
+
+def collect_universe(controller, tickers, *, request, strategies, column: str | None = None, max_workers: int = 8):
+    """
+    Run the pipeline for every ticker (e.g. TickerManager.all()) and
+    stack the results → (MarketPanel, signal matrix, errors).
+    `column` picks the signal column; default: the first strategy's.
+    """
+    frames, errors = {}, {}
+    for ticker, df, error in controller.run_many(
+        tickers,
+        request=request,
+        indicators=(),
+        strategies=strategies,
+        max_workers=max_workers,
+    ):
+        if error is not None:
+            errors[ticker] = error
+        elif df is not None and not df.empty:
+            frames[str(ticker)] = df
+
+    if not frames:
+        raise RuntimeError(f"No data for any ticker ({len(errors)} errors)")
+
+    column = column or strategies[0].signal_name
+    panel = MarketPanel.from_frames(frames)
+    return panel, signal_matrix(panel, frames, column), errors
+
+
+if __name__ == "__main__":
+    from core.common_types import Unit
+    from core.synthetic_market import SyntheticMarket
+
+    market = SyntheticMarket(seed=21)
+    days = market.days(sessions=1250, end="2025-12-31")
+    symbols = [f"SYN{i:03d}" for i in range(800)]
+
+    t0 = _time.perf_counter()
+    panel = market.panel(symbols, days, unit=Unit.days)
+    print(f"panel {panel.shape} in {_time.perf_counter() - t0:.2f}s")
+
+    close = pd.DataFrame(panel.close)
+    above = (close.rolling(20).mean() > close.rolling(100).mean()).to_numpy()
+    signals = np.zeros(panel.shape, dtype=np.int8)
+    signals[1:][above[1:] & ~above[:-1]] = 1
+    signals[1:][~above[1:] & above[:-1]] = -1
+
+    result = PortfolioEngine(PortfolioConfig(max_positions=40, cost_bps=5)).run(panel, signals)
+    print(result.stats())
+    print(result.symbol_pnl.sort_values().tail(3))
@@ -0,0 +1,442 @@
+# backtest/walk_forward.py
+import itertools
+import os
+import time as _time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+from backtest.event_backtester import SIGNAL_VALUES
+from backtest.portfolio import signal_state
+from core.market_calendar import NSE, bar_minutes
+from core.time_index import ensure_sorted, epoch_ns, to_epoch
+from data.fetch_request import QKFetchRequest
+from strategies.base.strategy_base import StrategyBase
+from strategies.strategy_plan import StrategyPlan
+
+
+def grid(strategy_cls: type[StrategyBase], where=None, **params) -> list[StrategyBase]:
+    """
+    Cartesian product of parameter values → strategy instances.
+
+        grid(MACrossoverStrategy, fast=[5, 9], slow=[21, 50],
+             where=lambda p: p["fast"] < p["slow"])
+    """
+    names = list(params)
+    out = []
+    for values in itertools.product(*params.values()):
+        kwargs = dict(zip(names, values))
+        if where is None or where(kwargs):
+            out.append(strategy_cls(**kwargs))
+    return out
+
+
+# ---------------- FOLDS ----------------
+
+@dataclass(frozen=True)
+class Fold:
+    """
+    Half-open windows: train = [train_start, train_end),
+    test = [train_end, test_end).
+    """
+    index: int
+    train_start: pd.Timestamp
+    train_end: pd.Timestamp
+    test_end: pd.Timestamp
+
+    def bounds(self) -> np.ndarray:
+        # epoch ns (UTC) → searchsorted against epoch_ns() arrays
+        return np.array(
+            [to_epoch(self.train_start), to_epoch(self.train_end), to_epoch(self.test_end)],
+            dtype=np.int64,
+        )
+
+
+def make_folds(start, end, *, train, test, step=None, anchored: bool = False) -> list[Fold]:
+    """
+    Walk-forward folds over [start, end].
+
+    train / test / step: anything pandas reads as an offset ("365D",
+    "6MS", pd.DateOffset(months=3), ...); step defaults to `test`, so
+    test windows tile the range without overlap.
+    anchored=False → rolling train window of fixed length;
+    anchored=True  → expanding window, always starting at `start`.
+    """
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    train, test = to_offset(train), to_offset(test)
+    step = to_offset(step) if step is not None else test
+    stop = end + pd.Timedelta(1, "ns")  # `end` is inclusive
+
+    folds = []
+    cursor = start
+    while True:
+        train_end = cursor + train
+        if train_end >= stop:
+            break
+        folds.append(Fold(
+            index=len(folds),
+            train_start=start if anchored else cursor,
+            train_end=train_end,
+            test_end=min(train_end + test, stop),
+        ))
+        cursor = cursor + step
+
+    return folds
+
+
+# ---------------- SCORING ----------------
+
+def metrics(returns: np.ndarray, periods_per_year: float) -> dict:
+    """
+    Per-bar returns of one strategy (or an equal-weight basket) → summary.
+    """
+    if len(returns) == 0:
+        return {"total_return": 0.0, "sharpe": None, "max_drawdown": 0.0, "bars": 0}
+
+    equity = np.cumprod(1.0 + returns)
+    peak = np.maximum.accumulate(np.maximum(equity, 1.0))
+    std = returns.std()
+    return {
+        "total_return": float(equity[-1] - 1.0),
+        "sharpe": float(returns.mean() / std * np.sqrt(periods_per_year)) if std > 0 else None,
+        "max_drawdown": float((equity / peak - 1.0).min()),
+        "bars": int(len(returns)),
+    }
+
+
+def _returns(close: np.ndarray, signals: np.ndarray, cost_rate: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Long/flat/short position from the last signal, entered on the next
+    bar (no lookahead) → per-bar strategy returns (net of costs) and
+    positions. Both (n,), aligned to the window's bars; bar 0 earns nothing.
+    """
+    state, _ = signal_state(signals[:, None], allow_short=True)
+    position = np.r_[0, state[:-1, 0]].astype(np.float64)
+
+    change = np.abs(np.diff(position, prepend=0.0))
+    ret = np.zeros(len(close))
+    ret[1:] = position[1:] * (close[1:] / close[:-1] - 1.0)
+    return ret - change * cost_rate, position
+
+
+def _basket(parts: list[tuple[np.ndarray, np.ndarray]]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Equal-weight average of per-ticker (stamps, returns) on the union of
+    their timestamps; a bar averages over the tickers that traded in it.
+    """
+    if not parts:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+
+    stamps = np.unique(np.concatenate([s for s, _ in parts]))
+    total = np.zeros(len(stamps))
+    count = np.zeros(len(stamps))
+    for s, r in parts:
+        rows = np.searchsorted(stamps, s)
+        total[rows] += r
+        count[rows] += 1
+    return stamps, total / np.maximum(count, 1)
+
+
+# ---------------- WORKER ----------------
+
+# per process: the full-range columns, fetched once by the parent
+_DATA: dict = {}
+
+
+def _init_worker(data: dict) -> None:
+    _DATA.clear()
+    _DATA.update(data)
+
+
+def _window(columns: dict, lo: int, hi: int) -> pd.DataFrame:
+    # slices of the full-range arrays: views, nothing is copied
+    return pd.DataFrame({c: arr[lo:hi] for c, arr in columns.items()}, copy=False)
+
+
+def _run_fold(fold: Fold, candidates: list[StrategyBase], objective: str, cost_rate: float, periods_per_year: float):
+    """
+    Every candidate over [train_start, test_end) of every ticker.
+
+    Signals are computed once per window: the train part doubles as the
+    indicators' warm-up for the test part, and since indicators only look
+    back, test signals never see beyond their own bar. One plan serves
+    all candidates, so indicators they share (e.g. MA(21)) run once.
+    """
+    plan = StrategyPlan.compile(strategies=candidates)
+    names = [s.signal_name for s in candidates]
+
+    train_parts = {name: [] for name in names}
+    test_parts = {name: [] for name in names}
+    trades = dict.fromkeys(test_parts, 0.0)
+    exposure = dict.fromkeys(test_parts, 0.0)
+
+    bounds = fold.bounds()
+    for stamps, columns in _DATA.values():
+        lo, mid, hi = np.searchsorted(stamps, bounds)
+        if mid == lo or hi == mid:
+            continue  # ticker not listed for the whole fold
+
+        out = plan.run(_window(columns, lo, hi))
+        close = columns["close"][lo:hi]
+        split = mid - lo
+
+        for name in names:
+            signals = out[name].map(SIGNAL_VALUES).fillna(0).to_numpy(dtype=np.int8)
+            ret, position = _returns(close, signals, cost_rate)
+
+            train_parts[name].append((stamps[lo:mid], ret[:split]))
+            test_parts[name].append((stamps[mid:hi], ret[split:]))
+            trades[name] += np.count_nonzero(np.diff(position[split - 1:]))
+            exposure[name] += np.mean(position[split:] != 0)
+
+    tickers = max(len(next(iter(test_parts.values()))), 1)
+    train = {name: metrics(_basket(parts)[1], periods_per_year) for name, parts in train_parts.items()}
+    test = {
+        name: (*_basket(parts), trades[name] / tickers, exposure[name] / tickers)
+        for name, parts in test_parts.items()
+    }
+
+    scored = [(name, m[objective]) for name, m in train.items() if m[objective] is not None]
+    chosen = max(scored, key=lambda x: x[1])[0] if scored else None
+    return fold, chosen, train, test
+
+
+# ---------------- RESULT ----------------
+
+@dataclass(frozen=True)
+class WalkForwardResult:
+    folds: pd.DataFrame             # one row per fold: windows, pick, its train / test metrics
+    scores: pd.DataFrame            # (fold, candidate) → train and test metrics
+    oos_returns: pd.Series          # stitched test returns of each fold's pick
+    candidate_returns: pd.DataFrame  # stitched test returns per candidate (no re-selection)
+    periods_per_year: float
+    wall_s: float
+
+    def summary(self) -> dict:
+        """
+        Out-of-sample performance of the walk-forward process itself.
+        """
+        oos = metrics(self.oos_returns.to_numpy(), self.periods_per_year)
+        picked = self.folds.dropna(subset=["chosen"])
+
+        # test / train sharpe of the picks: ~1 robust, << 1 overfit
+        # (no fold picked anything → no train_* / test_* columns)
+        efficiency = None
+        if len(picked):
+            train = picked["train_sharpe"].astype(float).mean()
+            test = picked["test_sharpe"].astype(float).mean()
+            if train and not np.isnan(train):
+                efficiency = float(test / train)
+
+        return {
+            **{f"oos_{k}": v for k, v in oos.items()},
+            "folds": int(len(self.folds)),
+            "efficiency": efficiency,
+            "picks": picked["chosen"].value_counts().to_dict(),
+            "wall_s": round(self.wall_s, 3),
+        }
+
+    def by_candidate(self) -> pd.DataFrame:
+        """
+        Aggregated out-of-sample metrics per parameter set, each held
+        fixed across all test windows.
+        """
+        rows = {
+            name: metrics(col.dropna().to_numpy(), self.periods_per_year)
+            for name, col in self.candidate_returns.items()
+        }
+        out = pd.DataFrame.from_dict(rows, orient="index", columns=list(metrics(np.empty(0), 1.0)))
+        if out.empty:
+            return out.assign(fold_win_rate=pd.Series(dtype=float), picked=pd.Series(dtype=int))
+
+        test = self.scores[self.scores["phase"] == "test"].groupby("candidate")
+        out["fold_win_rate"] = test["total_return"].apply(lambda r: float((r > 0).mean()))
+        out["picked"] = self.folds["chosen"].value_counts().reindex(out.index, fill_value=0)
+        return out.sort_values("sharpe", ascending=False)
+
+
+# ---------------- RUNNER ----------------
+
+class WalkForwardRunner:
+    """
+    Walk-forward / rolling-window evaluation of strategy parameters.
+
+    - every ticker is fetched once for the full range
+    - folds are index ranges into the full-range arrays (searchsorted on
+      epoch ns); a fold's frame wraps slices of them, never copies
+    - folds run in parallel processes; the fetched columns are shipped
+      to each worker once (initializer), not per fold
+    - in each fold the candidate with the best train `objective` is
+      picked and scored on the following test window
+
+    max_workers=1 runs in-process (no pool).
+    """
+
+    def __init__(
+        self,
+        data_manager,
+        request: QKFetchRequest,
+        candidates: list[StrategyBase],
+        *,
+        train,
+        test,
+        step=None,
+        anchored: bool = False,
+        objective: str = "sharpe",
+        cost_bps: float = 0.0,
+        periods_per_year: float | None = None,
+        max_workers: int | None = None,
+        fetch_workers: int = 8,
+    ):
+        if not candidates:
+            raise ValueError("No candidate strategies")
+
+        names = [s.signal_name for s in candidates]
+        if len(set(names)) != len(names):
+            raise ValueError("Duplicate candidate parameter sets")
+
+        self.data_manager = data_manager
+        self.request = request
+        self.candidates = list(candidates)
+        self.train, self.test, self.step = train, test, step
+        self.anchored = anchored
+        self.objective = objective
+        self.cost_rate = cost_bps / 1e4
+        self.periods_per_year = periods_per_year or self._periods_per_year(request)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.fetch_workers = fetch_workers
+
+    @staticmethod
+    def _periods_per_year(request: QKFetchRequest) -> float:
+        interval = request.intraday_interval if request.intraday else request.interval
+        return 252 * NSE.bars_per_session(bar_minutes(request.unit, interval))
+
+    # ---------------- FETCH ----------------
+
+    def fetch(self, tickers) -> dict:
+        """
+        ticker → (int64 epoch ns, {column: array}), one fetch per ticker.
+        """
+        def job(ticker):
+            return ticker, self.data_manager.fetch(ticker, self.request)
+
+        data = {}
+        with ThreadPoolExecutor(max_workers=self.fetch_workers, thread_name_prefix="qk-wf-fetch") as pool:
+            for ticker, df in pool.map(job, tickers):
+                if df is None or df.empty:
+                    continue
+                df = ensure_sorted(df)
+                stamps = epoch_ns(df)
+                columns = {c: df[c].array if c == "timestamp" else df[c].to_numpy() for c in df.columns}
+                data[str(ticker)] = (stamps, columns)
+        return data
+
+    # ---------------- RUN ----------------
+
+    def run(self, tickers) -> WalkForwardResult:
+        wall0 = _time.perf_counter()
+
+        data = self.fetch(tickers)
+        if not data:
+            raise RuntimeError("No data for any ticker")
+
+        first = min(columns["timestamp"][0] for _, columns in data.values())
+        last = max(columns["timestamp"][-1] for _, columns in data.values())
+        folds = make_folds(first, last, train=self.train, test=self.test, step=self.step, anchored=self.anchored)
+        if not folds:
+            raise ValueError(f"Range {first} → {last} is shorter than one train + test window")
+
+        args = (self.candidates, self.objective, self.cost_rate, self.periods_per_year)
+        if self.max_workers == 1 or len(folds) == 1:
+            _init_worker(data)
+            try:
+                results = [_run_fold(fold, *args) for fold in folds]
+            finally:
+                _DATA.clear()
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(folds)),
+                initializer=_init_worker,
+                initargs=(data,),
+            ) as pool:
+                results = list(pool.map(_run_fold, folds, *(itertools.repeat(a) for a in args)))
+
+        return self._result(results, data, wall0)
+
+    def _result(self, results, data, wall0) -> WalkForwardResult:
+        tz = next(iter(data.values()))[1]["timestamp"].tz
+
+        def series(stamps, returns):
+            return pd.Series(returns, index=pd.DatetimeIndex(stamps, tz="UTC").tz_convert(tz))
+
+        fold_rows, score_rows = [], []
+        oos, per_candidate = [], {s.signal_name: [] for s in self.candidates}
+
+        for fold, chosen, train, test in results:
+            test_metrics = {}
+            for name, (stamps, returns, trades, exposure) in test.items():
+                m = metrics(returns, self.periods_per_year)
+                test_metrics[name] = m
+                per_candidate[name].append(series(stamps, returns))
+                score_rows.append({"fold": fold.index, "candidate": name, "phase": "train", **train[name]})
+                score_rows.append({
+                    "fold": fold.index, "candidate": name, "phase": "test",
+                    **m, "trades": trades, "exposure": exposure,
+                })
+
+            row = {
+                "fold": fold.index,
+                "train_start": fold.train_start,
+                "train_end": fold.train_end,
+                "test_end": fold.test_end,
+                "chosen": chosen,
+            }
+            if chosen is not None:
+                oos.append(series(*test[chosen][:2]))
+                row.update({f"train_{k}": v for k, v in train[chosen].items()})
+                row.update({f"test_{k}": v for k, v in test_metrics[chosen].items()})
+            fold_rows.append(row)
+
+        oos_returns = pd.concat(oos) if oos else pd.Series(dtype=float)
+        return WalkForwardResult(
+            folds=pd.DataFrame(fold_rows).set_index("fold"),
+            scores=pd.DataFrame(score_rows),
+            oos_returns=oos_returns[~oos_returns.index.duplicated(keep="last")].rename("oos_return"),
+            candidate_returns=pd.DataFrame({
+                name: pd.concat(parts).pipe(lambda s: s[~s.index.duplicated(keep="last")])
+                for name, parts in per_candidate.items() if parts
+            }),
+            periods_per_year=self.periods_per_year,
+            wall_s=_time.perf_counter() - wall0,
+        )
+
+
+if __name__ == "__main__":
+    from core.common_types import QKApi
+    from data.QK_data_manager import QKHistoricalData
+    from data.historical_data.fetcher_registry import FetcherRegistry
+    from data.historical_data.fetcher_synthetic import SyntheticFetcher
+    from strategies.strategy_ma_crossover import MACrossoverStrategy
+    from strategies.strategy_mcginley_breakout import McGinleyBreakoutStrategy
+
+    registry = FetcherRegistry({QKApi.yfinance: lambda: SyntheticFetcher(seed=11)})
+    data_mgr = QKHistoricalData(registry=registry)
+    request = QKFetchRequest(from_date="2019-01-01", to_date="2025-12-31")
+
+    candidates = (
+        grid(MACrossoverStrategy, fast=[5, 9, 20], slow=[21, 50, 100], where=lambda p: p["fast"] < p["slow"])
+        + grid(McGinleyBreakoutStrategy, period=[10, 14, 22], k=[0.6])
+    )
+
+    runner = WalkForwardRunner(
+        data_mgr, request, candidates,
+        train="730D", test="180D", cost_bps=5, max_workers=4,
+    )
+    result = runner.run([f"SYN{i:03d}" for i in range(20)])
+
+    print(result.folds[["train_start", "test_end", "chosen", "train_sharpe", "test_sharpe"]])
+    print(result.summary())
+    print(result.by_candidate())
@@ -0,0 +1,73 @@
+# benchmarks/bench_backtest.py
+import numpy as np
+import pandas as pd
+
+from backtest.event_backtester import BacktestConfig, EventBacktester
+from backtest.portfolio import PortfolioConfig, PortfolioEngine
+from benchmarks.bench_base import BenchCase
+from benchmarks.bench_indicators import SEED
+from core.common_types import Unit
+from core.synthetic_market import SyntheticMarket
+
+
+def _crossings(panel, fast: int, slow: int) -> np.ndarray:
+    close = pd.DataFrame(panel.close)
+    above = (close.rolling(fast).mean() > close.rolling(slow).mean()).to_numpy()
+    signals = np.zeros(panel.shape, dtype=np.int8)
+    signals[1:][above[1:] & ~above[:-1]] = 1
+    signals[1:][~above[1:] & above[:-1]] = -1
+    return signals
+
+
+def _setup(tickers: int):
+    market = SyntheticMarket(seed=SEED)
+    days = market.days("2025-01-01", "2025-12-31")
+    panel = market.panel([f"SYN{i:04d}" for i in range(tickers)], days, unit=Unit.minutes, interval=1)
+    signals = _crossings(panel, 20, 60)
+
+    bt = EventBacktester(BacktestConfig(
+        stop_loss=0.01, take_profit=0.02, max_participation=0.1, cost_bps=2,
+    ))
+    return bt, panel, signals
+
+
+def _run(args):
+    bt, panel, signals = args
+    return bt.run(panel, signals)
+
+
+def _setup_portfolio(tickers: int):
+    market = SyntheticMarket(seed=SEED)
+    days = market.days(sessions=1250, end="2025-12-31")
+    panel = market.panel([f"SYN{i:04d}" for i in range(tickers)], days, unit=Unit.days)
+    engine = PortfolioEngine(PortfolioConfig(max_positions=40, cost_bps=5))
+    return engine, panel, _crossings(panel, 20, 100)
+
+
+def cases(ticker_counts: list[int]) -> list[BenchCase]:
+    portfolio = [
+        BenchCase(
+            name=f"backtest.portfolio[{tickers}x5y-1d]",
+            group="backtest",
+            params={"tickers": tickers, "sessions": 1250},
+            setup=lambda t=tickers: _setup_portfolio(t),
+            run=_run,
+            items=tickers * 1250,
+            repeat=3,
+        )
+        for tickers in ticker_counts
+    ]
+    return portfolio + [
+        BenchCase(
+            name=f"backtest.event[{tickers}x1y-1m]",
+            group="backtest",
+            params={"tickers": tickers, "unit": "minutes", "interval": 1},
+            setup=lambda t=tickers: _setup(t),
+            run=_run,
+            items=tickers,
+            unit="tickers",
+            repeat=1,
+        )
+        for tickers in ticker_counts
+        if tickers <= 100  # 800 × 1y of minutes needs several GB of working arrays
+    ]
@@ -0,0 +1,69 @@
+# benchmarks/bench_base.py
+import gc
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """
+    One measurable unit.
+
+    `setup` builds the inputs (not timed) and returns them;
+    `run(inputs)` is the timed body. `items` is what one call processes
+    (rows, tickers, ...) and feeds the throughput column.
+    """
+    name: str
+    setup: Callable[[], object]
+    run: Callable[[object], object]
+    params: dict = field(default_factory=dict)
+    items: int = 0
+    unit: str = "rows"
+    repeat: int = 5
+    group: str = ""
+    skip: str | None = None  # reason; recorded instead of timed
+
+
+def measure(case: BenchCase, repeat: int | None = None, warmup: int = 1) -> dict:
+    if case.skip is not None:
+        return {
+            "name": case.name,
+            "group": case.group,
+            "params": case.params,
+            "skipped": case.skip,
+        }
+
+    repeat = repeat or case.repeat
+    inputs = case.setup()
+
+    for _ in range(warmup):
+        case.run(inputs)
+
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            case.run(inputs)
+            timings.append(time.perf_counter() - t0)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    best = min(timings)
+    return {
+        "name": case.name,
+        "group": case.group,
+        "params": case.params,
+        "repeat": repeat,
+        "min_s": best,
+        "median_s": statistics.median(timings),
+        "mean_s": statistics.fmean(timings),
+        "stdev_s": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "items": case.items,
+        "unit": case.unit,
+        "items_per_s": case.items / best if case.items and best > 0 else None,
+    }
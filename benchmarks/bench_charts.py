@@ -0,0 +1,68 @@
+# benchmarks/bench_charts.py
+import tempfile
+
+from benchmarks.bench_base import BenchCase
+from benchmarks.bench_indicators import SEED
+from core.test_data_generator import make_test_df
+from gui.render.offscreen_renderer import OffscreenChartRenderer, render_chart
+from strategies.strategy_plan import StrategyPlan
+from strategies.strategy_ma_crossover import MACrossoverStrategy
+
+
+CHART_ROWS = 1_000
+
+
+def _frame(seed: int):
+    plan = StrategyPlan.compile(strategies=[MACrossoverStrategy(9, 21)])
+    return plan.run(make_test_df(CHART_ROWS, seed=seed))
+
+
+def _setup_single():
+    # held in the inputs: removed once the case drops them
+    tmp = tempfile.TemporaryDirectory(prefix="qk_bench_chart_")
+    return _frame(SEED), f"{tmp.name}/chart.png", tmp
+
+
+def _run_single(args):
+    df, path, _ = args
+    render_chart(df, path, title="BENCH")
+
+
+def _setup_many(tickers: int):
+    tmp = tempfile.TemporaryDirectory(prefix="qk_bench_charts_")
+    renderer = OffscreenChartRenderer(tmp.name)
+    frames = {f"SYN{i:04d}": _frame(SEED + i) for i in range(tickers)}
+    return renderer, frames, tmp
+
+
+def _run_many(args):
+    renderer, frames, _ = args
+    written = renderer.render_many(frames)
+    if len(written) != len(frames):
+        raise RuntimeError("chart render failures")
+
+
+def cases(ticker_counts: list[int]) -> list[BenchCase]:
+    out = [
+        BenchCase(
+            name=f"chart.render_png[{CHART_ROWS}]",
+            group="charts",
+            params={"rows": CHART_ROWS},
+            setup=_setup_single,
+            run=_run_single,
+            items=CHART_ROWS,
+            repeat=3,
+        )
+    ]
+    for tickers in ticker_counts:
+        out.append(BenchCase(
+            name=f"chart.render_many[{tickers}x{CHART_ROWS}]",
+            group="charts",
+            params={"tickers": tickers, "rows": CHART_ROWS},
+            setup=lambda t=tickers: _setup_many(t),
+            run=_run_many,
+            items=tickers,
+            unit="charts",
+            repeat=1,
+        ))
+    return out
@@ -0,0 +1,215 @@
+# benchmarks/bench_data_path.py
+import tempfile
+
+import pandas as pd
+
+from benchmarks.bench_base import BenchCase
+from benchmarks.bench_indicators import SEED
+from core.common_types import QKCandle, Unit
+from core.synthetic_market import SyntheticMarket
+from core.test_data_generator import make_test_df
+from data.columnar_store import ColumnarStore
+from data.historical_data.fetcher_yfinance import YahooFetcher
+from data.resampler import resample
+from data.historical_data.base.data_fetcher_base import DataFetcherBase
+
+
+def _candles(rows: int) -> list[QKCandle]:
+    df = make_test_df(rows, seed=SEED)
+    return [
+        QKCandle(
+            timestamp=r.timestamp,
+            open=r.open,
+            high=r.high,
+            low=r.low,
+            close=r.close,
+            adjclose=r.adjclose,
+            volume=r.volume,
+        )
+        for r in df.itertuples(index=False)
+    ]
+
+
+PANEL_RANGE = ("2025-01-01", "2025-12-31")
+
+
+def _panel_setup(tickers: int):
+    market = SyntheticMarket(seed=SEED)
+    days = market.days(*PANEL_RANGE)
+    symbols = [f"SYN{i:04d}" for i in range(tickers)]
+    return market, symbols, days
+
+
+def _panel_run(args):
+    market, symbols, days = args
+    return market.panel(symbols, days, unit=Unit.minutes, interval=5)
+
+
+STORE_WINDOW = ("2025-06-01", "2025-07-01")
+STORE_MAX_TICKERS = 100
+
+
+def _store_setup(tickers: int):
+    market, symbols, days = _panel_setup(tickers)
+    panel = market.panel(symbols, days, unit=Unit.minutes, interval=5)
+
+    # kept alive with the store; removed when the case is garbage-collected
+    tmp = tempfile.TemporaryDirectory(prefix="qk-store-")
+    store = ColumnarStore(tmp.name)
+    for symbol in symbols:
+        store.write(symbol, panel.frame(symbol), unit=Unit.minutes, interval=5)
+    store.close()
+    return store, symbols, tmp
+
+
+def _store_run(args):
+    # cold open + one-month slice per symbol, the way a scan reads
+    store, symbols, _ = args
+    store.close()
+    for symbol in symbols:
+        store.open(symbol, Unit.minutes, 5).frame(*STORE_WINDOW)["close"].to_numpy().mean()
+
+
+RESAMPLE_TARGETS = ((Unit.minutes, 5), (Unit.minutes, 15), (Unit.hours, 1), (Unit.days, 1))
+
+
+def _resample_setup():
+    market = SyntheticMarket(seed=SEED)
+    return market.frame("SYN0000", market.days(*PANEL_RANGE), unit=Unit.minutes, interval=1)
+
+
+def _resample_run(df):
+    for target in RESAMPLE_TARGETS:
+        resample(df, target)
+
+
+YAHOO_SYMBOLS = 100
+YAHOO_RANGE = ("2016-01-01", "2025-12-31")
+
+
+def _yahoo_setup() -> list[pd.DataFrame]:
+    """
+    yf.download-shaped frames: DatetimeIndex "Date", (Price, Ticker)
+    MultiIndex columns, no "Adj Close" (auto_adjust=True default).
+    """
+    market = SyntheticMarket(seed=SEED)
+    days = market.days(*YAHOO_RANGE)
+    symbols = [f"SYN{i:04d}.NS" for i in range(YAHOO_SYMBOLS)]
+    panel = market.panel(symbols, days, unit=Unit.days)
+
+    raw = []
+    for symbol in symbols:
+        df = panel.frame(symbol)
+        frame = pd.DataFrame(
+            {
+                "Close": df["close"].to_numpy(),
+                "High": df["high"].to_numpy(),
+                "Low": df["low"].to_numpy(),
+                "Open": df["open"].to_numpy(),
+                "Volume": df["volume"].to_numpy(),
+            },
+            index=pd.DatetimeIndex(df["timestamp"].dt.tz_localize(None), name="Date"),
+        )
+        frame.columns = pd.MultiIndex.from_product([frame.columns, [symbol]], names=["Price", "Ticker"])
+        raw.append(frame)
+    return raw
+
+
+def _yahoo_rows(raw: pd.DataFrame):
+    # the previous path: records → QKCandle per row → DataFrame again
+    df = raw.reset_index()
+    df.columns = df.columns.get_level_values(0)
+    df["timestamp"] = pd.to_datetime(df["Date"])
+    df.rename(columns={c: n for c, n in YahooFetcher._COLUMNS.items()}, inplace=True)
+    if "adjclose" not in df:
+        df["adjclose"] = df["close"]
+    candles = (
+        QKCandle(
+            timestamp=row["timestamp"],
+            open=row["open"],
+            high=row["high"],
+            low=row["low"],
+            close=row["close"],
+            adjclose=row["adjclose"],
+            volume=row["volume"],
+        )
+        for row in df.to_dict("records")
+    )
+    return DataFetcherBase._candles_to_df(candles)
+
+
+def _yahoo_legacy_run(frames):
+    for raw in frames:
+        _yahoo_rows(raw)
+
+
+def _yahoo_columnar_run(frames):
+    for raw in frames:
+        DataFetcherBase._normalize_df(YahooFetcher._to_frame(raw))
+
+
+def cases(rows_sizes: list[int], ticker_counts: list[int] = ()) -> list[BenchCase]:
+    sessions = len(SyntheticMarket().days(*PANEL_RANGE))
+    generator = [
+        BenchCase(
+            # one year of 5-minute bars; items = rows generated
+            name=f"data.synthetic_panel[{tickers}x1y-5m]",
+            group="data",
+            params={"tickers": tickers, "unit": "minutes", "interval": 5},
+            setup=lambda t=tickers: _panel_setup(t),
+            run=_panel_run,
+            items=tickers * sessions * 75,
+            repeat=3,
+        )
+        for tickers in ticker_counts
+    ]
+    store = [
+        BenchCase(
+            name=f"data.store_window[{tickers}x1m-of-1y-5m]",
+            group="data",
+            params={"tickers": tickers, "window": STORE_WINDOW},
+            setup=lambda t=tickers: _store_setup(t),
+            run=_store_run,
+            items=tickers,
+            unit="symbols",
+            repeat=5,
+        )
+        for tickers in ticker_counts if tickers <= STORE_MAX_TICKERS
+    ]
+    resampling = [
+        BenchCase(
+            # one 1m base → 5m / 15m / 1h / 1d
+            name="data.resample[1y-1m]",
+            group="data",
+            params={"targets": [f"{i}{u.value}" for u, i in RESAMPLE_TARGETS]},
+            setup=_resample_setup,
+            run=_resample_run,
+            items=sessions * 375,
+            repeat=5,
+        )
+    ]
+    yahoo_rows = YAHOO_SYMBOLS * len(SyntheticMarket().days(*YAHOO_RANGE))
+    yahoo = [
+        BenchCase(
+            name=f"data.yahoo_frame.{label}[{YAHOO_SYMBOLS}x10y-1d]",
+            group="data",
+            params={"symbols": YAHOO_SYMBOLS, "range": YAHOO_RANGE, "path": label},
+            setup=_yahoo_setup,
+            run=run,
+            items=yahoo_rows,
+            repeat=3,
+        )
+        for label, run in (("rows", _yahoo_legacy_run), ("columnar", _yahoo_columnar_run))
+    ]
+    return generator + store + resampling + yahoo + [
+        BenchCase(
+            name=f"data.candles_to_df[{rows}]",
+            group="data",
+            params={"rows": rows},
+            setup=lambda rows=rows: _candles(rows),
+            run=DataFetcherBase._candles_to_df,
+            items=rows,
+            repeat=3 if rows >= 100_000 else 5,
+        )
+        for rows in rows_sizes
+    ]
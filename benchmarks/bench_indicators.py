@@ -0,0 +1,58 @@
+# benchmarks/bench_indicators.py
+import numpy as np
+
+from benchmarks.bench_base import BenchCase
+from core.test_data_generator import make_test_df
+from indicators.indicator_day_range_percentage import DayRangePct
+from indicators.indicator_mcginley import McGinleyDynamic
+from indicators.indicator_moving_average import MovingAverage
+from indicators.indicator_vwap import VWAP
+
+
+SEED = 42
+
+# per-row Python loops: larger sizes take minutes, not seconds
+ROW_CAP = {
+    McGinleyDynamic: 100_000,
+    VWAP: 100_000,
+}
+
+
+def indicators():
+    return [
+        MovingAverage(21),
+        McGinleyDynamic(14),
+        VWAP(1),
+        DayRangePct(),
+    ]
+
+
+def _compute(args):
+    indicator, df = args
+    with np.errstate(all="ignore"):
+        return indicator.compute(df)
+
+
+def cases(rows_sizes: list[int]) -> list[BenchCase]:
+    out = []
+    for rows in rows_sizes:
+        for ind in indicators():
+            cap = ROW_CAP.get(type(ind))
+            name = f"indicator.{type(ind).__name__}[{rows}]"
+
+            out.append(BenchCase(
+                name=name,
+                group="indicators",
+                params={"rows": rows, **ind.params()},
+                setup=lambda ind=ind, rows=rows: (
+                    ind, make_test_df(rows, seed=SEED)
+                ),
+                run=_compute,
+                items=rows,
+                repeat=3 if rows >= 100_000 else 5,
+                skip=(
+                    f"rows > {cap} (per-row loop)"
+                    if cap is not None and rows > cap else None
+                ),
+            ))
+    return out
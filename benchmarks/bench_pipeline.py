@@ -0,0 +1,78 @@
+# benchmarks/bench_pipeline.py
+from benchmarks.bench_base import BenchCase
+from benchmarks.bench_indicators import SEED
+from app.app_controller import AppController
+from core.common_types import QKApi
+from data.QK_data_manager import QKHistoricalData
+from data.fetch_request import QKFetchRequest
+from data.historical_data.fetcher_registry import FetcherRegistry
+from data.historical_data.fetcher_synthetic import SyntheticFetcher
+from indicators.indicator_cache import IndicatorCache
+from indicators.indicator_moving_average import MovingAverage
+from strategies.QK_strategy_manager import StrategyManager
+from strategies.strategy_day_range_breakout import DayRangeBreakoutStrategy
+from strategies.strategy_ma_crossover import MACrossoverStrategy
+
+
+ROWS_PER_TICKER = 1_000
+WORKERS = 4
+
+
+def _controller(rows: int, cache: IndicatorCache) -> AppController:
+    registry = FetcherRegistry({
+        QKApi.yfinance: lambda: SyntheticFetcher(rows=rows, seed=SEED),
+    })
+    return AppController(
+        QKHistoricalData(registry=registry),
+        StrategyManager(),
+        indicator_cache=cache,
+    )
+
+
+def _setup(tickers: int, warm_cache: bool):
+    # max_bytes=0 → nothing is retained, every repeat recomputes
+    cache = IndicatorCache() if warm_cache else IndicatorCache(max_bytes=0)
+    controller = _controller(ROWS_PER_TICKER, cache)
+    request = QKFetchRequest(from_date="2025-01-01", to_date="2025-12-31")
+    symbols = [f"SYN{i:04d}" for i in range(tickers)]
+    return controller, request, symbols
+
+
+def _run(args):
+    controller, request, symbols = args
+    results = controller.run_many(
+        symbols,
+        request=request,
+        indicators=[MovingAverage(50)],
+        strategies=[
+            MACrossoverStrategy(9, 21),
+            DayRangeBreakoutStrategy(0.02),
+        ],
+        max_workers=WORKERS,
+    )
+    for ticker, _, error in results:
+        if error is not None:
+            raise RuntimeError(f"{ticker}: {error}")
+
+
+def cases(ticker_counts: list[int]) -> list[BenchCase]:
+    out = []
+    for tickers in ticker_counts:
+        for warm in (False, True):
+            label = "warm" if warm else "cold"
+            out.append(BenchCase(
+                name=f"pipeline.run_many.{label}[{tickers}x{ROWS_PER_TICKER}]",
+                group="pipeline",
+                params={
+                    "tickers": tickers,
+                    "rows_per_ticker": ROWS_PER_TICKER,
+                    "workers": WORKERS,
+                    "indicator_cache": label,
+                },
+                setup=lambda t=tickers, w=warm: _setup(t, w),
+                run=_run,
+                items=tickers,
+                unit="tickers",
+                repeat=3,
+            ))
+    return out
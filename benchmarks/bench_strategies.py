@@ -0,0 +1,61 @@
+# benchmarks/bench_strategies.py
+import numpy as np
+
+from benchmarks.bench_base import BenchCase
+from benchmarks.bench_indicators import ROW_CAP, SEED
+from core.test_data_generator import make_test_df
+from indicators.QK_indicator_manager import IndicatorManager
+from strategies.strategy_day_range_breakout import DayRangeBreakoutStrategy
+from strategies.strategy_ma_crossover import MACrossoverStrategy
+from strategies.strategy_mcginley_breakout import McGinleyBreakoutStrategy
+from strategies.strategy_vwap_crossover import VWAPCrossoverStrategy
+
+
+def strategies():
+    return [
+        MACrossoverStrategy(9, 21),
+        VWAPCrossoverStrategy(1, 3),
+        DayRangeBreakoutStrategy(0.02),
+        McGinleyBreakoutStrategy(14),
+    ]
+
+
+def _setup(strategy, rows):
+    # indicator columns are precomputed → only compute() is timed
+    manager = IndicatorManager()
+    for ind in strategy.indicators():
+        manager.add(ind)
+    with np.errstate(all="ignore"):
+        df = manager.run(make_test_df(rows, seed=SEED))
+    return strategy, df
+
+
+def _run(args):
+    strategy, df = args
+    return strategy.compute(df)
+
+
+def cases(rows_sizes: list[int]) -> list[BenchCase]:
+    out = []
+    for rows in rows_sizes:
+        for strat in strategies():
+            caps = [
+                ROW_CAP[type(ind)] for ind in strat.indicators()
+                if type(ind) in ROW_CAP
+            ]
+            cap = min(caps) if caps else None
+
+            out.append(BenchCase(
+                name=f"strategy.{type(strat).__name__}[{rows}]",
+                group="strategies",
+                params={"rows": rows, **strat.params()},
+                setup=lambda strat=strat, rows=rows: _setup(strat, rows),
+                run=_run,
+                items=rows,
+                repeat=3 if rows >= 100_000 else 5,
+                skip=(
+                    f"rows > {cap} (indicator setup is a per-row loop)"
+                    if cap is not None and rows > cap else None
+                ),
+            ))
+    return out
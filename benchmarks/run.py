@@ -0,0 +1,151 @@
+# benchmarks/run.py
+"""
+Benchmark runner.
+
+    python -m benchmarks.run                      # full profile
+    python -m benchmarks.run --profile quick      # smoke sizes
+    python -m benchmarks.run -k indicator --out bench_results.json
+    python -m benchmarks.run --compare bench_baseline.json
+
+Results are written as JSON (one record per case + environment metadata),
+so runs from different commits can be diffed with --compare.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from benchmarks import (
+    bench_backtest,
+    bench_charts,
+    bench_data_path,
+    bench_indicators,
+    bench_pipeline,
+    bench_strategies,
+)
+from benchmarks.bench_base import BenchCase, measure
+
+
+PROFILES = {
+    "quick": {
+        "rows": [1_000, 10_000],
+        "tickers": [10],
+    },
+    "full": {
+        "rows": [1_000, 100_000, 1_000_000],
+        "tickers": [10, 100, 800],
+    },
+}
+
+
+def collect(profile: str) -> list[BenchCase]:
+    sizes = PROFILES[profile]
+    return [
+        *bench_indicators.cases(sizes["rows"]),
+        *bench_strategies.cases(sizes["rows"]),
+        *bench_data_path.cases(sizes["rows"], sizes["tickers"]),
+        *bench_pipeline.cases(sizes["tickers"]),
+        *bench_charts.cases(sizes["tickers"][:2]),
+        *bench_backtest.cases(sizes["tickers"]),
+    ]
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment() -> dict:
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def _fmt_row(r: dict) -> str:
+    if "skipped" in r:
+        return f"{r['name']:<48} {'skipped':>12}  {r['skipped']}"
+
+    rate = r["items_per_s"]
+    rate = f"{rate:>14,.0f} {r['unit']}/s" if rate else ""
+    return f"{r['name']:<48} {r['min_s'] * 1e3:>10.2f}ms  {rate}"
+
+
+def compare(results: list[dict], baseline_path: str) -> None:
+    with open(baseline_path) as fh:
+        baseline = json.load(fh)
+
+    base = {
+        r["name"]: r for r in baseline["results"]
+        if "skipped" not in r
+    }
+    base_commit = baseline["environment"].get("commit")
+    print(f"\nvs {baseline_path} ({base_commit}) — min time, <1.00 is faster")
+
+    for r in results:
+        b = base.get(r["name"])
+        if b is None or "skipped" in r:
+            continue
+        ratio = r["min_s"] / b["min_s"] if b["min_s"] else float("nan")
+        flag = "  ▲ slower" if ratio > 1.10 else "  ▼ faster" if ratio < 0.90 else ""
+        print(f"{r['name']:<48} {ratio:>6.2f}x{flag}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="full")
+    parser.add_argument("-k", "--filter", default=None,
+                        help="only run cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=None,
+                        help="override per-case repeat count")
+    parser.add_argument("--out", default=None, help="write JSON results here")
+    parser.add_argument("--compare", default=None,
+                        help="baseline JSON from an earlier run")
+    args = parser.parse_args(argv)
+
+    cases = collect(args.profile)
+    if args.filter:
+        cases = [c for c in cases if args.filter in c.name]
+
+    results = []
+    for case in cases:
+        # McGinley on a random walk can hit non-positive prices
+        with np.errstate(all="ignore"):
+            r = measure(case, repeat=args.repeat)
+        results.append(r)
+        print(_fmt_row(r), flush=True)
+
+    payload = {
+        "environment": {**environment(), "profile": args.profile},
+        "results": results,
+    }
+
+    if args.out:
+        with open(args.out, "w") as fh:
+            json.dump(payload, fh, indent=2, default=str)
+        print(f"\nwrote {len(results)} results to {args.out}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
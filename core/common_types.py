@@ -72,3 +72,23 @@ class QKCandle:
         self.close = close
         self.adjclose = adjclose
         self.volume = volume
+
+
+class QKTick:
+    """
+    One trade print. `timestamp` is epoch nanoseconds (UTC) so streams
+    can be bucketed with integer math.
+    """
+    __slots__ = ("symbol", "timestamp", "price", "volume")
+
+    def __init__(
+        self,
+        symbol: str,
+        timestamp: int,
+        price: float,
+        volume: int
+    ):
+        self.symbol = symbol
+        self.timestamp = timestamp
+        self.price = price
+        self.volume = volume
@@ -0,0 +1,37 @@
+import hashlib
+from typing import Iterable
+
+import pandas as pd
+
+
+def df_fingerprint(
+    df: pd.DataFrame,
+    columns: Iterable[str] | None = None,
+    *,
+    include_index: bool = True,
+) -> str:
+    """
+    Stable content hash of a DataFrame.
+
+    Covers column names, dtypes, values and (optionally) the index.
+    Two frames with the same fingerprint render / compute identically.
+    """
+    if columns is not None:
+        df = df[list(columns)]
+
+    h = hashlib.blake2b(digest_size=16)
+
+    # ---- SCHEMA ----
+    for name, dtype in df.dtypes.items():
+        h.update(f"{name}:{dtype};".encode())
+
+    h.update(f"rows={len(df)};".encode())
+
+    if df.empty:
+        return h.hexdigest()
+
+    # ---- VALUES (vectorized, one uint64 per row) ----
+    row_hashes = pd.util.hash_pandas_object(df, index=include_index)
+    h.update(row_hashes.to_numpy().tobytes())
+
+    return h.hexdigest()
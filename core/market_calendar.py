@@ -0,0 +1,183 @@
+import math
+from datetime import date, datetime, time
+
+import numpy as np
+import pandas as pd
+
+from core.common_types import QKDate, Unit
+
+
+NSE_TZ = "Asia/Kolkata"
+
+# NSE equity segment trading holidays falling on weekdays
+# (weekends are excluded by the weekmask). Extend as NSE publishes.
+NSE_HOLIDAYS = (
+    # 2024
+    "2024-01-22", "2024-01-26", "2024-03-08", "2024-03-25", "2024-03-29",
+    "2024-04-11", "2024-04-17", "2024-05-01", "2024-05-20", "2024-06-17",
+    "2024-07-17", "2024-08-15", "2024-10-02", "2024-11-01", "2024-11-15",
+    "2024-11-20", "2024-12-25",
+    # 2025
+    "2025-02-26", "2025-03-14", "2025-03-31", "2025-04-10", "2025-04-14",
+    "2025-04-18", "2025-05-01", "2025-08-15", "2025-08-27", "2025-10-02",
+    "2025-10-21", "2025-10-22", "2025-11-05", "2025-12-25",
+)
+
+
+def as_day(value) -> np.datetime64:
+    """
+    str / date / datetime / Timestamp / QKDate → numpy day.
+    Time-of-day and timezone are dropped (the local calendar date is kept).
+    """
+    if isinstance(value, QKDate):
+        value = value.date()
+    elif isinstance(value, (datetime, pd.Timestamp)):
+        value = value.date()
+    elif not isinstance(value, (date, np.datetime64)):
+        value = pd.Timestamp(value).date()
+    return np.datetime64(value, "D")
+
+
+def bar_minutes(unit: Unit, interval: int) -> int | None:
+    """
+    Bar length in minutes; None for daily bars.
+    """
+    if unit == Unit.minutes:
+        return interval
+    if unit == Unit.hours:
+        return interval * 60
+    if unit == Unit.days and interval == 1:
+        return None
+    raise ValueError(f"Unsupported bar size: {interval} {unit.name}")
+
+
+class MarketCalendar:
+    """
+    Trading days + regular session of one exchange.
+
+    Everything is built from numpy busday arrays; no per-day Python loops,
+    so a multi-year minute index is a single broadcast.
+    """
+
+    def __init__(
+        self,
+        *,
+        tz: str,
+        open_time: time,
+        close_time: time,
+        holidays=(),
+        weekmask: str = "1111100",
+    ):
+        self.tz = tz
+        self.open_time = open_time
+        self.close_time = close_time
+        self.holidays = np.array(sorted(holidays), dtype="datetime64[D]")
+        self._busdays = np.busdaycalendar(weekmask=weekmask, holidays=self.holidays)
+
+    # ---------------- SESSION ----------------
+
+    @property
+    def session_minutes(self) -> int:
+        open_m = self.open_time.hour * 60 + self.open_time.minute
+        close_m = self.close_time.hour * 60 + self.close_time.minute
+        return close_m - open_m
+
+    def bars_per_session(self, minutes: int | None) -> int:
+        if minutes is None:
+            return 1
+        return math.ceil(self.session_minutes / minutes)
+
+    def bar_offsets(self, minutes: int) -> np.ndarray:
+        """
+        Bar start times as minutes after midnight (timedelta64[m]).
+        """
+        open_m = self.open_time.hour * 60 + self.open_time.minute
+        n = self.bars_per_session(minutes)
+        return (open_m + np.arange(n) * minutes).astype("timedelta64[m]")
+
+    # ---------------- DAYS ----------------
+
+    def is_trading_day(self, day) -> bool:
+        return bool(np.is_busday(as_day(day), busdaycal=self._busdays))
+
+    def trading_days(self, start, end) -> np.ndarray:
+        """
+        Trading days in [start, end] as datetime64[D].
+        """
+        first, last = as_day(start), as_day(end)
+        if last < first:
+            return np.empty(0, dtype="datetime64[D]")
+
+        days = np.arange(first, last + 1)
+        return days[np.is_busday(days, busdaycal=self._busdays)]
+
+    def last_trading_days(self, end, count: int) -> np.ndarray:
+        """
+        The `count` trading days ending at (or before) `end`, oldest first.
+        """
+        last = np.busday_offset(as_day(end), 0, roll="backward", busdaycal=self._busdays)
+        return np.busday_offset(last, np.arange(1 - count, 1), busdaycal=self._busdays)
+
+    def next_trading_days(self, start, count: int) -> np.ndarray:
+        """
+        The `count` trading days starting at (or after) `start`.
+        """
+        first = np.busday_offset(as_day(start), 0, roll="forward", busdaycal=self._busdays)
+        return np.busday_offset(first, np.arange(count), busdaycal=self._busdays)
+
+    # ---------------- INDEX ----------------
+
+    def session_index(self, days: np.ndarray, minutes: int | None = None) -> pd.DatetimeIndex:
+        """
+        Bar start timestamps for `days` (tz-aware).
+        minutes=None → one daily bar per day, stamped at local midnight.
+        """
+        days = np.asarray(days, dtype="datetime64[D]")
+
+        if minutes is None:
+            stamps = days.astype("datetime64[ns]")
+        else:
+            stamps = (
+                days.astype("datetime64[m]")[:, None]
+                + self.bar_offsets(minutes)[None, :]
+            ).ravel().astype("datetime64[ns]")
+
+        return pd.DatetimeIndex(stamps).tz_localize(self.tz)
+
+    def session_layout(self, timestamps: pd.DatetimeIndex, cutoff: time | None = None):
+        """
+        For a sorted bar index, per bar:
+        - session: session number (0, 1, ...)
+        - last:    index of the session's last bar
+        - cut:     index of the session's last bar starting before `cutoff`
+                   (e.g. 15:20 intraday square-off); == last if None
+
+        All (T,) int64 arrays, computed without per-day loops.
+        """
+        local = timestamps.tz_convert(self.tz) if timestamps.tz is not None else timestamps
+        day = local.normalize().asi8
+        T = len(day)
+
+        first = np.flatnonzero(np.r_[True, day[1:] != day[:-1]])
+        last = np.r_[first[1:], T] - 1
+        session = np.cumsum(np.r_[False, day[1:] != day[:-1]])
+
+        if cutoff is None:
+            cut = last
+        else:
+            minute = local.hour.to_numpy() * 60 + local.minute.to_numpy()
+            before = minute < cutoff.hour * 60 + cutoff.minute
+            cand = np.where(before, np.arange(T), -1)
+            cut = np.maximum.reduceat(cand, first)
+            # no bar before the cutoff → square off at the first bar
+            cut = np.where(cut < 0, first, cut)
+
+        return session, last[session], cut[session]
+
+
+NSE = MarketCalendar(
+    tz=NSE_TZ,
+    open_time=time(9, 15),
+    close_time=time(15, 30),
+    holidays=NSE_HOLIDAYS,
+)
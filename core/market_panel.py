@@ -0,0 +1,111 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class MarketPanel:
+    """
+    Aligned multi-ticker OHLCV: every array is (time × symbol).
+
+    Missing bars (data gaps, symbols not yet listed) are NaN in the
+    price arrays, 0 in `volume` and False in `valid`.
+    """
+    symbols: tuple[str, ...]
+    timestamps: pd.DatetimeIndex
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    valid: np.ndarray
+    _columns: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_columns", {s: j for j, s in enumerate(self.symbols)})
+
+    @classmethod
+    def from_frames(cls, frames: dict[str, pd.DataFrame]) -> "MarketPanel":
+        """
+        Per-symbol frames (fetcher schema) → one panel on the union of
+        their timestamps.
+        """
+        symbols = tuple(frames)
+        stamps = [pd.DatetimeIndex(df["timestamp"]) for df in frames.values()]
+        timestamps = stamps[0]
+        for s in stamps[1:]:
+            timestamps = timestamps.union(s)
+
+        T, N = len(timestamps), len(symbols)
+        arrays = {f: np.full((T, N), np.nan) for f in ("open", "high", "low", "close")}
+        volume = np.zeros((T, N), dtype=np.int64)
+        valid = np.zeros((T, N), dtype=bool)
+
+        for j, (df, idx) in enumerate(zip(frames.values(), stamps)):
+            rows = timestamps.get_indexer(idx)
+            for f, arr in arrays.items():
+                arr[rows, j] = df[f].to_numpy(dtype=np.float64)
+            volume[rows, j] = df["volume"].to_numpy(dtype=np.int64)
+            valid[rows, j] = True
+
+        return cls(symbols=symbols, timestamps=timestamps, volume=volume, valid=valid, **arrays)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.close.shape
+
+    @property
+    def rows(self) -> int:
+        return int(self.valid.sum())
+
+    def column(self, symbol: str) -> int:
+        return self._columns[symbol]
+
+    def frame(self, symbol: str) -> pd.DataFrame:
+        """
+        One symbol in the fetcher schema (timestamp, open, ..., volume).
+        """
+        j = self.column(symbol)
+        keep = self.valid[:, j]
+        close = self.close[keep, j]
+
+        return pd.DataFrame({
+            "timestamp": self.timestamps[keep],
+            "open": self.open[keep, j],
+            "high": self.high[keep, j],
+            "low": self.low[keep, j],
+            "close": close,
+            "adjclose": close,
+            "volume": self.volume[keep, j],
+        })
+
+    def frames(self) -> dict[str, pd.DataFrame]:
+        return {s: self.frame(s) for s in self.symbols}
+
+    def align(self, frames: dict[str, pd.DataFrame], column: str, fill=0) -> np.ndarray:
+        """
+        Scatter one column of per-symbol frames (each with a `timestamp`
+        column) onto the panel grid → (time × symbol) array.
+        """
+        sample = next(iter(frames.values()))[column].to_numpy()
+        out = np.full(self.shape, fill, dtype=sample.dtype if sample.dtype != object else object)
+
+        for symbol, df in frames.items():
+            rows = self.timestamps.get_indexer(pd.DatetimeIndex(df["timestamp"]))
+            hit = rows >= 0
+            out[rows[hit], self.column(symbol)] = df[column].to_numpy()[hit]
+        return out
+
+    def filled_close(self) -> np.ndarray:
+        """
+        Close carried forward over missing bars (for marking positions).
+        """
+        close = self.close
+        if self.valid.all():
+            return close
+
+        T = close.shape[0]
+        last = np.where(self.valid, np.arange(T)[:, None], 0)
+        np.maximum.accumulate(last, axis=0, out=last)
+        return np.take_along_axis(close, last, axis=0)
@@ -0,0 +1,212 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+
+class _Span:
+    """
+    One timed stage. Callers may fill `rows` / `bytes` before it closes.
+    """
+    __slots__ = ("profiler", "stage", "ticker", "rows", "bytes", "_t0")
+
+    def __init__(self, profiler: "Profiler", stage: str, ticker: str | None):
+        self.profiler = profiler
+        self.stage = stage
+        self.ticker = ticker
+        self.rows = None
+        self.bytes = None
+        self._t0 = 0
+
+    def __enter__(self):
+        self._t0 = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._record(self, self._t0, time.perf_counter_ns())
+        return False
+
+
+class _NullSpan:
+    __slots__ = ("rows", "bytes")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class Profiler:
+    """
+    Per-stage, per-ticker wall-time recorder.
+
+    Disabled by default (stage() is then a no-op); enable with
+    QK_PROFILE=1 or `profiler.enabled = True`.
+
+    Keeps the most recent `max_events` spans (older ones are dropped and
+    counted in `dropped`), so a long GUI session stays bounded; summaries
+    and traces cover that window.
+    """
+
+    def __init__(self, enabled: bool = False, max_events: int = 100_000):
+        self.enabled = enabled
+        self._events: deque[dict] = deque(maxlen=max_events)
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = time.perf_counter_ns()
+
+    # ---------------- RECORDING ----------------
+
+    @contextmanager
+    def ticker(self, name: str):
+        """
+        Attribute every stage opened in this thread to `name`.
+        """
+        prev = getattr(self._local, "ticker", None)
+        self._local.ticker = name
+        try:
+            yield
+        finally:
+            self._local.ticker = prev
+
+    def stage(self, name: str, *, ticker: str | None = None):
+        if not self.enabled:
+            return _NullSpan()
+        if ticker is None:
+            ticker = getattr(self._local, "ticker", None)
+        return _Span(self, name, ticker)
+
+    def _record(self, span: _Span, t0: int, t1: int) -> None:
+        event = {
+            "stage": span.stage,
+            "ticker": span.ticker,
+            "start_ns": t0 - self._origin,
+            "dur_ns": t1 - t0,
+            "rows": span.rows,
+            "bytes": span.bytes,
+            "tid": threading.get_ident(),
+        }
+        with self._lock:
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._events.append(event)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self.dropped = 0
+            self._origin = time.perf_counter_ns()
+
+    @property
+    def events(self) -> list[dict]:
+        with self._lock:
+            return list(self._events)
+
+    # ---------------- AGGREGATION ----------------
+
+    def summary(self) -> dict[str, dict]:
+        """
+        stage -> count, total / p50 / p95 / p99 / max seconds, rows, bytes.
+        """
+        by_stage: dict[str, list[dict]] = {}
+        for e in self.events:
+            by_stage.setdefault(e["stage"], []).append(e)
+
+        out = {}
+        for stage, events in by_stage.items():
+            durs = np.array([e["dur_ns"] for e in events], dtype="float64") / 1e9
+            out[stage] = {
+                "count": len(events),
+                "total_s": float(durs.sum()),
+                "p50_s": float(np.percentile(durs, 50)),
+                "p95_s": float(np.percentile(durs, 95)),
+                "p99_s": float(np.percentile(durs, 99)),
+                "max_s": float(durs.max()),
+                "rows": int(sum(e["rows"] or 0 for e in events)),
+                "bytes": int(sum(e["bytes"] or 0 for e in events)),
+            }
+        return out
+
+    def by_ticker(self) -> dict[str, dict[str, float]]:
+        """
+        ticker -> stage -> total seconds.
+        """
+        out: dict[str, dict[str, float]] = {}
+        for e in self.events:
+            stages = out.setdefault(e["ticker"] or "-", {})
+            stages[e["stage"]] = stages.get(e["stage"], 0.0) + e["dur_ns"] / 1e9
+        return out
+
+    # ---------------- OUTPUT ----------------
+
+    def report(self) -> str:
+        summary = self.summary()
+        if not summary:
+            return "[PROFILE] no events recorded"
+
+        header = (
+            f"{'stage':<28}{'count':>7}{'total s':>10}{'p50 ms':>10}"
+            f"{'p95 ms':>10}{'p99 ms':>10}{'rows':>12}{'MB':>9}"
+        )
+        title = "[PROFILE]"
+        if self.dropped:
+            title += f" last {len(self._events)} spans ({self.dropped} older dropped)"
+        lines = [title, header, "-" * len(header)]
+
+        for stage, s in sorted(summary.items(), key=lambda kv: -kv[1]["total_s"]):
+            lines.append(
+                f"{stage:<28}{s['count']:>7}{s['total_s']:>10.3f}"
+                f"{s['p50_s'] * 1e3:>10.2f}{s['p95_s'] * 1e3:>10.2f}"
+                f"{s['p99_s'] * 1e3:>10.2f}{s['rows']:>12}"
+                f"{s['bytes'] / 1e6:>9.2f}"
+            )
+
+        return "\n".join(lines)
+
+    def dump_json(self, path: str | Path) -> Path:
+        path = Path(path)
+        with open(path, "w") as f:
+            json.dump(
+                {"summary": self.summary(), "by_ticker": self.by_ticker()},
+                f,
+                indent=2,
+            )
+        return path
+
+    def dump_chrome_trace(self, path: str | Path) -> Path:
+        """
+        Chrome trace-event JSON (open in chrome://tracing or Perfetto).
+        """
+        pid = os.getpid()
+        trace = [
+            {
+                "name": e["stage"],
+                "cat": e["ticker"] or "pipeline",
+                "ph": "X",
+                "ts": e["start_ns"] / 1e3,
+                "dur": e["dur_ns"] / 1e3,
+                "pid": pid,
+                "tid": e["tid"],
+                "args": {
+                    k: e[k] for k in ("ticker", "rows", "bytes")
+                    if e[k] is not None
+                },
+            }
+            for e in self.events
+        ]
+
+        path = Path(path)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+        return path
+
+
+# process-wide instance used by the pipeline instrumentation
+profiler = Profiler(enabled=os.getenv("QK_PROFILE", "") not in ("", "0"))
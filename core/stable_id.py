@@ -0,0 +1,39 @@
+import re
+from enum import Enum
+
+
+def public_params(obj) -> dict:
+    """
+    Constructor params of an indicator / strategy: public instance attrs,
+    in assignment order.
+    """
+    return {k: v for k, v in vars(obj).items() if not k.startswith("_")}
+
+
+def _token(value) -> str:
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, (list, tuple)):
+        return "-".join(_token(v) for v in value)
+    return re.sub(r"[^A-Za-z0-9.-]+", "-", str(value))
+
+
+def param_slug(params: dict) -> str:
+    """
+    Readable, deterministic column suffix: {"fast": 9, "slow": 21} → "9_21".
+    """
+    return "_".join(_token(v) for v in params.values())
+
+
+def param_signature(obj, params: dict | None = None) -> str:
+    """
+    Process-independent identity of a configured object:
+    "indicators.indicator_moving_average.MovingAverage(period=21,source=close)".
+    """
+    cls = type(obj)
+    if params is None:
+        params = public_params(obj)
+    body = ",".join(f"{k}={_token(params[k])}" for k in sorted(params))
+    return f"{cls.__module__}.{cls.__qualname__}({body})"
@@ -12,7 +12,14 @@ def make_test_df(
     start="2025-01-01 09:15",
     freq="5min",
     tz="Asia/Kolkata",
+    seed: int | None = None,
 ):
+    """
+    One ticker of random-walk candles.
+    Same `seed` → identical frame; seed=None → fresh randomness.
+    """
+    rng = np.random.default_rng(seed)
+
     timestamps = pd.date_range(
         start=start,
         periods=rows,
@@ -21,13 +28,13 @@ def make_test_df(
     )
 
     base = 100
-    noise = np.random.normal(0, 0.8, size=rows).cumsum()
+    noise = rng.normal(0, 0.8, size=rows).cumsum()
 
     close = base + noise
-    open_ = close + np.random.normal(0, 0.4, size=rows)
-    high = np.maximum(open_, close) + np.random.uniform(0.2, 1.0, size=rows)
-    low = np.minimum(open_, close) - np.random.uniform(0.2, 1.0, size=rows)
-    volume = np.random.randint(100_000, 900_000, size=rows)
+    open_ = close + rng.normal(0, 0.4, size=rows)
+    high = np.maximum(open_, close) + rng.uniform(0.2, 1.0, size=rows)
+    low = np.minimum(open_, close) - rng.uniform(0.2, 1.0, size=rows)
+    volume = rng.integers(100_000, 900_000, size=rows)
 
     df = pd.DataFrame({
         "timestamp": timestamps,
@@ -0,0 +1,99 @@
+# core/time_index.py
+"""
+Binary-search time ranges over candle frames.
+
+Frames keep their RangeIndex (indicators and the indicator cache align
+on it); the sorted `timestamp` column doubles as the time index. Its
+int64 epoch view costs nothing to take, so every range lookup is a
+searchsorted instead of a boolean scan over the column.
+"""
+import numpy as np
+import pandas as pd
+
+from core.common_types import QKDate
+
+
+def epoch_ns(source) -> np.ndarray:
+    """
+    Frame (its `timestamp` column) / DatetimeIndex / datetime Series →
+    int64 epoch ns (UTC for tz-aware values). A view where possible.
+
+    Always ns, whatever the column's resolution: pandas 3 builds
+    datetime64[us] columns from strings and Python datetimes, and its
+    asi8 is in the column's own unit.
+    """
+    if isinstance(source, np.ndarray) and source.dtype == np.int64:
+        return source
+    if isinstance(source, pd.DataFrame):
+        source = source["timestamp"]
+    return pd.DatetimeIndex(source).as_unit("ns").asi8
+
+
+def to_epoch(value, tz=None) -> int:
+    """
+    A bound (str / date / datetime / Timestamp / QKDate) → epoch ns.
+    Naive bounds are read in `tz` (the data's timezone).
+    """
+    if isinstance(value, QKDate):
+        value = value.to_datetime()
+    ts = pd.Timestamp(value)
+    if tz is not None:
+        ts = ts.tz_localize(tz) if ts.tz is None else ts.tz_convert(tz)
+    return ts.as_unit("ns").value
+
+
+def _tz(source):
+    if isinstance(source, pd.DataFrame):
+        source = source["timestamp"]
+    if isinstance(source, pd.Series):
+        return getattr(source.dtype, "tz", None)
+    return getattr(source, "tz", None)
+
+
+def is_sorted(stamps: np.ndarray) -> bool:
+    return len(stamps) < 2 or bool(np.all(stamps[1:] >= stamps[:-1]))
+
+
+def ensure_sorted(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Frame ordered by `timestamp` with a fresh RangeIndex.
+    Returned as-is when it already is (one vectorized check).
+    """
+    if "timestamp" not in df or len(df) < 2:
+        return df
+    if is_sorted(epoch_ns(df)) and isinstance(df.index, pd.RangeIndex) and df.index.start == 0:
+        return df
+    return df.sort_values("timestamp", kind="stable", ignore_index=True)
+
+
+def time_bounds(source, start=None, end=None) -> tuple[int, int]:
+    """
+    Row range [lo, hi) of bars with start <= timestamp < end.
+    `source`: sorted frame / DatetimeIndex / int64 epoch array.
+    None → open-ended. O(log n).
+    """
+    stamps = epoch_ns(source)
+    tz = _tz(source)
+    lo = 0 if start is None else int(np.searchsorted(stamps, to_epoch(start, tz), "left"))
+    hi = len(stamps) if end is None else int(np.searchsorted(stamps, to_epoch(end, tz), "left"))
+    return lo, max(lo, hi)
+
+
+def time_slice(df: pd.DataFrame, start=None, end=None) -> pd.DataFrame:
+    """
+    Bars in [start, end) as a positional slice of `df` (no copy).
+    """
+    lo, hi = time_bounds(df, start, end)
+    return df.iloc[lo:hi]
+
+
+def bars_since(source, span) -> int:
+    """
+    Number of trailing bars within `span` (Timedelta / "3D" / "90min")
+    of the last bar, inclusive.
+    """
+    stamps = epoch_ns(source)
+    if len(stamps) == 0:
+        return 0
+    cutoff = stamps[-1] - pd.Timedelta(span).as_unit("ns").value
+    return len(stamps) - int(np.searchsorted(stamps, cutoff, "left"))
@@ -1,13 +1,15 @@
 from typing import Iterable
 from datetime import datetime
 
+import pandas as pd
+
 from core.common_types import QKApi, QKDate, Unit
+from data.columnar_store import ColumnarStore, StoredSeries
+from data.fetch_request import QKFetchRequest
 from data.historical_data.base.data_fetcher_base import DataFetcherBase
-from data.historical_data.fetcher_dhan import DhanFetcher
-from data.historical_data.fetcher_upstox import UpstoxFetcher
-from data.historical_data.fetcher_yfinance import YahooFetcher
+from data.historical_data.fetcher_registry import FetcherRegistry
 from data.ticker_symbols.QK_ticker_manager import TickerManager
-from typing import assert_never
+from data.ticker_symbols.instrument_master import DEFAULT_ROUTE, InstrumentMaster
 
 
 class QKHistoricalData:
@@ -20,7 +22,14 @@ class QKHistoricalData:
         unit: Unit = Unit.days,
         intraday_interval: int = 1,
         exchange: str = "NSE",
+        registry: FetcherRegistry | None = None,
+        store: ColumnarStore | None = None,
     ):
+        self.registry = registry or FetcherRegistry.shared()
+        # optional read-through cache for historical fetches
+        # (series are kept per api, see ColumnarStore)
+        self.store = store
+
         self.api = api
         self.from_date = from_date or QKDate.days_ago(30)
         self.to_date = to_date or QKDate.yesterday()
@@ -28,8 +37,8 @@ class QKHistoricalData:
         self.interval = interval
         self.unit = unit
         self.intraday_interval = intraday_interval
+        self.exchange = exchange
 
-        self.fetcher: DataFetcherBase = self._get_fetcher(api)
         self.tickers = TickerManager(api=api, exchange=exchange)
 
     # ---------------- CONFIG ----------------
@@ -77,6 +86,22 @@ class QKHistoricalData:
 
         return self
 
+    def request(self, **overrides) -> QKFetchRequest:
+        """
+        Immutable snapshot of the current params (plus overrides).
+        """
+        params = dict(
+            api=self.api,
+            from_date=self.from_date,
+            to_date=self.to_date,
+            unit=self.unit,
+            interval=self.interval,
+            intraday_interval=self.intraday_interval,
+            exchange=self.exchange,
+        )
+        params.update(overrides)
+        return QKFetchRequest(**params)
+
     # ---------------- API SWITCH ----------------
 
     def switch_api(self, new_api: QKApi) -> None:
@@ -84,42 +109,106 @@ class QKHistoricalData:
             return
 
         self.api = new_api
-        self.fetcher = self._get_fetcher(new_api)
         self.tickers.refresh(api=new_api)
 
     # ---------------- FETCHER ----------------
 
+    @property
+    def fetcher(self) -> DataFetcherBase:
+        return self._get_fetcher(self.api)
+
     def _get_fetcher(self, api: QKApi) -> DataFetcherBase:
-        match api:
-            case QKApi.yfinance:
-                return YahooFetcher()
-            case QKApi.upstox:
-                return UpstoxFetcher()
-            case QKApi.dhan:
-                return DhanFetcher()
-            case _:
-                assert_never(api)
+        # pooled: one instance (and session) per api, created on first use
+        return self.registry.get(api)
+
+    def health_check(self) -> bool:
+        return self.registry.health_check(self.api, recreate=True)[self.api]
+
+    def close(self) -> None:
+        # the registry is never this manager's to close: it is the
+        # process-wide shared one (other managers use its fetchers) or
+        # the caller's, who closes it (or uses it as a context manager)
+        if self.store is not None:
+            self.store.close()
+
+    # ---------------- SYMBOL ROUTING ----------------
+
+    def route(self, ticker, preference=DEFAULT_ROUTE) -> list[tuple[QKApi, str]]:
+        """
+        Providers able to serve `ticker` (named as the current api
+        names it), with each provider's own identifier.
+        """
+        return InstrumentMaster.load().route(
+            ticker, api=self.api, preference=preference
+        )
 
     # ---------------- DATA MANAGER API ----------------
 
     # ---------------- FETCHERS ----------------
 
-    def fetch_historical(self, ticker: str):
-        return self.fetcher.fetch_df(
+    def fetch(self, ticker: str, request: QKFetchRequest):
+        """
+        Stateless fetch: everything comes from `request`, nothing from
+        (or into) self → safe to call from many threads.
+
+        With a `store`, historical requests are served from its memory-
+        mapped files (fetched and written on first use / on a miss).
+        """
+        if self.store is not None and not request.intraday:
+            start, end = self._range(request)
+            return self.stored(ticker, request).frame(start, end + pd.Timedelta(days=1))
+
+        return self._fetch_provider(ticker, request)
+
+    def _range(self, request: QKFetchRequest) -> tuple[pd.Timestamp, pd.Timestamp]:
+        start = request.from_date or QKDate.days_ago(30)
+        end = request.to_date or QKDate.yesterday()
+        return pd.Timestamp(start.to_datetime()), pd.Timestamp(end.to_datetime())
+
+    def stored(self, ticker: str, request: QKFetchRequest) -> StoredSeries:
+        """
+        The ticker's memory-mapped series, covering at least the request's
+        date range. Slice it with .arrays() / .frame() — both are views.
+        """
+        if self.store is None:
+            raise RuntimeError("No ColumnarStore configured")
+
+        start, end = self._range(request)
+        key = dict(unit=request.unit, interval=request.interval, api=request.api)
+        if not self.store.covers(ticker, start=start, end=end, **key):
+            df = self._fetch_provider(ticker, request)
+            if len(df):
+                self.store.write(ticker, df, covered=(start, end), **key)
+            elif self.store.open(ticker, **key) is None:
+                # an empty answer (outage, throttling) proves nothing about
+                # the range: keep it without coverage so the next call asks again
+                self.store.write(ticker, df, **key)
+        return self.store.open(ticker, **key)
+
+    def _fetch_provider(self, ticker: str, request: QKFetchRequest):
+        fetcher = self._get_fetcher(request.api)
+
+        if request.intraday:
+            return fetcher.fetch_df(
+                symbol=ticker,
+                intraday=True,
+                start=None,
+                end=None,
+                unit=request.unit,
+                interval=request.intraday_interval,
+            )
+
+        return fetcher.fetch_df(
             symbol=ticker,
             intraday=False,
-            start=self.from_date,
-            end=self.to_date,
-            unit=self.unit,
-            interval=self.interval,
+            start=request.from_date or QKDate.days_ago(30),
+            end=request.to_date or QKDate.yesterday(),
+            unit=request.unit,
+            interval=request.interval,
         )
 
+    def fetch_historical(self, ticker: str):
+        return self.fetch(ticker, self.request(mode="historical"))
+
     def fetch_intraday(self, ticker: str):
-        return self.fetcher.fetch_df(
-            symbol=ticker,
-            intraday=True,
-            start=None,
-            end=None,
-            unit=self.unit,
-            interval=self.intraday_interval,
-        )
+        return self.fetch(ticker, self.request(mode="intraday"))
@@ -0,0 +1,277 @@
+# data/columnar_store.py
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.common_types import QKApi, QKDate, Unit
+from core.time_index import to_epoch
+
+
+FIELDS = ("open", "high", "low", "close", "adjclose", "volume")
+
+
+def series_key(unit: Unit, interval: int) -> str:
+    # "1d", "5m", ... → one directory per bar size
+    return f"{interval}{unit.value}"
+
+
+def source_key(api: QKApi | None) -> str:
+    # one tree per data source; None → data not fetched from a provider
+    return api.name if api is not None else "local"
+
+
+def _day(value) -> pd.Timestamp:
+    if isinstance(value, QKDate):
+        value = value.to_datetime()
+    return pd.Timestamp(value).normalize()
+
+
+@dataclass(frozen=True)
+class StoredSeries:
+    """
+    One symbol's bars, memory-mapped read-only.
+
+    `timestamps` is int64 epoch ns (UTC for tz-aware data), sorted;
+    every field is a 1-D array of the same length. Nothing is read from
+    disk until a slice is touched.
+    """
+    symbol: str
+    tz: str | None
+    covered: tuple[str, str] | None     # requested date range the file holds
+    timestamps: np.ndarray
+    columns: dict
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def bounds(self, start=None, end=None) -> tuple[int, int]:
+        """
+        Row range [lo, hi) of bars with start <= timestamp < end
+        (binary search; None → open-ended).
+        """
+        lo = 0 if start is None else int(np.searchsorted(self.timestamps, to_epoch(start, self.tz), "left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.timestamps, to_epoch(end, self.tz), "left"))
+        return lo, max(lo, hi)
+
+    def arrays(self, start=None, end=None) -> dict[str, np.ndarray]:
+        """
+        Zero-copy NumPy views for [start, end), "timestamp" as int64 epoch ns.
+        """
+        lo, hi = self.bounds(start, end)
+        out = {"timestamp": self.timestamps[lo:hi]}
+        out.update({f: arr[lo:hi] for f, arr in self.columns.items()})
+        return out
+
+    def frame(self, start=None, end=None) -> pd.DataFrame:
+        """
+        Fetcher-schema frame over [start, end). Price / volume columns
+        wrap the mapped arrays (no copy); only the timestamp column is
+        materialized when a timezone has to be attached.
+        """
+        lo, hi = self.bounds(start, end)
+        stamps = pd.DatetimeIndex(self.timestamps[lo:hi].view("M8[ns]"), copy=False)
+        if self.tz is not None:
+            stamps = stamps.tz_localize("UTC").tz_convert(self.tz)
+
+        data = {"timestamp": stamps}
+        data.update({f: arr[lo:hi] for f, arr in self.columns.items()})
+        return pd.DataFrame(data, copy=False)
+
+
+class ColumnarStore:
+    """
+    Local on-disk candle store: one .npy file per field per symbol,
+    opened with np.load(mmap_mode="r").
+
+        <root>/<api>/<bar size>/<symbol>/meta.json
+        <root>/<api>/<bar size>/<symbol>/<field>.<generation>.npy
+
+Series are keyed by (api, bar size, symbol): providers disagree on
+adjustments and coverage, so one never answers for another.
+
+    The OS page cache holds only what is touched, so a universe far
+    larger than RAM can be scanned window by window.
+
+    Writes never modify mapped files: a write lands in a new generation
+    and meta.json is swapped atomically, so readers holding the previous
+    mapping keep a consistent view (old files are removed when they can
+    be, which on Windows is after the last map closes).
+    Thread-safe.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._open: dict[tuple, StoredSeries] = {}
+        self._lock = threading.RLock()
+
+    def _dir(self, symbol: str, unit: Unit, interval: int, api: QKApi | None) -> Path:
+        return self.root / source_key(api) / series_key(unit, interval) / str(symbol)
+
+    @staticmethod
+    def _read_meta(path: Path) -> dict | None:
+        try:
+            return json.loads((path / "meta.json").read_text())
+        except FileNotFoundError:
+            return None
+
+    # ---------------- READ ----------------
+
+    def symbols(self, unit: Unit = Unit.days, interval: int = 1, *, api: QKApi | None = None) -> list[str]:
+        base = self.root / source_key(api) / series_key(unit, interval)
+        if not base.is_dir():
+            return []
+        return sorted(p.name for p in base.iterdir() if (p / "meta.json").is_file())
+
+    def open(
+        self,
+        symbol: str,
+        unit: Unit = Unit.days,
+        interval: int = 1,
+        *,
+        api: QKApi | None = None,
+    ) -> StoredSeries | None:
+        key = (api, str(symbol), unit, interval)
+        with self._lock:
+            series = self._open.get(key)
+            if series is not None:
+                return series
+
+            path = self._dir(symbol, unit, interval, api)
+            meta = self._read_meta(path)
+            if meta is None:
+                return None
+
+            gen = meta["generation"]
+
+            def load(name):
+                return np.load(path / f"{name}.{gen}.npy", mmap_mode="r")
+
+            series = StoredSeries(
+                symbol=str(symbol),
+                tz=meta["tz"],
+                covered=tuple(meta["covered"]) if meta.get("covered") else None,
+                timestamps=load("timestamp"),
+                columns={f: load(f) for f in meta["fields"]},
+            )
+            self._open[key] = series
+            return series
+
+    def covers(self, symbol: str, unit: Unit, interval: int, start, end, *, api: QKApi | None = None) -> bool:
+        series = self.open(symbol, unit, interval, api=api)
+        if series is None or series.covered is None:
+            return False
+        first, last = series.covered
+        return _day(first) <= _day(start) and _day(end) <= _day(last)
+
+    # ---------------- WRITE ----------------
+
+    def write(
+        self,
+        symbol: str,
+        df: pd.DataFrame,
+        *,
+        unit: Unit = Unit.days,
+        interval: int = 1,
+        api: QKApi | None = None,
+        covered: tuple | None = None,
+        merge: bool = True,
+    ) -> StoredSeries:
+        """
+        Store a fetcher-schema frame. merge=True keeps stored bars outside
+        the new frame's rows (new rows win on equal timestamps) and widens
+        `covered` when the two date ranges touch; covered=None leaves the
+        stored range as it was.
+        """
+        stamps = pd.DatetimeIndex(df["timestamp"])
+        tz = str(stamps.tz) if stamps.tz is not None else None
+        fields = [f for f in FIELDS if f in df.columns]
+
+        new = {"timestamp": stamps.as_unit("ns").asi8}
+        new.update({f: df[f].to_numpy() for f in fields})
+        if not stamps.is_monotonic_increasing:
+            order = np.argsort(new["timestamp"], kind="stable")
+            new = {k: v[order] for k, v in new.items()}
+        if covered is not None:
+            covered = (str(_day(covered[0]).date()), str(_day(covered[1]).date()))
+
+        with self._lock:
+            old = self.open(symbol, unit, interval, api=api) if merge else None
+            if old is not None and old.tz == tz and set(old.columns) == set(fields) and len(old):
+                if covered is None or old.covered is None or _touches(old.covered, covered):
+                    new, covered = _merge(old, new, covered)
+
+            path = self._dir(symbol, unit, interval, api)
+            path.mkdir(parents=True, exist_ok=True)
+            prev = self._read_meta(path)
+            gen = prev["generation"] + 1 if prev else 0
+
+            for name, arr in new.items():
+                np.save(path / f"{name}.{gen}.npy", np.ascontiguousarray(arr))
+
+            meta = {"generation": gen, "tz": tz, "fields": fields, "covered": covered, "rows": len(new["timestamp"])}
+            tmp = path / "meta.json.tmp"
+            tmp.write_text(json.dumps(meta))
+            os.replace(tmp, path / "meta.json")
+
+            self._open.pop((api, str(symbol), unit, interval), None)
+            self._sweep(path, gen)
+            return self.open(symbol, unit, interval, api=api)
+
+    @staticmethod
+    def _sweep(path: Path, gen: int) -> None:
+        for file in path.glob("*.npy"):
+            if not file.name.endswith(f".{gen}.npy"):
+                try:
+                    file.unlink()
+                except OSError:
+                    pass  # still mapped (Windows); next write retries
+
+    def delete(self, symbol: str, unit: Unit = Unit.days, interval: int = 1, *, api: QKApi | None = None) -> None:
+        with self._lock:
+            self._open.pop((api, str(symbol), unit, interval), None)
+            path = self._dir(symbol, unit, interval, api)
+            try:
+                (path / "meta.json").unlink()
+            except FileNotFoundError:
+                return
+            self._sweep(path, -1)
+
+    def close(self) -> None:
+        """
+        Drop cached mappings (they close once no frame references them).
+        """
+        with self._lock:
+            self._open.clear()
+
+
+def _touches(a: tuple[str, str], b: tuple[str, str]) -> bool:
+    one_day = pd.Timedelta(days=1)
+    return _day(a[0]) <= _day(b[1]) + one_day and _day(b[0]) <= _day(a[1]) + one_day
+
+
+def _merge(old: StoredSeries, new: dict, covered):
+    stamps = new["timestamp"]
+    if len(stamps):
+        # stored rows outside the new frame's span survive
+        lo = np.searchsorted(old.timestamps, stamps[0], side="left")
+        hi = np.searchsorted(old.timestamps, stamps[-1], side="right")
+    else:
+        lo = hi = len(old)
+
+    def join(stored, fresh):
+        return np.concatenate([stored[:lo], fresh, stored[hi:]])
+
+    merged = {"timestamp": join(old.timestamps, stamps)}
+    merged.update({k: join(old.columns[k], v) for k, v in new.items() if k != "timestamp"})
+
+    if covered is None:
+        covered = old.covered
+    elif old.covered is not None:
+        covered = (min(old.covered[0], covered[0]), max(old.covered[1], covered[1]))
+    return merged, covered
@@ -0,0 +1,60 @@
+# data/fetch_request.py
+from dataclasses import dataclass, replace
+
+from core.common_types import QKApi, QKDate, Unit
+
+
+def _as_date(value) -> QKDate | None:
+    if value is None or isinstance(value, QKDate):
+        return value
+    return QKDate(value)
+
+
+@dataclass(frozen=True)
+class QKFetchRequest:
+    """
+    Immutable description of one fetch.
+    Passed through fetch + compute instead of mutating shared managers,
+    so one request can be served from many threads at once.
+    """
+    api: QKApi = QKApi.yfinance
+    from_date: QKDate | None = None
+    to_date: QKDate | None = None
+    unit: Unit = Unit.days
+    interval: int = 1
+    intraday_interval: int = 1
+    mode: str = "historical"
+    exchange: str = "NSE"
+
+    def __post_init__(self):
+        # normalize str dates once; frozen → bypass __setattr__
+        object.__setattr__(self, "from_date", _as_date(self.from_date))
+        object.__setattr__(self, "to_date", _as_date(self.to_date))
+
+        if self.mode not in ("historical", "intraday"):
+            raise ValueError(f"Unknown fetch mode: {self.mode!r}")
+
+    @property
+    def intraday(self) -> bool:
+        return self.mode == "intraday"
+
+    @classmethod
+    def from_config(cls, api: QKApi, fetch_config: dict) -> "QKFetchRequest":
+        """
+        Build from the GUI "Fetch Config" panel values.
+        """
+        kwargs = dict(
+            api=api,
+            from_date=fetch_config.get("from_date"),
+            to_date=fetch_config.get("to_date"),
+            mode=fetch_config.get("mode") or "historical",
+        )
+
+        for key in ("unit", "interval", "intraday_interval", "exchange"):
+            if fetch_config.get(key) is not None:
+                kwargs[key] = fetch_config[key]
+
+        return cls(**kwargs)
+
+    def with_api(self, api: QKApi) -> "QKFetchRequest":
+        return replace(self, api=api)
@@ -1,15 +1,22 @@
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from typing import Iterable
+import numpy as np
 import pandas as pd
 
 from core.common_types import QKCandle, Unit
 from core.common_types import QKDate
+from core.profiler import profiler
+from core.time_index import ensure_sorted
 
 
 class DataFetcherBase(ABC):
     """
     Enforced contract for any market data provider.
+
+    _fetch_historical / _fetch_intraday return either QKCandle-like rows
+    or, for providers that already hold columnar data, a DataFrame with
+    the schema columns (normalized without per-row objects).
     """
     supports_intraday: bool = True
     supports_historical: bool = True
@@ -28,7 +35,7 @@ class DataFetcherBase(ABC):
         end: datetime,
         unit: Unit,
         interval: int,
-    ) -> Iterable[QKCandle]:
+    ) -> Iterable[QKCandle] | pd.DataFrame:
         pass
 
     @abstractmethod
@@ -37,9 +44,23 @@ class DataFetcherBase(ABC):
         symbol: str,
         unit: Unit,
         interval: int,
-    ) -> Iterable[QKCandle]:
+    ) -> Iterable[QKCandle] | pd.DataFrame:
         pass
 
+    # ---------------- LIFECYCLE ----------------
+
+    def health_check(self) -> bool:
+        """
+        Cheap liveness probe. Override for providers with sessions.
+        """
+        return True
+
+    def close(self) -> None:
+        """
+        Release sessions / clients. Override if the provider holds any.
+        """
+        return
+
     # ---------------- SHARED UTIL ----------------
 
     @staticmethod
@@ -58,6 +79,30 @@ class DataFetcherBase(ABC):
             }
         )
 
+    @staticmethod
+    def _normalize_df(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Columnar provider frame → fetcher schema: float64 prices, int64
+        volume (missing → 0), adjclose falling back to close.
+        Columns are taken as arrays; nothing is built per row.
+        """
+        close = df["close"].to_numpy(dtype=np.float64)
+        adjclose = df["adjclose"].to_numpy(dtype=np.float64) if "adjclose" in df else close
+        volume = df["volume"].to_numpy(dtype=np.float64, na_value=0.0)
+
+        return pd.DataFrame(
+            {
+                "timestamp": pd.DatetimeIndex(df["timestamp"]),
+                "open": df["open"].to_numpy(dtype=np.float64),
+                "high": df["high"].to_numpy(dtype=np.float64),
+                "low": df["low"].to_numpy(dtype=np.float64),
+                "close": close,
+                "adjclose": adjclose,
+                "volume": volume.astype(np.int64),
+            },
+            copy=False,
+        )
+
     # ---------------- PUBLIC ENTRYPOINT ----------------
 
     def fetch_df(
@@ -84,11 +129,12 @@ class DataFetcherBase(ABC):
             if not self.supports_intraday:
                 raise RuntimeError("Intraday data not supported by this fetcher")
 
-            candles = self._fetch_intraday(
-                symbol=symbol,
-                unit=unit,
-                interval=interval,
-            )
+            with profiler.stage(f"fetch:{type(self).__name__}"):
+                candles = self._fetch_intraday(
+                    symbol=symbol,
+                    unit=unit,
+                    interval=interval,
+                )
 
         else:
             if not self.supports_historical:
@@ -97,15 +143,26 @@ class DataFetcherBase(ABC):
             if start is None or end is None:
                 raise ValueError("start and end must be provided for historical data")
 
-            candles = self._fetch_historical(
-                symbol=symbol,
-                start=start,
-                end=end,
-                unit=unit,
-                interval=interval,
-            )
+            with profiler.stage(f"fetch:{type(self).__name__}"):
+                candles = self._fetch_historical(
+                    symbol=symbol,
+                    start=start,
+                    end=end,
+                    unit=unit,
+                    interval=interval,
+                )
+
+        with profiler.stage("candles_to_df") as span:
+            if isinstance(candles, pd.DataFrame):
+                df = self._normalize_df(candles)
+            else:
+                df = self._candles_to_df(candles)
+            # sorted by time → range lookups downstream are binary searches
+            df = ensure_sorted(df)
+            span.rows = len(df)
+            span.bytes = int(df.memory_usage(index=False).sum())
 
-        return self._candles_to_df(candles)
+        return df
 
     # ---------------- DEBUG ----------------
 
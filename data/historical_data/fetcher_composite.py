@@ -0,0 +1,370 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from core.common_types import QKApi, Unit
+from data.historical_data.base.data_fetcher_base import DataFetcherBase, QKCandle
+
+
+class ProviderStats:
+    """
+    Rolling latency / error record for one provider.
+    """
+
+    def __init__(self, window: int = 200):
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._errors: deque[bool] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+        self.hedges_won = 0      # won by a request the hedge timer started
+        self.failovers_won = 0   # won after every earlier provider failed
+        self.probes = 0
+        # last time this provider was sent a request (or created)
+        self._last_used = time.monotonic()
+
+    def record(self, latency: float, ok: bool) -> None:
+        with self._lock:
+            self._last_used = time.monotonic()
+            self.requests += 1
+            self._errors.append(not ok)
+            if ok:
+                self._latencies.append(latency)
+            else:
+                self.failures += 1
+
+    def samples(self) -> int:
+        return len(self._latencies)
+
+    def claim_probe(self, interval: float) -> bool:
+        """
+        True (once per `interval`) if the provider has not been used for
+        `interval` seconds: the caller then routes a request to it, so
+        its stats don't freeze while it is out of rotation.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_used < interval:
+                return False
+            self._last_used = now
+            self.probes += 1
+            return True
+
+    def percentile(self, q: float) -> float | None:
+        with self._lock:
+            if not self._latencies:
+                return None
+            return float(np.percentile(self._latencies, q))
+
+    @property
+    def error_rate(self) -> float:
+        with self._lock:
+            if not self._errors:
+                return 0.0
+            return sum(self._errors) / len(self._errors)
+
+    def score(self) -> float:
+        """
+        Lower is better: median latency inflated by recent error rate.
+        """
+        p50 = self.percentile(50)
+        if p50 is None:
+            return 0.0
+        return p50 * (1.0 + 10.0 * self.error_rate)
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "error_rate": round(self.error_rate, 4),
+            "p50_s": self.percentile(50),
+            "p95_s": self.percentile(95),
+            "hedges_won": self.hedges_won,
+            "failovers_won": self.failovers_won,
+            "probes": self.probes,
+        }
+
+
+class CompositeFetcher(DataFetcherBase):
+    """
+    Fetch through several providers for the same instrument.
+
+    - Providers are tried in priority order (or by observed score when
+      `adaptive`); a failing / empty provider falls over to the next.
+    - If the running request exceeds that provider's latency percentile,
+      a hedged request is sent to the next provider; first good answer wins.
+    - `resolver` (an InstrumentMaster) translates the caller's ticker into
+      each provider's identifier; providers that don't list it are skipped.
+    - With `adaptive`, a provider left out of rotation for `probe_interval`
+      seconds is put first for one request, so a provider that was slow
+      or failing can win its place back once it recovers.
+
+    The provider hooks delegate to the first provider in that order, for
+    callers that drive a fetcher through them directly.
+    """
+
+    def __init__(
+        self,
+        providers: Iterable[tuple[QKApi, DataFetcherBase]],
+        *,
+        resolver=None,
+        source_api: QKApi | None = None,
+        hedge_percentile: float = 95.0,
+        min_samples: int = 20,
+        adaptive: bool = True,
+        probe_interval: float | None = 60.0,
+        max_workers: int = 8,
+    ):
+        self.providers: list[tuple[QKApi, DataFetcherBase]] = list(providers)
+        if not self.providers:
+            raise ValueError("CompositeFetcher needs at least one provider")
+
+        self.resolver = resolver
+        self.source_api = source_api
+        self.hedge_percentile = hedge_percentile
+        self.min_samples = min_samples
+        self.adaptive = adaptive
+        self.probe_interval = probe_interval
+
+        self.stats: dict[QKApi, ProviderStats] = {
+            api: ProviderStats() for api, _ in self.providers
+        }
+
+        self.supports_intraday = any(f.supports_intraday for _, f in self.providers)
+        self.supports_historical = any(f.supports_historical for _, f in self.providers)
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="qk-fetch",
+        )
+
+    # ---------------- PROVIDER HOOKS ----------------
+
+    def _connect(self) -> None:
+        return  # providers connect in their own calls
+
+    def _primary(self, symbol: str, intraday: bool) -> tuple[DataFetcherBase, str]:
+        # no probing: hook calls bypass the stats
+        queue = self._ordered(symbol, intraday, probe=False)
+        if not queue:
+            raise RuntimeError(f"No provider can serve {symbol!r}")
+        _, fetcher, ident = queue[0]
+        fetcher._connect()
+        return fetcher, ident
+
+    def _fetch_historical(
+        self,
+        symbol: str,
+        start: datetime,
+        end: datetime,
+        unit: Unit,
+        interval: int,
+    ) -> Iterable[QKCandle] | pd.DataFrame:
+        fetcher, ident = self._primary(symbol, intraday=False)
+        return fetcher._fetch_historical(ident, start, end, unit, interval)
+
+    def _fetch_intraday(
+        self,
+        symbol: str,
+        unit: Unit,
+        interval: int,
+    ) -> Iterable[QKCandle] | pd.DataFrame:
+        fetcher, ident = self._primary(symbol, intraday=True)
+        return fetcher._fetch_intraday(ident, unit, interval)
+
+    # ---------------- ROUTING ----------------
+
+    def _ordered(self, symbol, intraday: bool, probe: bool = True) -> list[tuple[QKApi, DataFetcherBase, str]]:
+        candidates = []
+        for priority, (api, fetcher) in enumerate(self.providers):
+            if intraday and not fetcher.supports_intraday:
+                continue
+            if not intraday and not fetcher.supports_historical:
+                continue
+
+            if self.resolver is None:
+                ident = symbol
+            else:
+                ident = self.resolver.translate(symbol, self.source_api, api)
+                if ident is None:
+                    continue
+
+            stats = self.stats[api]
+            warm = stats.samples() >= self.min_samples
+            score = stats.score() if (self.adaptive and warm) else None
+            candidates.append((priority, score, api, fetcher, ident))
+
+        if self.adaptive:
+            # warmed-up providers by score; cold ones keep priority order
+            candidates.sort(
+                key=lambda c: (c[1] is None, c[1] or 0.0, c[0])
+            )
+
+            # one request to a provider idle for probe_interval refreshes
+            # its stats (the hedge still covers a slow probe)
+            if probe and self.probe_interval is not None:
+                for i in range(1, len(candidates)):
+                    if self.stats[candidates[i][2]].claim_probe(self.probe_interval):
+                        candidates.insert(0, candidates.pop(i))
+                        break
+
+        return [(api, fetcher, ident) for _, _, api, fetcher, ident in candidates]
+
+    def _hedge_delay(self, api: QKApi) -> float | None:
+        stats = self.stats[api]
+        if stats.samples() < self.min_samples:
+            return None
+        return stats.percentile(self.hedge_percentile)
+
+    def _submit(self, api: QKApi, fetcher: DataFetcherBase, kwargs: dict) -> Future:
+        stats = self.stats[api]
+
+        def call():
+            t0 = time.perf_counter()
+            try:
+                df = fetcher.fetch_df(**kwargs)
+            except Exception:
+                stats.record(time.perf_counter() - t0, ok=False)
+                raise
+            stats.record(time.perf_counter() - t0, ok=not df.empty)
+            return df
+
+        return self._pool.submit(call)
+
+    # ---------------- PUBLIC ENTRYPOINT ----------------
+
+    def fetch_df(
+            self,
+            *,
+            symbol: str,
+            intraday: bool,
+            start=None,
+            end=None,
+            unit: Unit = Unit.days,
+            interval: int = 1,
+    ) -> pd.DataFrame:
+
+        queue = self._ordered(symbol, intraday)
+        if not queue:
+            raise RuntimeError(f"No provider can serve {symbol!r}")
+
+        base_kwargs = dict(
+            intraday=intraday,
+            start=start,
+            end=end,
+            unit=unit,
+            interval=interval,
+        )
+
+        # future → (provider, started by the hedge timer)
+        pending: dict[Future, tuple[QKApi, bool]] = {}
+        errors: list[str] = []
+        empty: pd.DataFrame | None = None
+        first_api = queue[0][0]
+
+        def launch_next(hedge: bool = False) -> bool:
+            if not queue:
+                return False
+            api, fetcher, ident = queue.pop(0)
+            pending[self._submit(api, fetcher, {**base_kwargs, "symbol": ident})] = (api, hedge)
+            return True
+
+        launch_next()
+
+        while pending:
+            # hedge only while a single request is in flight
+            timeout = None
+            if len(pending) == 1 and queue:
+                timeout = self._hedge_delay(next(iter(pending.values()))[0])
+
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                # 🔥 slow tail → hedge to the next provider
+                launch_next(hedge=True)
+                continue
+
+            for fut in done:
+                api, hedged = pending.pop(fut)
+                try:
+                    df = fut.result()
+                except Exception as e:
+                    errors.append(f"{api.name}: {type(e).__name__}: {e}")
+                    continue
+
+                if df.empty:
+                    empty = df
+                    continue
+
+                if hedged:
+                    self.stats[api].hedges_won += 1
+                elif api != first_api:
+                    self.stats[api].failovers_won += 1
+                return df
+
+            # everything in flight failed → fail over
+            if not pending:
+                launch_next()
+
+        if empty is not None:
+            return empty
+
+        raise RuntimeError(
+            f"All providers failed for {symbol!r}: " + "; ".join(errors)
+        )
+
+    # ---------------- INSPECTION ----------------
+
+    def stats_report(self) -> dict[str, dict]:
+        return {api.name: s.snapshot() for api, s in self.stats.items()}
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+if __name__ == "__main__":
+    import random
+    from core.test_data_generator import make_test_df
+
+    class _FakeFetcher(DataFetcherBase):
+        def __init__(self, delay: float, fail_rate: float = 0.0):
+            self.delay = delay
+            self.fail_rate = fail_rate
+
+        def _connect(self) -> None:
+            return
+
+        def _fetch_historical(self, symbol, start, end, unit, interval):
+            time.sleep(self.delay * random.uniform(0.5, 3.0))
+            if random.random() < self.fail_rate:
+                raise ConnectionError("simulated outage")
+            return make_test_df(50).itertuples(index=False)
+
+        def _fetch_intraday(self, symbol, unit, interval):
+            return self._fetch_historical(symbol, None, None, unit, interval)
+
+    fetcher = CompositeFetcher(
+        [
+            (QKApi.upstox, _FakeFetcher(0.02, fail_rate=0.2)),
+            (QKApi.dhan, _FakeFetcher(0.03)),
+        ],
+        min_samples=5,
+    )
+
+    for i in range(60):
+        fetcher.fetch_df(
+            symbol="DEMO",
+            intraday=False,
+            start=datetime(2025, 1, 1),
+            end=datetime(2025, 2, 1),
+        )
+
+    for name, snap in fetcher.stats_report().items():
+        print(name, snap)
+    fetcher.close()
@@ -25,6 +25,10 @@ class DhanFetcher(DataFetcherBase):
         # Session is created in __init__
         return
 
+    def health_check(self) -> bool:
+        response = self.dhan.get_fund_limits()
+        return bool(response) and response.get("status") == "success"
+
     # ---------- HISTORICAL (DAILY) ----------
     # ---------- HISTORICAL (DAILY ONLY) ----------
     def _fetch_historical(
@@ -0,0 +1,165 @@
+import threading
+from typing import Callable, Iterable
+
+from core.common_types import QKApi
+from data.historical_data.base.data_fetcher_base import DataFetcherBase
+from data.historical_data.fetcher_composite import CompositeFetcher
+
+
+FetcherFactory = Callable[[], DataFetcherBase]
+
+
+def _default_factories() -> dict[QKApi, FetcherFactory]:
+    # imported lazily: provider SDKs are only needed once used
+    def yfinance():
+        from data.historical_data.fetcher_yfinance import YahooFetcher
+        return YahooFetcher()
+
+    def upstox():
+        from data.historical_data.fetcher_upstox import UpstoxFetcher
+        return UpstoxFetcher()
+
+    def dhan():
+        from data.historical_data.fetcher_dhan import DhanFetcher
+        return DhanFetcher()
+
+    return {
+        QKApi.yfinance: yfinance,
+        QKApi.upstox: upstox,
+        QKApi.dhan: dhan,
+    }
+
+
+class FetcherRegistry:
+    """
+    One fetcher (and its session / client) per QKApi.
+
+    Fetchers are created lazily on first use and reused afterwards.
+    Thread-safe: concurrent get() calls for the same api build one instance.
+    """
+
+    _shared: "FetcherRegistry | None" = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, factories: dict[QKApi, FetcherFactory] | None = None):
+        self._factories: dict[QKApi, FetcherFactory] = (
+            _default_factories() if factories is None else dict(factories)
+        )
+        self._fetchers: dict[QKApi, DataFetcherBase] = {}
+        self._composites: dict[tuple, CompositeFetcher] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def shared(cls) -> "FetcherRegistry":
+        """
+        Process-wide default registry.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    # ---------------- REGISTRATION ----------------
+
+    def register(self, api: QKApi, factory: FetcherFactory) -> None:
+        """
+        Replace the factory for `api`; an existing instance is closed.
+        """
+        with self._lock:
+            self._factories[api] = factory
+            self._drop(api)
+
+    # ---------------- ACCESS ----------------
+
+    def get(self, api: QKApi) -> DataFetcherBase:
+        fetcher = self._fetchers.get(api)
+        if fetcher is not None:
+            return fetcher
+
+        with self._lock:
+            fetcher = self._fetchers.get(api)
+            if fetcher is None:
+                factory = self._factories.get(api)
+                if factory is None:
+                    raise ValueError(f"No fetcher registered for {api}")
+                fetcher = factory()
+                self._fetchers[api] = fetcher
+            return fetcher
+
+    def failover(self, apis: Iterable[QKApi], **kwargs) -> CompositeFetcher:
+        """
+        Composite over pooled fetchers, cached per (apis, options).
+        """
+        apis = tuple(apis)
+        key = (apis, tuple(sorted(kwargs.items(), key=lambda kv: kv[0])))
+
+        with self._lock:
+            composite = self._composites.get(key)
+            if composite is None:
+                composite = CompositeFetcher(
+                    [(api, self.get(api)) for api in apis],
+                    **kwargs,
+                )
+                self._composites[key] = composite
+            return composite
+
+    def active(self) -> list[QKApi]:
+        return list(self._fetchers)
+
+    # ---------------- HEALTH ----------------
+
+    def health_check(
+        self,
+        api: QKApi | None = None,
+        *,
+        recreate: bool = False,
+    ) -> dict[QKApi, bool]:
+        """
+        Probe live fetchers (or just `api`).
+        With recreate=True an unhealthy fetcher is closed and dropped,
+        so the next get() builds a fresh one.
+        """
+        targets = [api] if api is not None else self.active()
+        result = {}
+
+        for target in targets:
+            try:
+                healthy = bool(self.get(target).health_check())
+            except Exception as e:
+                print(f"[ERROR] Health check failed for {target.name}: {e}")
+                healthy = False
+
+            result[target] = healthy
+
+            if not healthy and recreate:
+                with self._lock:
+                    self._drop(target)
+
+        return result
+
+    # ---------------- TEARDOWN ----------------
+
+    def close(self, api: QKApi | None = None) -> None:
+        with self._lock:
+            targets = [api] if api is not None else list(self._fetchers)
+            for target in targets:
+                self._drop(target)
+
+    def _drop(self, api: QKApi) -> None:
+        # composites hold references to the pooled fetcher → drop them too
+        for key in [k for k in self._composites if api in k[0]]:
+            self._composites.pop(key).close()
+
+        fetcher = self._fetchers.pop(api, None)
+        if fetcher is not None:
+            try:
+                fetcher.close()
+            except Exception as e:
+                print(f"[ERROR] Closing {api.name} fetcher: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
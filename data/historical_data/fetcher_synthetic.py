@@ -0,0 +1,74 @@
+import math
+from datetime import datetime
+
+import pandas as pd
+
+from core.common_types import Unit
+from core.market_calendar import bar_minutes
+from core.synthetic_market import SyntheticMarket
+from data.historical_data.base.data_fetcher_base import DataFetcherBase
+
+
+class SyntheticFetcher(DataFetcherBase):
+    """
+    Offline fetcher for benchmarks / load tests.
+
+    Candles come from SyntheticMarket: NSE sessions and holidays,
+    overnight gaps, correlated returns, deterministic per (seed, symbol).
+    No network, no credentials.
+
+    rows=None → the requested date range decides the bar count;
+    rows=N    → exactly N bars from `start` (historical) or
+                up to the latest session (intraday).
+    """
+
+    supports_intraday = True
+    supports_historical = True
+
+    def __init__(
+        self,
+        rows: int | None = None,
+        seed: int = 0,
+        market: SyntheticMarket | None = None,
+    ):
+        self.rows = rows
+        self.market = market or SyntheticMarket(seed=seed)
+
+    def _connect(self) -> None:
+        return
+
+    def _sessions_for(self, unit: Unit, interval: int, rows: int) -> int:
+        per_day = self.market.calendar.bars_per_session(bar_minutes(unit, interval))
+        return max(1, math.ceil(rows / per_day))
+
+    def _fetch_historical(
+        self,
+        symbol: str,
+        start: datetime,
+        end: datetime,
+        unit: Unit,
+        interval: int,
+    ) -> pd.DataFrame:
+        if self.rows is None:
+            days = self.market.days(start, end)
+            return self.market.frame(symbol, days, unit=unit, interval=interval)
+
+        sessions = self._sessions_for(unit, interval, self.rows)
+        days = self.market.days(start, sessions=sessions)
+        df = self.market.frame(symbol, days, unit=unit, interval=interval)
+        return df.head(self.rows)
+
+    def _fetch_intraday(
+        self,
+        symbol: str,
+        unit: Unit,
+        interval: int,
+    ) -> pd.DataFrame:
+        sessions = self._sessions_for(unit, interval, self.rows) if self.rows else 1
+        days = self.market.days(sessions=sessions)
+        df = self.market.frame(symbol, days, unit=unit, interval=interval)
+        return df.tail(self.rows) if self.rows else df
+
+
+if __name__ == "__main__":
+    SyntheticFetcher().debug_test("DEMO")
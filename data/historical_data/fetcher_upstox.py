@@ -15,6 +15,8 @@ class UpstoxFetcher(DataFetcherBase):
     supports_historical = True
 
     BASE_URL = "https://api.upstox.com/v3"
+    PROFILE_URL = "https://api.upstox.com/v2/user/profile"
+    TIMEOUT = 30
 
     _UNIT_MAP = {
         Unit.minutes: "minutes",
@@ -26,9 +28,23 @@ class UpstoxFetcher(DataFetcherBase):
 
     def __init__(self):
         self.access_token = get_env("UPSTOX_ACCESS_TOKEN")
+        # pooled keep-alive connections, reused across requests
+        self._session: requests.Session | None = None
 
     def _connect(self) -> None:
-        return
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update(self._headers())
+
+    def health_check(self) -> bool:
+        self._connect()
+        response = self._session.get(self.PROFILE_URL, timeout=self.TIMEOUT)
+        return response.status_code == 200
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     def _headers(self) -> dict:
         return {
@@ -51,7 +67,7 @@ class UpstoxFetcher(DataFetcherBase):
             f"{symbol}/{unit_str}/{interval}"
         )
 
-        response = requests.get(url, headers=self._headers())
+        response = self._session.get(url, timeout=self.TIMEOUT)
         response.raise_for_status()
 
         candles = response.json().get("data", {}).get("candles", [])
@@ -86,7 +102,7 @@ class UpstoxFetcher(DataFetcherBase):
             f"{end.date()}/{start.date()}"
         )
 
-        response = requests.get(url, headers=self._headers())
+        response = self._session.get(url, timeout=self.TIMEOUT)
         response.raise_for_status()
 
         candles = response.json().get("data", {}).get("candles", [])
@@ -1,5 +1,4 @@
 import pandas as pd
-import yfinance as yf
 from datetime import datetime
 from typing import Iterable
 
@@ -22,6 +21,42 @@ class YahooFetcher(DataFetcherBase):
         Unit.weeks: "wk",
         Unit.months: "mo",
     }
+
+    # yfinance column → fetcher schema
+    _COLUMNS = {
+        "Open": "open",
+        "High": "high",
+        "Low": "low",
+        "Close": "close",
+        "Adj Close": "adjclose",
+        "Volume": "volume",
+    }
+
+    @staticmethod
+    def _history(symbol: str, **kwargs) -> pd.DataFrame:
+        import yfinance as yf  # only needed once Yahoo is actually used
+
+        # per-ticker request: unlike yf.download it shares no module-level
+        # result state, so pipeline threads can fetch concurrently
+        return yf.Ticker(symbol).history(**kwargs)
+
+    @classmethod
+    def _to_frame(cls, raw: pd.DataFrame) -> pd.DataFrame:
+        """
+        yfinance result (DatetimeIndex; (Price, Ticker) MultiIndex
+        columns are flattened) → schema-named columns over the same
+        arrays. Typing is left to DataFetcherBase._normalize_df.
+        """
+        columns = raw.columns
+        if isinstance(columns, pd.MultiIndex):
+            columns = columns.get_level_values(0)
+
+        data = {"timestamp": pd.DatetimeIndex(raw.index)}
+        for pos, name in enumerate(columns):
+            if name in cls._COLUMNS:
+                data[cls._COLUMNS[name]] = raw.iloc[:, pos].to_numpy()
+        return pd.DataFrame(data, copy=False)
+
     # ---------- HISTORICAL ----------
     def _fetch_historical(
         self,
@@ -30,57 +65,14 @@ class YahooFetcher(DataFetcherBase):
         end: datetime,
         unit: Unit,
         interval: int,
-    ) -> Iterable[QKCandle]:
+    ) -> Iterable[QKCandle] | pd.DataFrame:
 
         yahoo_interval = f"{interval}{self._UNIT_MAP[unit]}"
 
-        df = yf.download(
-            symbol,
-            start=start,
-            end=end,
-            interval=yahoo_interval,
-            progress=False,
-        )
-
+        df = self._history(symbol, start=start, end=end, interval=yahoo_interval)
         if df.empty:
             return []
-
-        df = df.reset_index()
-
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.get_level_values(0)
-
-        time_col = "Datetime" if "Datetime" in df.columns else "Date"
-        df["timestamp"] = pd.to_datetime(df[time_col])
-
-        df.rename(
-            columns={
-                "Open": "open",
-                "High": "high",
-                "Low": "low",
-                "Close": "close",
-                "Adj Close": "adjclose",
-                "Volume": "volume",
-            },
-            inplace=True,
-        )
-
-        if "adjclose" not in df:
-            df["adjclose"] = df["close"]
-        return (
-            QKCandle(
-                timestamp=row["timestamp"],
-                open=row["open"],
-                high=row["high"],
-                low=row["low"],
-                close=row["close"],
-                adjclose=row["adjclose"],
-                volume=row["volume"],
-            )
-            for row in df.to_dict("records")
-        )
-
-
+        return self._to_frame(df)
 
     # ---------- INTRADAY ----------
     def _fetch_intraday(
@@ -88,55 +80,14 @@ class YahooFetcher(DataFetcherBase):
         symbol: str,
         unit: Unit,
         interval: int
-    ) -> Iterable[QKCandle]:
+    ) -> Iterable[QKCandle] | pd.DataFrame:
 
         yahoo_interval = f"{interval}{unit.value}"
 
-        df = yf.download(
-            symbol,
-            interval=yahoo_interval,
-            period="1d",
-            progress=False
-        )
-
+        df = self._history(symbol, interval=yahoo_interval, period="1d")
         if df.empty:
             return []
-
-        df = df.reset_index()
-
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.get_level_values(0)
-
-        time_col = "Datetime" if "Datetime" in df.columns else "Date"
-        df["timestamp"] = pd.to_datetime(df[time_col])
-
-        df.rename(
-            columns={
-                "Open": "open",
-                "High": "high",
-                "Low": "low",
-                "Close": "close",
-                "Adj Close": "adjclose",
-                "Volume": "volume",
-            },
-            inplace=True,
-        )
-
-        if "adjclose" not in df:
-            df["adjclose"] = df["close"]
-
-        return (
-            QKCandle(
-                timestamp=row["timestamp"],
-                open=row["open"],
-                high=row["high"],
-                low=row["low"],
-                close=row["close"],
-                adjclose=row["adjclose"],
-                volume=row["volume"],
-            )
-            for row in df.to_dict("records")
-        )
+        return self._to_frame(df)
 
 
 if __name__ == "__main__":
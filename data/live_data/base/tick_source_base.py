@@ -0,0 +1,56 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
+
+from core.common_types import QKTick
+
+
+class TickSourceBase(ABC):
+    """
+    Enforced contract for any live (or replayed) stream of trades.
+
+    Iterating a source connects it and yields QKTick until the stream
+    ends or close() is called (from any thread).
+    """
+
+    _stopped: bool = False
+
+    # ---------------- LOW-LEVEL PROVIDER HOOKS ----------------
+
+    @abstractmethod
+    def _connect(self) -> None:
+        pass
+
+    @abstractmethod
+    def _read(self) -> Iterable[QKTick]:
+        pass
+
+    # ---------------- LIFECYCLE ----------------
+
+    def close(self) -> None:
+        """
+        Stop the stream. Override to also release sockets / files.
+        """
+        self._stopped = True
+
+    @property
+    def closed(self) -> bool:
+        return self._stopped
+
+    def now_ns(self) -> int:
+        """
+        Current stream time (epoch ns). Wall clock for live feeds;
+        replays override it with the time of the last emitted tick.
+        """
+        return time.time_ns()
+
+    # ---------------- PUBLIC ENTRYPOINT ----------------
+
+    def __iter__(self) -> Iterator[QKTick]:
+        self._stopped = False
+        self._connect()
+
+        for tick in self._read():
+            if self._stopped:
+                return
+            yield tick
@@ -0,0 +1,269 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from core.common_types import QKCandle, QKTick
+from core.market_calendar import NSE, MarketCalendar
+from core.time_index import epoch_ns
+
+
+NS_PER_MIN = 60_000_000_000
+MIN_PER_DAY = 1440
+
+
+class _Bar:
+    """
+    The in-progress bar of one symbol.
+    """
+    __slots__ = ("start", "open", "high", "low", "close", "volume")
+
+    def __init__(self, start: int, price: float, volume: int):
+        self.start = start
+        self.open = self.high = self.low = self.close = price
+        self.volume = volume
+
+    def add(self, price: float, volume: int) -> None:
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += volume
+
+
+class CandleRing:
+    """
+    Fixed-capacity bar history of one symbol in preallocated arrays.
+    Oldest bars are overwritten once full.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamp = np.zeros(capacity, dtype=np.int64)
+        self.ohlc = np.zeros((capacity, 4), dtype=np.float64)
+        self.volume = np.zeros(capacity, dtype=np.int64)
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, bar: _Bar) -> None:
+        i = self._next
+        self.timestamp[i] = bar.start
+        self.ohlc[i] = (bar.open, bar.high, bar.low, bar.close)
+        self.volume[i] = bar.volume
+        self._next = (i + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def extend(self, timestamp_ns: np.ndarray, ohlc: np.ndarray, volume: np.ndarray) -> None:
+        """
+        Bulk-load history (e.g. a fetched warm-up window), oldest first.
+        """
+        n = min(len(timestamp_ns), self.capacity)
+        idx = (self._next + np.arange(n)) % self.capacity
+        self.timestamp[idx] = timestamp_ns[-n:]
+        self.ohlc[idx] = ohlc[-n:]
+        self.volume[idx] = volume[-n:]
+        self._next = (self._next + n) % self.capacity
+        self._count = min(self._count + n, self.capacity)
+
+    def last_timestamp(self) -> int | None:
+        if self._count == 0:
+            return None
+        return int(self.timestamp[self._next - 1])
+
+    def order(self) -> np.ndarray:
+        """
+        Physical positions, oldest → newest.
+        """
+        return (self._next - self._count + np.arange(self._count)) % self.capacity
+
+
+class CandleAggregator:
+    """
+    Tick → bar aggregation for many symbols.
+
+    Bars are `minutes` wide and anchored to the session open (09:15 for NSE),
+    so 5m bars are 09:15, 09:20, ... like the providers' intraday candles.
+    Ticks outside the session (pre-open) and late ticks for an already
+    closed bar are dropped and counted.
+
+    on_tick() is O(1); frames are only materialized on demand.
+    """
+
+    def __init__(
+        self,
+        minutes: int = 1,
+        capacity: int = 2_000,
+        calendar: MarketCalendar = NSE,
+    ):
+        if MIN_PER_DAY % minutes:
+            raise ValueError("Bar minutes must divide a day evenly")
+
+        self.minutes = minutes
+        self.capacity = capacity
+        self.calendar = calendar
+
+        self._bar_ns = minutes * NS_PER_MIN
+        self._utc_offset_min = int(
+            pd.Timestamp("2000-01-01", tz=calendar.tz).utcoffset().total_seconds() // 60
+        )
+        self._open_min = calendar.open_time.hour * 60 + calendar.open_time.minute
+        self._close_min = self._open_min + calendar.session_minutes
+        # UTC ns of a session open → every session open is on the bar grid
+        self._anchor_ns = (self._open_min - self._utc_offset_min) * NS_PER_MIN
+
+        self._rings: dict[str, CandleRing] = {}
+        self._partial: dict[str, _Bar] = {}
+        self._lock = threading.Lock()
+
+        self.dropped_off_session = 0
+        self.dropped_late = 0
+
+    # ---------------- INGEST ----------------
+
+    def _ring(self, symbol: str) -> CandleRing:
+        ring = self._rings.get(symbol)
+        if ring is None:
+            ring = self._rings[symbol] = CandleRing(self.capacity)
+        return ring
+
+    def bucket(self, ts_ns: int) -> int:
+        return ts_ns - (ts_ns - self._anchor_ns) % self._bar_ns
+
+    def on_tick(self, tick: QKTick) -> bool:
+        """
+        Apply one tick. Returns True if it closed the symbol's previous bar.
+        """
+        ts = tick.timestamp
+        local_min = (ts // NS_PER_MIN + self._utc_offset_min) % MIN_PER_DAY
+        if not self._open_min <= local_min < self._close_min:
+            self.dropped_off_session += 1
+            return False
+
+        start = self.bucket(ts)
+        symbol = tick.symbol
+
+        with self._lock:
+            bar = self._partial.get(symbol)
+
+            if bar is not None and start == bar.start:
+                bar.add(tick.price, tick.volume)
+                return False
+
+            if bar is not None and start < bar.start:
+                self.dropped_late += 1
+                return False
+
+            ring = self._ring(symbol)
+            last = ring.last_timestamp()
+            if bar is None and last is not None and start <= last:
+                self.dropped_late += 1
+                return False
+
+            self._partial[symbol] = _Bar(start, tick.price, tick.volume)
+            if bar is None:
+                return False
+
+            ring.append(bar)
+            return True
+
+    def close_due(self, now_ns: int) -> list[str]:
+        """
+        Close partial bars whose interval has ended (quiet symbols would
+        otherwise wait for their next tick). Returns affected symbols.
+        """
+        closed = []
+        with self._lock:
+            for symbol, bar in list(self._partial.items()):
+                if bar.start + self._bar_ns <= now_ns:
+                    self._ring(symbol).append(bar)
+                    del self._partial[symbol]
+                    closed.append(symbol)
+        return closed
+
+    def preload(self, symbol: str, df: pd.DataFrame) -> None:
+        """
+        Seed a symbol's history from fetched candles (fetcher schema),
+        so indicators have their warm-up before the first live bar.
+        """
+        ts = pd.to_datetime(df["timestamp"])
+        if ts.dt.tz is None:
+            ts = ts.dt.tz_localize(self.calendar.tz)
+
+        with self._lock:
+            self._ring(symbol).extend(
+                epoch_ns(ts),
+                df[["open", "high", "low", "close"]].to_numpy(dtype=np.float64),
+                df["volume"].to_numpy(dtype=np.int64),
+            )
+
+    # ---------------- READ ----------------
+
+    @property
+    def symbols(self) -> list[str]:
+        with self._lock:
+            return list(self._rings.keys() | self._partial.keys())
+
+    def frame(self, symbol: str, *, partial: bool = True) -> pd.DataFrame:
+        """
+        Bars of one symbol in the fetcher schema, oldest first.
+        partial=True appends the in-progress bar as the last row.
+        """
+        with self._lock:
+            ring = self._rings.get(symbol)
+            if ring is not None:
+                order = ring.order()
+                ts = ring.timestamp[order]
+                ohlc = ring.ohlc[order]
+                volume = ring.volume[order]
+            else:
+                ts = np.empty(0, dtype=np.int64)
+                ohlc = np.empty((0, 4))
+                volume = np.empty(0, dtype=np.int64)
+
+            bar = self._partial.get(symbol) if partial else None
+            if bar is not None:
+                ts = np.append(ts, bar.start)
+                ohlc = np.vstack([ohlc, (bar.open, bar.high, bar.low, bar.close)])
+                volume = np.append(volume, bar.volume)
+
+        return pd.DataFrame({
+            "timestamp": pd.to_datetime(ts, utc=True).tz_convert(self.calendar.tz),
+            "open": ohlc[:, 0],
+            "high": ohlc[:, 1],
+            "low": ohlc[:, 2],
+            "close": ohlc[:, 3],
+            "adjclose": ohlc[:, 3],
+            "volume": volume,
+        })
+
+    def partial(self, symbol: str) -> QKCandle | None:
+        with self._lock:
+            bar = self._partial.get(symbol)
+            return self._candle(bar.start, (bar.open, bar.high, bar.low, bar.close), bar.volume) if bar else None
+
+    def last_candle(self, symbol: str) -> QKCandle | None:
+        """
+        Most recent completed bar.
+        """
+        with self._lock:
+            ring = self._rings.get(symbol)
+            if not ring:
+                return None
+            i = ring.order()[-1]
+            return self._candle(int(ring.timestamp[i]), ring.ohlc[i], int(ring.volume[i]))
+
+    def _candle(self, start_ns: int, ohlc, volume: int) -> QKCandle:
+        o, h, l, c = (float(x) for x in ohlc)
+        return QKCandle(
+            timestamp=pd.Timestamp(start_ns, tz="UTC").tz_convert(self.calendar.tz).to_pydatetime(),
+            open=o,
+            high=h,
+            low=l,
+            close=c,
+            adjclose=c,
+            volume=volume,
+        )
@@ -0,0 +1,229 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from core.profiler import profiler
+from data.live_data.base.tick_source_base import TickSourceBase
+from data.live_data.candle_aggregator import CandleAggregator
+
+
+@dataclass(frozen=True)
+class LiveUpdate:
+    """
+    One re-evaluation of a symbol.
+
+    `frame` holds only the last `last_n` rows (with indicator + signal
+    columns); its last row is the in-progress bar when `partial` is set.
+    """
+    symbol: str
+    frame: pd.DataFrame
+    partial: bool
+    bar_closed: bool
+    latency_s: float
+
+
+class LivePipeline:
+    """
+    Ticks → bars → StrategyPlan with bounded latency.
+
+    Ingest thread: source → aggregator (O(1) per tick), marks the symbol dirty.
+    Compute thread: wakes at least every `max_wait` s, closes bars whose
+    interval ended, and re-evaluates each dirty symbol once — N ticks since
+    the last pass cost one evaluation, so a burst cannot build a backlog.
+    Evaluation uses the plan's tail path (only the warm-up suffix is computed).
+    Bars of quiet symbols are closed by the source's clock (`now_ns`).
+    """
+
+    def __init__(
+        self,
+        plan,
+        aggregator: CandleAggregator,
+        on_update: Callable[[LiveUpdate], None],
+        *,
+        last_n: int = 1,
+        partial: bool = True,
+        max_wait: float = 0.25,
+        on_error: Callable[[str, Exception], None] | None = None,
+    ):
+        self.plan = plan
+        self.aggregator = aggregator
+        self.on_update = on_update
+        self.last_n = last_n
+        self.partial = partial
+        self.max_wait = max_wait
+        self.on_error = on_error or (lambda s, e: print(f"[LIVE] {s}: {e}"))
+
+        # symbol -> (first dirty perf_counter, bar closed since last pass)
+        self._dirty: dict[str, tuple[float, bool]] = {}
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._source: TickSourceBase | None = None
+
+        self._latencies: deque[float] = deque(maxlen=10_000)
+        self.ticks = 0
+        self.evaluations = 0
+
+    # ---------------- LIFECYCLE ----------------
+
+    def start(self, source: TickSourceBase) -> "LivePipeline":
+        self._source = source
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._ingest, args=(source,), name="live-ingest", daemon=True),
+            threading.Thread(target=self._compute_loop, name="live-compute", daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._source is not None:
+            self._source.close()
+        with self._cond:
+            self._cond.notify_all()
+        for t in self._threads:
+            t.join()
+
+    def join(self) -> None:
+        """
+        Block until the source is exhausted and every pending bar is
+        evaluated (replays), then stop.
+        """
+        self._threads[0].join()
+
+        # stop the compute thread first: the final flush below must not
+        # evaluate a symbol while that thread is still draining it
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        self._threads[1].join()
+
+        self.aggregator.close_due(np.iinfo(np.int64).max)
+        self._mark(self.aggregator.symbols, bar_closed=True)
+        self.drain()
+        self.stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ---------------- THREADS ----------------
+
+    def _mark(self, symbols: Iterable[str], bar_closed: bool) -> None:
+        now = time.perf_counter()
+        with self._cond:
+            for symbol in symbols:
+                first, closed = self._dirty.get(symbol, (now, False))
+                self._dirty[symbol] = (first, closed or bar_closed)
+            self._cond.notify()
+
+    def _ingest(self, source: TickSourceBase) -> None:
+        agg = self.aggregator
+        for tick in source:
+            if self._stop.is_set():
+                break
+            closed = agg.on_tick(tick)
+            self.ticks += 1
+            if closed or self.partial:
+                self._mark((tick.symbol,), closed)
+
+    def _compute_loop(self) -> None:
+        while not self._stop.is_set():
+            with self._cond:
+                if not self._dirty:
+                    self._cond.wait(self.max_wait)
+
+            # stream time, so replays close bars on their own clock
+            closed = self.aggregator.close_due(self._source.now_ns())
+            if closed:
+                self._mark(closed, bar_closed=True)
+
+            self.drain()
+
+    def drain(self) -> None:
+        """
+        Evaluate every dirty symbol once.
+        """
+        with self._cond:
+            dirty, self._dirty = self._dirty, {}
+
+        for symbol, (since, bar_closed) in dirty.items():
+            try:
+                self._evaluate(symbol, since, bar_closed)
+            except Exception as e:
+                self.on_error(symbol, e)
+
+    def _evaluate(self, symbol: str, since: float, bar_closed: bool) -> None:
+        with profiler.stage("live_eval", ticker=symbol) as span:
+            df = self.aggregator.frame(symbol, partial=self.partial)
+            if df.empty:
+                return
+            out = self.plan.run(df, tail=self.last_n).iloc[-self.last_n:]
+            span.rows = len(df)
+
+        partial = self.partial and self.aggregator.partial(symbol) is not None
+        latency = time.perf_counter() - since
+        self._latencies.append(latency)
+        self.evaluations += 1
+
+        self.on_update(LiveUpdate(
+            symbol=symbol,
+            frame=out,
+            partial=partial,
+            bar_closed=bar_closed,
+            latency_s=latency,
+        ))
+
+    # ---------------- STATS ----------------
+
+    def latency_report(self) -> dict:
+        """
+        Tick-to-update latency over the recent window (seconds).
+        """
+        lat = np.array(self._latencies, dtype="float64")
+        if lat.size == 0:
+            return {"count": 0}
+        return {
+            "count": int(lat.size),
+            "p50_s": float(np.percentile(lat, 50)),
+            "p99_s": float(np.percentile(lat, 99)),
+            "max_s": float(lat.max()),
+            "ticks": self.ticks,
+            "evaluations": self.evaluations,
+            "dropped_off_session": self.aggregator.dropped_off_session,
+            "dropped_late": self.aggregator.dropped_late,
+        }
+
+
+if __name__ == "__main__":
+    from core.common_types import Unit
+    from core.synthetic_market import SyntheticMarket
+    from data.live_data.tick_source_replay import ReplayTickSource, synthetic_ticks
+    from strategies.strategy_ma_crossover import MACrossoverStrategy
+    from strategies.strategy_plan import StrategyPlan
+
+    market = SyntheticMarket(seed=1)
+    days = market.days("2025-06-02", "2025-06-03")
+    tape = pd.concat([
+        synthetic_ticks(market.frame(s, days, unit=Unit.minutes, interval=1), s)
+        for s in ("AAA", "BBB", "CCC")
+    ])
+
+    plan = StrategyPlan.compile(strategies=[MACrossoverStrategy(9, 21)])
+    agg = CandleAggregator(minutes=5)
+    updates = []
+
+    pipe = LivePipeline(plan, agg, updates.append, partial=False)
+    pipe.start(ReplayTickSource(tape)).join()
+
+    print(pipe.latency_report())
+    print(agg.frame("AAA").tail(3))
@@ -0,0 +1,298 @@
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from core.common_types import QKTick
+from data.live_data.base.tick_source_base import TickSourceBase
+from data.live_data.candle_aggregator import CandleAggregator
+from data.live_data.live_pipeline import LivePipeline, LiveUpdate
+from data.live_data.tick_source_replay import ReplayTickSource, load_ticks, synthetic_ticks
+
+
+class Pacer:
+    """
+    Maps stream time onto wall time.
+
+    speed=1.0 → real time, speed=N → N× faster, speed=None → no waiting.
+    Stream gaps longer than `max_gap_s` (overnight, weekends) are
+    skipped rather than slept through.
+    `lag_s` is how far behind schedule the consumer fell (load tests).
+    """
+
+    def __init__(self, speed: float | None = None, max_gap_s: float = 60.0):
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be > 0 (or None for as-fast-as-possible)")
+        self.speed = speed
+        self._max_gap_ns = int(max_gap_s * 1e9)
+        self._t0_stream: int | None = None
+        self._last_stream = 0
+        self._t0_wall = 0.0
+        self.lag_s = 0.0
+
+    def wait(self, stream_ns: int) -> None:
+        if self.speed is None:
+            return
+
+        if self._t0_stream is None:
+            self._t0_stream = self._last_stream = stream_ns
+            self._t0_wall = time.perf_counter()
+            return
+
+        gap = stream_ns - self._last_stream
+        if gap > self._max_gap_ns:
+            self._t0_stream += gap - self._max_gap_ns
+        self._last_stream = stream_ns
+
+        due = self._t0_wall + (stream_ns - self._t0_stream) / 1e9 / self.speed
+        ahead = due - time.perf_counter()
+        if ahead > 0:
+            time.sleep(ahead)
+        else:
+            self.lag_s = max(self.lag_s, -ahead)
+
+
+class PacedTickSource(TickSourceBase):
+    """
+    Wraps a tick source and releases ticks on the pacer's schedule.
+    """
+
+    def __init__(self, inner: TickSourceBase, speed: float | None = None):
+        self.inner = inner
+        self.pacer = Pacer(speed)
+
+    def _connect(self) -> None:
+        return
+
+    def close(self) -> None:
+        super().close()
+        self.inner.close()
+
+    def now_ns(self) -> int:
+        return self.inner.now_ns()
+
+    def _read(self) -> Iterable[QKTick]:
+        for tick in self.inner:
+            self.pacer.wait(tick.timestamp)
+            yield tick
+
+
+def load_candles(path) -> pd.DataFrame:
+    """
+    Stored candles (.csv / .parquet) in the fetcher schema.
+    """
+    path = Path(path)
+    df = pd.read_parquet(path) if path.suffix == ".parquet" else pd.read_csv(path)
+    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    return df
+
+
+def candles_tape(frames: dict[str, pd.DataFrame], ticks_per_bar: int = 4) -> pd.DataFrame:
+    """
+    Candles of many symbols → one time-ordered tick tape that
+    re-aggregates to exactly the same bars.
+    """
+    tapes = [
+        synthetic_ticks(df, symbol, ticks_per_bar=ticks_per_bar, seed=i)
+        for i, (symbol, df) in enumerate(frames.items())
+    ]
+    return load_ticks(pd.concat(tapes, ignore_index=True))
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+    """
+    signals: one row per (symbol, closed bar) with the plan's signal
+    columns as the live path saw them when that bar closed.
+    """
+    signals: pd.DataFrame
+    ticks: int
+    bars: int
+    wall_s: float
+    eval_latency_s: np.ndarray
+    lag_s: float
+
+    def report(self) -> dict:
+        lat = self.eval_latency_s
+        return {
+            "ticks": self.ticks,
+            "bars": self.bars,
+            "wall_s": round(self.wall_s, 3),
+            "ticks_per_s": round(self.ticks / self.wall_s) if self.wall_s else None,
+            "eval_p50_ms": float(np.percentile(lat, 50) * 1e3) if lat.size else None,
+            "eval_p99_ms": float(np.percentile(lat, 99) * 1e3) if lat.size else None,
+            "lag_s": round(self.lag_s, 3),
+        }
+
+
+class ReplayDriver:
+    """
+    Plays stored ticks / candles through the live path.
+
+    run()      — deterministic, single thread: every closed bar of every
+                 symbol is evaluated once, in stream order. Use it to check
+                 that live signals equal batch signals (compare_batch).
+    run_live() — the threaded LivePipeline fed by a paced source; use it
+                 for end-to-end latency / load tests.
+    """
+
+    def __init__(
+        self,
+        plan,
+        *,
+        minutes: int = 1,
+        speed: float | None = None,
+        capacity: int = 2_000,
+    ):
+        self.plan = plan
+        self.minutes = minutes
+        self.speed = speed
+        self.capacity = capacity
+
+    def _aggregator(self) -> CandleAggregator:
+        return CandleAggregator(minutes=self.minutes, capacity=self.capacity)
+
+    @staticmethod
+    def _source(tape) -> TickSourceBase:
+        return tape if isinstance(tape, TickSourceBase) else ReplayTickSource(tape)
+
+    # ---------------- DETERMINISTIC ----------------
+
+    def run(self, tape) -> ReplayResult:
+        """
+        `tape`: tick file / DataFrame / TickSourceBase.
+        """
+        source = self._source(tape)
+        agg = self._aggregator()
+        pacer = Pacer(self.speed)
+        columns = self.plan.signal_columns
+
+        rows: list[tuple] = []
+        latencies: list[float] = []
+
+        def evaluate(symbol: str) -> None:
+            t0 = time.perf_counter()
+            df = agg.frame(symbol, partial=False)
+            out = self.plan.run(df, tail=1)
+            last = out.iloc[-1]
+            rows.append((symbol, last["timestamp"], *(last[c] for c in columns)))
+            latencies.append(time.perf_counter() - t0)
+
+        ticks = 0
+        bucket = None
+        wall0 = time.perf_counter()
+
+        for tick in source:
+            pacer.wait(tick.timestamp)
+            ticks += 1
+
+            # crossing a bar boundary closes every symbol's previous bar
+            b = agg.bucket(tick.timestamp)
+            if b != bucket:
+                for symbol in agg.close_due(tick.timestamp):
+                    evaluate(symbol)
+                bucket = b
+
+            if agg.on_tick(tick):
+                evaluate(tick.symbol)
+
+        for symbol in agg.close_due(np.iinfo(np.int64).max):
+            evaluate(symbol)
+
+        signals = pd.DataFrame(rows, columns=["symbol", "timestamp", *columns])
+
+        return ReplayResult(
+            signals=signals,
+            ticks=ticks,
+            bars=len(rows),
+            wall_s=time.perf_counter() - wall0,
+            eval_latency_s=np.array(latencies),
+            lag_s=pacer.lag_s,
+        )
+
+    def compare_batch(self, result: ReplayResult, frames: dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Rows where the replayed (live) signal differs from the batch
+        signal for the same symbol and bar. Empty → identical.
+        """
+        columns = self.plan.signal_columns
+        batch = []
+        for symbol, df in frames.items():
+            out = self.plan.run(df)
+            part = out[["timestamp", *columns]].copy()
+            part.insert(0, "symbol", symbol)
+            batch.append(part)
+        batch = pd.concat(batch, ignore_index=True)
+
+        # live bars are rebuilt from epoch ns, fetched frames are often µs
+        live = result.signals.assign(timestamp=result.signals["timestamp"].dt.as_unit("ns"))
+        batch["timestamp"] = batch["timestamp"].dt.as_unit("ns")
+
+        merged = live.merge(
+            batch, on=["symbol", "timestamp"], how="outer",
+            suffixes=("_live", "_batch"), indicator=True,
+        )
+
+        diff = merged["_merge"] != "both"
+        for c in columns:
+            diff |= merged[f"{c}_live"].astype(str) != merged[f"{c}_batch"].astype(str)
+
+        return merged[diff].drop(columns="_merge")
+
+    # ---------------- THREADED / PACED ----------------
+
+    def run_live(self, tape, *, partial: bool = True, max_wait: float = 0.25, on_update=None) -> dict:
+        """
+        Feed the threaded LivePipeline at `speed`; returns its latency report
+        plus how far the feed fell behind schedule.
+        """
+        source = PacedTickSource(self._source(tape), speed=self.speed)
+        updates: list[LiveUpdate] = []
+
+        pipe = LivePipeline(
+            self.plan,
+            self._aggregator(),
+            on_update or updates.append,
+            partial=partial,
+            max_wait=max_wait,
+        )
+
+        wall0 = time.perf_counter()
+        pipe.start(source).join()
+
+        return {
+            **pipe.latency_report(),
+            "wall_s": round(time.perf_counter() - wall0, 3),
+            "lag_s": round(source.pacer.lag_s, 3),
+        }
+
+
+if __name__ == "__main__":
+    from core.common_types import Unit
+    from core.synthetic_market import SyntheticMarket
+    from strategies.strategy_day_range_breakout import DayRangeBreakoutStrategy
+    from strategies.strategy_ma_crossover import MACrossoverStrategy
+    from strategies.strategy_plan import StrategyPlan
+
+    market = SyntheticMarket(seed=5)
+    days = market.days("2025-06-02", "2025-06-03")
+    frames = {
+        s: market.frame(s, days, unit=Unit.minutes, interval=1)
+        for s in ("AAA", "BBB", "CCC")
+    }
+
+    plan = StrategyPlan.compile(strategies=[
+        MACrossoverStrategy(9, 21),
+        DayRangeBreakoutStrategy(0.02),
+    ])
+    driver = ReplayDriver(plan, minutes=1)
+    tape = candles_tape(frames)
+
+    result = driver.run(tape)
+    print(result.report())
+    print("live/batch mismatches:", len(driver.compare_batch(result, frames)))
+
+    print(ReplayDriver(plan, minutes=1, speed=10_000).run_live(tape))
@@ -0,0 +1,85 @@
+from typing import Iterable
+
+import pandas as pd
+
+from core.common_types import QKTick
+from core.env import get_env
+from core.market_calendar import NSE
+from data.live_data.base.tick_source_base import TickSourceBase
+
+
+class DhanTickSource(TickSourceBase):
+    """
+    dhanhq.marketfeed websocket → QKTick.
+
+    Subscribes in Quote mode (LTP + last trade time + cumulative day volume);
+    per-tick volume is the change in day volume since the previous packet.
+    `security_ids` are Dhan ids; pass a TickerUniverse to emit symbols.
+    """
+
+    def __init__(self, security_ids: Iterable, *, exchange: str = "NSE", universe=None):
+        self.security_ids = [str(s) for s in security_ids]
+        self.exchange = exchange
+        self.universe = universe
+        self._feed = None
+        self._day_volume: dict[str, int] = {}
+        self._names: dict[str, str] = {}
+
+    def _connect(self) -> None:
+        if self._feed is not None:
+            return
+
+        from dhanhq import marketfeed
+
+        segment = {"NSE": marketfeed.NSE, "BSE": marketfeed.BSE}[self.exchange]
+        instruments = [(segment, sid, marketfeed.Quote) for sid in self.security_ids]
+
+        self._feed = marketfeed.DhanFeed(
+            get_env("DHAN_CLIENT_ID"),
+            get_env("DHAN_SECRET_KEY"),
+            instruments,
+            "v2",
+        )
+
+        if self.universe is not None:
+            for sid in self.security_ids:
+                self._names[sid] = self.universe.symbol_for_security_id(sid) or sid
+
+    def close(self) -> None:
+        super().close()
+        if self._feed is not None:
+            disconnect = getattr(self._feed, "disconnect", None) or self._feed.close_connection
+            disconnect()
+            self._feed = None
+
+    # ---------------- PARSING ----------------
+
+    @staticmethod
+    def _today_ns() -> int:
+        # midnight of the current exchange day in the exchange timezone
+        # (the aggregator's calendar), whatever the host's timezone is
+        return pd.Timestamp.now(tz=NSE.tz).normalize().value
+
+    def _parse(self, packet) -> QKTick | None:
+        if not packet or packet.get("type") != "Quote Data":
+            return None
+
+        sid = str(packet["security_id"])
+        total = int(packet.get("volume") or 0)
+        prev = self._day_volume.get(sid)
+        self._day_volume[sid] = total
+
+        qty = int(packet.get("LTQ") or 0) if prev is None else max(0, total - prev)
+
+        # LTT is "HH:MM:SS" exchange time of the last trade, today
+        h, m, s = (int(x) for x in packet["LTT"].split(":"))
+        ts = self._today_ns() + ((h * 60 + m) * 60 + s) * 1_000_000_000
+
+        return QKTick(self._names.get(sid, sid), ts, float(packet["LTP"]), qty)
+
+    def _read(self) -> Iterable[QKTick]:
+        while not self._stopped:
+            self._feed.run_forever()
+            tick = self._parse(self._feed.get_data())
+            if tick is not None:
+                yield tick
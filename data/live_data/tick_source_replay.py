@@ -0,0 +1,141 @@
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from core.common_types import QKTick
+from core.time_index import epoch_ns
+from data.live_data.base.tick_source_base import TickSourceBase
+
+
+TICK_COLUMNS = ("timestamp", "symbol", "price", "volume")
+
+
+def load_ticks(source) -> pd.DataFrame:
+    """
+    Tick file (.csv / .jsonl / .parquet) or DataFrame → normalized ticks.
+    Naive timestamps are exchange-local; integer ones are epoch ns (UTC).
+    Output:
+    timestamp (int64 epoch ns, UTC), symbol, price (float64), volume (int64),
+    sorted by time (stable, so same-time prints keep file order).
+    """
+    if isinstance(source, pd.DataFrame):
+        df = source
+    else:
+        path = Path(source)
+        if path.suffix == ".parquet":
+            df = pd.read_parquet(path)
+        elif path.suffix in (".jsonl", ".json"):
+            df = pd.read_json(path, lines=path.suffix == ".jsonl")
+        else:
+            df = pd.read_csv(path)
+
+    missing = [c for c in TICK_COLUMNS if c not in df]
+    if missing:
+        raise ValueError(f"Tick data missing columns: {missing}")
+
+    if pd.api.types.is_integer_dtype(df["timestamp"]):
+        # already epoch ns (UTC)
+        stamps = df["timestamp"].to_numpy(dtype="int64")
+    else:
+        ts = pd.to_datetime(df["timestamp"])
+        if ts.dt.tz is None:
+            ts = ts.dt.tz_localize("Asia/Kolkata")
+        stamps = epoch_ns(ts)
+
+    out = pd.DataFrame({
+        "timestamp": stamps,
+        "symbol": df["symbol"].astype(str).to_numpy(),
+        "price": df["price"].to_numpy(dtype="float64"),
+        "volume": df["volume"].to_numpy(dtype="int64"),
+    })
+    return out.sort_values("timestamp", kind="stable", ignore_index=True)
+
+
+class ReplayTickSource(TickSourceBase):
+    """
+    Replays a recorded tick file as fast as it is consumed.
+    (Pacing to wall-clock lives in the replay driver.)
+    """
+
+    def __init__(self, source, symbols: Iterable[str] | None = None):
+        self.source = source
+        self.symbols = set(symbols) if symbols is not None else None
+        self._ticks: pd.DataFrame | None = None
+        self._now = 0
+
+    def _connect(self) -> None:
+        if self._ticks is not None:
+            return
+
+        ticks = load_ticks(self.source)
+        if self.symbols is not None:
+            ticks = ticks[ticks["symbol"].isin(self.symbols)]
+        self._ticks = ticks
+
+    def now_ns(self) -> int:
+        return self._now
+
+    def __len__(self) -> int:
+        self._connect()
+        return len(self._ticks)
+
+    def _read(self) -> Iterable[QKTick]:
+        t = self._ticks
+        # plain numpy scalars → python objects once, not per attribute
+        for ts, sym, px, qty in zip(
+            t["timestamp"].to_numpy().tolist(),
+            t["symbol"].to_numpy(),
+            t["price"].to_numpy().tolist(),
+            t["volume"].to_numpy().tolist(),
+        ):
+            self._now = ts
+            yield QKTick(sym, ts, px, qty)
+
+
+def synthetic_ticks(
+    candles: pd.DataFrame,
+    symbol: str,
+    ticks_per_bar: int = 4,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Expand candles into a tick tape that re-aggregates to the same OHLCV:
+    per bar open → high/low (random order) → close, volume split evenly.
+    Handy for replay tests of the live path against batch candles.
+    """
+    if ticks_per_bar < 4:
+        raise ValueError("ticks_per_bar must be >= 4 (open, high, low, close)")
+
+    rng = np.random.default_rng(seed)
+    n = len(candles)
+    k = ticks_per_bar
+
+    ts = pd.to_datetime(candles["timestamp"])
+    start = epoch_ns(ts)
+    # bar width = typical spacing; session / overnight jumps are not bars
+    width = np.median(np.diff(start)) if n > 1 else 60_000_000_000
+    step = np.minimum(np.diff(start, append=start[-1] + width), width)
+    offsets = (np.arange(k) / k)[None, :] * step[:, None]
+
+    o, h, l, c = (candles[f].to_numpy(dtype="float64") for f in ("open", "high", "low", "close"))
+    prices = np.empty((n, k))
+    prices[:, 0] = o
+    prices[:, -1] = c
+    mid = rng.uniform(np.minimum(o, c)[:, None], np.maximum(o, c)[:, None], size=(n, k - 2))
+    hi_first = rng.random(n) < 0.5
+    mid[:, 0] = np.where(hi_first, h, l)
+    mid[:, -1] = np.where(hi_first, l, h)
+    prices[:, 1:-1] = mid
+
+    vol = candles["volume"].to_numpy(dtype="int64")
+    qty = np.repeat((vol // k)[:, None], k, axis=1)
+    qty[:, -1] += vol - qty.sum(axis=1)
+
+    return pd.DataFrame({
+        "timestamp": pd.to_datetime((start[:, None] + offsets.astype("int64")).ravel(), utc=True),
+        "symbol": symbol,
+        "price": prices.ravel(),
+        "volume": qty.ravel(),
+    })
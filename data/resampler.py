@@ -0,0 +1,325 @@
+# data/resampler.py
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+from core.common_types import Unit
+from core.market_calendar import NSE, MarketCalendar, bar_minutes
+from core.profiler import profiler
+from core.time_index import ensure_sorted
+from data.fetch_request import QKFetchRequest
+
+
+# (unit, interval), e.g. (Unit.minutes, 5), (Unit.hours, 1), (Unit.days, 1)
+Timeframe = tuple[Unit, int]
+
+_DAY_NS = 86_400 * 10**9
+_MINUTE_NS = 60 * 10**9
+
+
+def timeframe_minutes(timeframe: Timeframe) -> int | None:
+    """
+    Bar length in minutes; None for daily.
+    """
+    return bar_minutes(*timeframe)
+
+
+def _sort_key(timeframe: Timeframe) -> int:
+    minutes = timeframe_minutes(timeframe)
+    return 10**9 if minutes is None else minutes
+
+
+def timeframe_label(timeframe: Timeframe) -> str:
+    # "5m", "1h", "1d"
+    unit, interval = timeframe
+    return f"{interval}{unit.value}"
+
+
+def finest(timeframes) -> Timeframe:
+    return min(timeframes, key=_sort_key)
+
+
+def can_derive(target: Timeframe, base: Timeframe) -> bool:
+    """
+    True if `target` bars are whole groups of `base` bars.
+    """
+    t, b = timeframe_minutes(target), timeframe_minutes(base)
+    if b is None:
+        return t is None
+    return t is None or t % b == 0
+
+
+def _local_ns(stamps, calendar: MarketCalendar) -> np.ndarray:
+    # wall-clock ns in the exchange timezone (naive input: already local);
+    # as_unit: asi8 is in the column's own unit (µs for most pandas 3 frames)
+    index = pd.DatetimeIndex(stamps)
+    if index.tz is not None:
+        index = index.tz_convert(calendar.tz).tz_localize(None)
+    return index.as_unit("ns").asi8
+
+
+def session_buckets(stamps: pd.Series, minutes: int | None, calendar: MarketCalendar = NSE):
+    """
+    Target-bar bucket of every source bar, anchored at the session open
+    (09:15 on NSE). Returns (key, start_ns, in_session):
+    - key:        int64, equal for bars of the same target bar,
+                  non-decreasing for sorted input
+    - start_ns:   target bar start as local wall-clock ns
+    - in_session: False for bars outside the regular session
+    """
+    local = _local_ns(stamps, calendar)
+
+    day = local // _DAY_NS
+    if minutes is None:
+        return day, day * _DAY_NS, np.ones(len(local), dtype=bool)
+
+    open_m = calendar.open_time.hour * 60 + calendar.open_time.minute
+    since_open = (local - day * _DAY_NS) // _MINUTE_NS - open_m
+    bucket = since_open // minutes
+
+    in_session = (since_open >= 0) & (since_open < calendar.session_minutes)
+    per_day = calendar.bars_per_session(minutes)
+    key = day * per_day + bucket
+    start = day * _DAY_NS + (open_m + bucket * minutes) * _MINUTE_NS
+    return key, start, in_session
+
+
+def resample(
+    df: pd.DataFrame,
+    target: Timeframe,
+    *,
+    calendar: MarketCalendar = NSE,
+) -> pd.DataFrame:
+    """
+    Aggregate fetcher-schema bars into `target` bars.
+
+    Buckets are session aligned (first bar of each day starts at the
+    open; a session's last intraday bar may be shorter, as on the
+    exchange). Daily bars are stamped at local midnight, like the
+    fetchers' daily frames. Bars outside the session are dropped for
+    intraday targets. All reductions are single reduceat passes.
+    """
+    df = ensure_sorted(df)
+    minutes = timeframe_minutes(target)
+
+    key, start, keep = session_buckets(df["timestamp"], minutes, calendar)
+    if not keep.all():
+        df = df.iloc[np.flatnonzero(keep)]
+        key, start = key[keep], start[keep]
+
+    if len(df) == 0:
+        return df.iloc[:0].reset_index(drop=True)
+
+    first = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+    last = np.r_[first[1:], len(key)] - 1
+
+    high = df["high"].to_numpy(dtype=np.float64)
+    low = df["low"].to_numpy(dtype=np.float64)
+    volume = df["volume"].to_numpy()
+
+    # same resolution as the source column
+    stamps = pd.DatetimeIndex(start[first].view("M8[ns]")).as_unit(df["timestamp"].dt.unit)
+    tz = getattr(df["timestamp"].dtype, "tz", None)
+    if tz is not None:
+        stamps = stamps.tz_localize(calendar.tz).tz_convert(tz)
+
+    out = {
+        "timestamp": stamps,
+        "open": df["open"].to_numpy(dtype=np.float64)[first],
+        "high": np.maximum.reduceat(high, first),
+        "low": np.minimum.reduceat(low, first),
+        "close": df["close"].to_numpy(dtype=np.float64)[last],
+    }
+    if "adjclose" in df:
+        out["adjclose"] = df["adjclose"].to_numpy(dtype=np.float64)[last]
+    out["volume"] = np.add.reduceat(volume, first)
+    return pd.DataFrame(out)
+
+
+def asof_indexer(
+    base_stamps,
+    target_stamps,
+    target: Timeframe,
+    *,
+    calendar: MarketCalendar = NSE,
+) -> np.ndarray:
+    """
+    For every base bar, the row of the latest `target` bar that had
+    closed by the end of that base bar (-1 → none yet). A target bar is
+    only used once complete, so nothing leaks from later base bars.
+
+    Base bars end at start + their spacing (the smallest gap between
+    stamps); target bars end at start + length, capped at the session
+    close (daily bars: at the close).
+    """
+    base = _local_ns(base_stamps, calendar)
+    start = _local_ns(target_stamps, calendar)
+    if len(base) == 0 or len(start) == 0:
+        return np.full(len(base), -1, dtype=np.int64)
+
+    close_m = calendar.close_time.hour * 60 + calendar.close_time.minute
+    session_close = (start // _DAY_NS) * _DAY_NS + close_m * _MINUTE_NS
+
+    minutes = timeframe_minutes(target)
+    if minutes is None:
+        ends = session_close
+    else:
+        ends = np.minimum(start + minutes * _MINUTE_NS, session_close)
+
+    gaps = np.diff(base)
+    gaps = gaps[gaps > 0]
+    step = int(gaps.min()) if len(gaps) else 0
+    return np.searchsorted(ends, base + step, side="right") - 1
+
+
+class Resampler:
+    """
+    Multi-timeframe frames from one provider fetch per ticker.
+
+    The finest requested timeframe is fetched once through
+    `data_manager` (anything with fetch(ticker, request)); every coarser
+    one is derived from it with resample(). Base and derived frames are
+    kept in an LRU (`max_entries` frames), so asking again — or for
+    another timeframe of the same fetch — costs no API call.
+    Thread-safe: threads asking for a frame that is still being fetched
+    or derived wait for that one build instead of starting their own.
+    """
+
+    def __init__(self, data_manager, *, calendar: MarketCalendar = NSE, max_entries: int = 512):
+        self.data_manager = data_manager
+        self.calendar = calendar
+        self.max_entries = max_entries
+        self._frames: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+        self._pending: dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+
+        self.fetches = 0
+        self.derived = 0
+        self.hits = 0
+
+    # ---------------- KEYS ----------------
+
+    @staticmethod
+    def timeframe_of(request: QKFetchRequest) -> Timeframe:
+        interval = request.intraday_interval if request.intraday else request.interval
+        return request.unit, interval
+
+    @staticmethod
+    def with_timeframe(request: QKFetchRequest, timeframe: Timeframe) -> QKFetchRequest:
+        unit, interval = timeframe
+        if request.intraday:
+            return replace(request, unit=unit, intraday_interval=interval)
+        return replace(request, unit=unit, interval=interval)
+
+    @staticmethod
+    def _key(ticker: str, request: QKFetchRequest, timeframe: Timeframe) -> tuple:
+        # QKDate has no value equality → key on the date strings
+        return (
+            str(ticker), request.api, request.mode, request.exchange,
+            str(request.from_date), str(request.to_date), timeframe,
+        )
+
+    def _once(self, key, build, stat: str) -> pd.DataFrame:
+        """
+        Cached frame for `key`, else build() it — exactly once while it
+        is in flight; concurrent callers wait for that build's result
+        (or its exception). `stat` names the counter a build increments.
+        """
+        with self._lock:
+            df = self._frames.get(key)
+            if df is not None:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return df
+
+            future = self._pending.get(key)
+            owner = future is None
+            if owner:
+                future = self._pending[key] = Future()
+            else:
+                self.hits += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            df = build()
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._pending[key]
+            setattr(self, stat, getattr(self, stat) + 1)
+            self._frames[key] = df
+            self._frames.move_to_end(key)
+            while len(self._frames) > self.max_entries:
+                self._frames.popitem(last=False)
+        future.set_result(df)
+        return df
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+
+    # ---------------- API ----------------
+
+    def base(self, ticker: str, request: QKFetchRequest, timeframe: Timeframe) -> pd.DataFrame:
+        """
+        The provider frame for `timeframe` (fetched at most once).
+        """
+        def fetch():
+            return ensure_sorted(self.data_manager.fetch(ticker, self.with_timeframe(request, timeframe)))
+
+        return self._once(self._key(ticker, request, timeframe), fetch, "fetches")
+
+    def frames(
+        self,
+        ticker: str,
+        request: QKFetchRequest,
+        timeframes,
+        *,
+        base: Timeframe | None = None,
+    ) -> dict[Timeframe, pd.DataFrame]:
+        """
+        timeframe → frame for every requested timeframe. `base` defaults
+        to the finest of them; its own frame is the provider's.
+        """
+        timeframes = list(dict.fromkeys(timeframes))
+        base = base or finest(timeframes)
+        bad = [tf for tf in timeframes if not can_derive(tf, base)]
+        if bad:
+            raise ValueError(f"Cannot derive {bad} from {base}")
+
+        source = self.base(ticker, request, base)
+        out = {}
+        for tf in timeframes:
+            if tf == base:
+                out[tf] = source
+                continue
+
+            def derive(tf=tf):
+                with profiler.stage("resample", ticker=str(ticker)) as span:
+                    span.rows = len(source)
+                    return resample(source, tf, calendar=self.calendar)
+
+            out[tf] = self._once(self._key(ticker, request, tf), derive, "derived")
+        return out
+
+    def get(self, ticker: str, request: QKFetchRequest, timeframe: Timeframe, *, base: Timeframe) -> pd.DataFrame:
+        return self.frames(ticker, request, [timeframe], base=base)[timeframe]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "fetches": self.fetches,
+                "derived": self.derived,
+                "hits": self.hits,
+                "entries": len(self._frames),
+            }
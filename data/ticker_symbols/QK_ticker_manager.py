@@ -25,6 +25,17 @@ class TickerManager:
     def filter(self, predicate) -> Sequence:
         return [t for t in self._all_tickers if predicate(t)]
 
+    # ---------------- INDEXED LOOKUPS (O(1)) ----------------
+
+    def __contains__(self, ticker) -> bool:
+        return self.TicketLoader.universe.contains(self.api, ticker)
+
+    def index_of(self, ticker) -> int | None:
+        return self.TicketLoader.universe.index_of(self.api, ticker)
+
+    def security_id(self, ticker) -> str | None:
+        return self.TicketLoader.universe.security_id(ticker, api=self.api)
+
     def refresh(self, api: QKApi | None = None):
         if api is not None:
             self.api = api
@@ -0,0 +1,234 @@
+import csv
+import threading
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from core.common_types import QKApi, TickerSource
+from data.ticker_symbols.ticker_universe import TickerUniverse, base_symbol
+
+
+# cheapest first: dhan/upstox are direct broker feeds, yfinance is scraped
+DEFAULT_ROUTE: tuple[QKApi, ...] = (QKApi.dhan, QKApi.upstox, QKApi.yfinance)
+
+_UPSTOX_SEGMENT = "NSE_EQ"
+_YF_SUFFIX = ".NS"
+
+
+def load_isin_csv(path: str | Path) -> dict[str, str]:
+    """
+    symbol -> ISIN from an NSE equity list (EQUITY_L.csv layout:
+    `SYMBOL`, ` ISIN NUMBER` columns; header whitespace is ignored).
+    """
+    out = {}
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        reader.fieldnames = [h.strip().upper() for h in reader.fieldnames or []]
+        for row in reader:
+            symbol = (row.get("SYMBOL") or "").strip()
+            isin = (row.get("ISIN NUMBER") or row.get("ISIN") or "").strip()
+            if symbol and isin:
+                out[symbol] = isin
+    return out
+
+
+class InstrumentMaster:
+    """
+    One row per instrument, one column per provider identifier.
+
+    Rows are keyed by ISIN when known, else by NSE symbol. Columns are
+    plain NumPy object arrays; per-provider dicts map identifier -> row,
+    so resolving any provider's ticker to any other is two hash lookups.
+    """
+
+    _cache: dict[tuple[Path, int, int], "InstrumentMaster"] = {}
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        isins: Sequence[str | None],
+        identifiers: dict[QKApi, Sequence[str | None]],
+    ):
+        self.symbol = np.asarray(symbols, dtype=object)
+        self.isin = np.asarray(isins, dtype=object)
+        self._ids = {
+            api: np.asarray(col, dtype=object)
+            for api, col in identifiers.items()
+        }
+
+        self._row_for: dict[QKApi, dict[str, int]] = {
+            api: {str(v): i for i, v in enumerate(col) if v is not None}
+            for api, col in self._ids.items()
+        }
+        self._row_for_symbol = {s: i for i, s in enumerate(self.symbol)}
+        self._row_for_isin = {
+            v: i for i, v in enumerate(self.isin) if v is not None
+        }
+
+    # ---------------- BUILD ----------------
+
+    @classmethod
+    def from_universe(
+        cls,
+        universe: TickerUniverse,
+        isin_map: dict[str, str] | None = None,
+    ) -> "InstrumentMaster":
+        isin_map = dict(isin_map or {})
+
+        # upstox instrument keys carry the ISIN ("NSE_EQ|INE848E01016")
+        upstox_keys = {}
+        for key in universe.symbols(QKApi.upstox):
+            key = str(key)
+            if "|" in key:
+                upstox_keys[key.split("|", 1)[1]] = key
+
+        yf_symbols = {
+            base_symbol(QKApi.yfinance, t): str(t)
+            for t in universe.symbols(QKApi.yfinance)
+        }
+        dhan_ids = {
+            str(p["symbol"]): str(p["security_id"])
+            for p in universe.symbols(QKApi.dhan)
+        }
+
+        # stable order: yfinance list first, then dhan-only symbols
+        ordered = list(yf_symbols)
+        ordered += [s for s in dhan_ids if s not in yf_symbols]
+
+        isins, yf, upstox, dhan = [], [], [], []
+        for symbol in ordered:
+            isin = isin_map.get(symbol)
+            isins.append(isin)
+            yf.append(yf_symbols.get(symbol))
+            dhan.append(dhan_ids.get(symbol))
+
+            if isin is None:
+                upstox.append(None)
+            else:
+                upstox.append(
+                    upstox_keys.get(isin, f"{_UPSTOX_SEGMENT}|{isin}")
+                )
+
+        return cls(
+            ordered,
+            isins,
+            {
+                QKApi.yfinance: yf,
+                QKApi.upstox: upstox,
+                QKApi.dhan: dhan,
+            },
+        )
+
+    @classmethod
+    def load(
+        cls,
+        source: TickerSource = TickerSource.INDIA,
+        isin_csv: str | Path | None = None,
+    ) -> "InstrumentMaster":
+        """
+        Process-wide cached master, rebuilt when the ticker yaml
+        (or the optional ISIN csv) changes.
+        """
+        universe = TickerUniverse.load(source)
+        isin_mtime = Path(isin_csv).stat().st_mtime_ns if isin_csv else 0
+        key = (universe.path, universe.mtime_ns, isin_mtime)
+
+        with cls._lock:
+            cached = cls._cache.get(key)
+            if cached is not None:
+                return cached
+
+            isin_map = load_isin_csv(isin_csv) if isin_csv else None
+            master = cls.from_universe(universe, isin_map)
+            cls._cache = {key: master}
+            return master
+
+    # ---------------- LOOKUPS ----------------
+
+    def __len__(self) -> int:
+        return len(self.symbol)
+
+    def row_of(self, ticker, api: QKApi | None = None) -> int | None:
+        """
+        Row for a provider ticker, a bare symbol or an ISIN.
+        """
+        if api is not None:
+            row = self._row_for.get(api, {}).get(
+                str(ticker["security_id"]) if isinstance(ticker, dict)
+                else str(ticker)
+            )
+            if row is not None:
+                return row
+
+        if isinstance(ticker, dict):
+            ticker = ticker["symbol"]
+        ticker = str(ticker)
+
+        row = self._row_for_isin.get(ticker)
+        if row is not None:
+            return row
+
+        for candidate in (ticker, base_symbol(QKApi.yfinance, ticker)):
+            row = self._row_for_symbol.get(candidate)
+            if row is not None:
+                return row
+
+        return None
+
+    def identifier(self, row: int, api: QKApi) -> str | None:
+        return self._ids[api][row]
+
+    def key(self, row: int) -> str:
+        isin = self.isin[row]
+        return isin if isin is not None else self.symbol[row]
+
+    def providers_for(self, ticker, api: QKApi | None = None) -> dict[QKApi, str]:
+        row = self.row_of(ticker, api)
+        if row is None:
+            return {}
+        return {
+            p: ids[row] for p, ids in self._ids.items()
+            if ids[row] is not None
+        }
+
+    def translate(self, ticker, from_api: QKApi, to_api: QKApi) -> str | None:
+        row = self.row_of(ticker, from_api)
+        if row is None:
+            return None
+        return self.identifier(row, to_api)
+
+    def route(
+        self,
+        ticker,
+        api: QKApi | None = None,
+        preference: Iterable[QKApi] = DEFAULT_ROUTE,
+    ) -> list[tuple[QKApi, str]]:
+        """
+        Providers able to serve `ticker`, in preference order,
+        each with its own identifier for the instrument.
+        """
+        row = self.row_of(ticker, api)
+        if row is None:
+            return []
+
+        out = []
+        for p in preference:
+            ident = self._ids[p][row]
+            if ident is not None:
+                out.append((p, ident))
+        return out
+
+    def coverage(self) -> dict[QKApi, int]:
+        return {
+            api: int(sum(v is not None for v in col))
+            for api, col in self._ids.items()
+        }
+
+
+if __name__ == "__main__":
+    master = InstrumentMaster.load()
+    print(f"{len(master)} instruments, coverage: {master.coverage()}")
+    print("ABB.NS →", master.route("ABB.NS", QKApi.yfinance))
+    print("dhan 13 →", master.translate("13", QKApi.dhan, QKApi.yfinance))
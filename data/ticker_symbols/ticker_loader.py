@@ -1,14 +1,16 @@
-import yaml
 from core.common_types import QKApi, TickerSource
+from data.ticker_symbols.ticker_universe import TickerUniverse
 
 class TickerLoader:
     def __init__(self, source: TickerSource):
         self.source = source
-        self._config = self._load_yaml()
+        # parsed once per process, shared by every loader
+        self._universe = TickerUniverse.load(source)
+        self._config = self._universe.config
 
-    def _load_yaml(self) -> dict:
-        with open(self.source.value, "r") as f:
-            return yaml.safe_load(f)
+    @property
+    def universe(self) -> TickerUniverse:
+        return self._universe
 
     def get_n_tickers(
         self,
@@ -27,20 +29,7 @@ class TickerLoader:
         return symbols[:limit]
 
     def for_api(self, api: QKApi, exchange: str = "NSE"):
-        providers = self._config.get("providers", {})
-
-        match api:
-            case QKApi.yfinance:
-                return providers["yfinance"]["symbols"]
-
-            case QKApi.upstox:
-                return providers["upstox"]["symbols"]
-
-            case QKApi.dhan:
-                return providers["dhan"]["symbol_security_pairs"]
-
-            case _:
-                raise ValueError(f"Unsupported API: {api}")
+        return self._universe.symbols(api)
 
     DEFAULT_TICKER_PER_API = {
         QKApi.yfinance: "3MINDIA.NS",
@@ -78,7 +67,7 @@ class TickerLoader:
         """
 
         print("\n[TickerLoader DEBUG]")
-        print(f"Source file: {self.source.value}")
+        print(f"Source file: {self._universe.path}")
 
         providers = self._config.get("providers", {})
         print(f"Available providers: {list(providers.keys())}")
@@ -0,0 +1,158 @@
+import json
+import threading
+from pathlib import Path
+
+import yaml
+
+from core.common_types import QKApi, TickerSource
+
+
+# provider key in the yaml → list key holding its instruments
+_PROVIDER_KEYS = {
+    QKApi.yfinance: ("yfinance", "symbols"),
+    QKApi.upstox: ("upstox", "symbols"),
+    QKApi.dhan: ("dhan", "symbol_security_pairs"),
+}
+
+# exchange suffixes used by yfinance tickers
+_YF_SUFFIXES = (".NS", ".BO")
+
+
+def resolve_source_path(source: TickerSource) -> Path:
+    """
+    TickerSource values are absolute dev-machine paths.
+    Fall back to the file shipped next to this module.
+    """
+    path = Path(source.value)
+    if path.exists():
+        return path
+    return Path(__file__).parent / path.name
+
+
+def base_symbol(api: QKApi, ticker) -> str:
+    """
+    Provider ticker → bare exchange symbol ("ABB.NS" → "ABB").
+    """
+    if isinstance(ticker, dict):
+        return str(ticker["symbol"])
+
+    ticker = str(ticker)
+    if api == QKApi.yfinance:
+        for suffix in _YF_SUFFIXES:
+            if ticker.endswith(suffix):
+                return ticker[: -len(suffix)]
+    return ticker
+
+
+class TickerUniverse:
+    """
+    Parsed ticker config + hash indexes.
+
+    One instance per source file per process (see load()).
+    The yaml is parsed once and snapshotted to JSON next to it;
+    the snapshot is reused until the yaml's mtime changes.
+    """
+
+    _cache: dict[Path, "TickerUniverse"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, path: Path, config: dict, mtime_ns: int):
+        self.path = path
+        self.config = config
+        self.mtime_ns = mtime_ns
+
+        providers = config.get("providers", {}) or {}
+
+        self._symbols: dict[QKApi, list] = {}
+        self._position: dict[QKApi, dict[str, int]] = {}
+
+        for api, (provider, key) in _PROVIDER_KEYS.items():
+            entries = (providers.get(provider) or {}).get(key) or []
+            self._symbols[api] = entries
+            self._position[api] = {
+                base_symbol(api, e) if api == QKApi.dhan else str(e): i
+                for i, e in enumerate(entries)
+            }
+
+        # dhan symbol <-> security id
+        self._security_id: dict[str, str] = {}
+        self._symbol_for_id: dict[str, str] = {}
+        for pair in self._symbols[QKApi.dhan]:
+            symbol = str(pair["symbol"])
+            security_id = str(pair["security_id"])
+            self._security_id[symbol] = security_id
+            self._symbol_for_id[security_id] = symbol
+
+    # ---------------- LOADING ----------------
+
+    @classmethod
+    def load(cls, source: TickerSource) -> "TickerUniverse":
+        path = resolve_source_path(source)
+        mtime_ns = path.stat().st_mtime_ns
+
+        with cls._lock:
+            cached = cls._cache.get(path)
+            if cached is not None and cached.mtime_ns == mtime_ns:
+                return cached
+
+            universe = cls(path, cls._read_config(path, mtime_ns), mtime_ns)
+            cls._cache[path] = universe
+            return universe
+
+    @classmethod
+    def invalidate(cls) -> None:
+        with cls._lock:
+            cls._cache.clear()
+
+    @staticmethod
+    def _snapshot_path(path: Path) -> Path:
+        return path.with_name(f".{path.name}.snapshot.json")
+
+    @classmethod
+    def _read_config(cls, path: Path, mtime_ns: int) -> dict:
+        snapshot = cls._snapshot_path(path)
+
+        # ---- FAST PATH: JSON SNAPSHOT ----
+        try:
+            with open(snapshot, "r") as f:
+                data = json.load(f)
+            if data.get("mtime_ns") == mtime_ns:
+                return data["config"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        # ---- SLOW PATH: YAML ----
+        with open(path, "r") as f:
+            config = yaml.safe_load(f) or {}
+
+        # best-effort; read-only checkouts just skip the snapshot
+        try:
+            with open(snapshot, "w") as f:
+                json.dump({"mtime_ns": mtime_ns, "config": config}, f)
+        except (OSError, TypeError):
+            pass
+
+        return config
+
+    # ---------------- LOOKUPS ----------------
+
+    def symbols(self, api: QKApi) -> list:
+        if api not in self._symbols:
+            raise ValueError(f"Unsupported API: {api}")
+        return self._symbols[api]
+
+    def index_of(self, api: QKApi, ticker) -> int | None:
+        key = base_symbol(api, ticker) if api == QKApi.dhan else str(ticker)
+        return self._position.get(api, {}).get(key)
+
+    def contains(self, api: QKApi, ticker) -> bool:
+        return self.index_of(api, ticker) is not None
+
+    def security_id(self, ticker, api: QKApi = QKApi.dhan) -> str | None:
+        """
+        Dhan security id for a ticker of any provider naming.
+        """
+        return self._security_id.get(base_symbol(api, ticker))
+
+    def symbol_for_security_id(self, security_id) -> str | None:
+        return self._symbol_for_id.get(str(security_id))
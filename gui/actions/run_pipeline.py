@@ -2,9 +2,14 @@
 
 import threading
 from core.common_types import TickerSource
+from core.fingerprint import df_fingerprint
+from core.profiler import profiler
+from data.fetch_request import QKFetchRequest
 from data.ticker_symbols.ticker_loader import TickerLoader
-from strategies.base.signal_type import Signal
-import pandas as pd
+from strategies.signal_filter import SignalFilter
+
+# tickers fetched + computed concurrently (results still shown in order)
+PIPELINE_WORKERS = 4
 
 
 def run_pipeline_action(controller, ui_refs):
@@ -40,39 +45,12 @@ def run_pipeline_action(controller, ui_refs):
         end=end,
     )
 
-    def passes_signal_filter(
-            df: pd.DataFrame,
-            *,
-            last_n: int
-    ) -> bool:
-        """
-        Show ticker IF in last `n` candles:
-        - At least one BUY or SELL exists
-        Hide ONLY if everything is HOLD.
-        """
-        if last_n <= 0:
-            return True
-
-        tail = df.tail(last_n)
-        print(tail)
-        for col in df.columns:
-            series = df[col]
-
-            # Only strategy signal columns
-            if series.dtype != object:
-                continue
-
-            if not series.isin([Signal.BUY, Signal.SELL, Signal.HOLD]).any():
-                continue
-
-            values = tail[col].dropna().unique()
+    # one immutable request shared by every worker thread
+    request = QKFetchRequest.from_config(api, {**fetch_config, "exchange": exchange})
 
-            # ✅ Any actionable signal → show ticker
-            if Signal.BUY in values or Signal.SELL in values:
-                return True
-
-        # ❌ No BUY or SELL anywhere → HOLD-only → skip
-        return False
+    # runs inside the worker, right after strategies → no chart work
+    # for filtered-out tickers
+    signal_filter = SignalFilter(filter_last_n) if enable_filter else None
 
     if not tickers:
         print("No tickers resolved")
@@ -85,32 +63,47 @@ def run_pipeline_action(controller, ui_refs):
 
     # ---------- BACKGROUND WORKER ----------
     def worker():
-        for ticker in tickers:
+        results = controller.run_many(
+            tickers,
+            request=request,
+            indicators=indicators,
+            strategies=strategies,
+            signal_filter=signal_filter,
+            max_workers=PIPELINE_WORKERS,
+        )
+
+        for ticker, df, error in results:
             try:
-                df = controller.run_pipeline(
-                    api=api,
-                    ticker=ticker,
-                    fetch_config=fetch_config,
-                    indicators=indicators,
-                    strategies=strategies,
-                )
+                if error is not None:
+                    raise error
+
+                if df is None:
+                    continue  # 🔥 filtered out → skip rendering
 
-                if enable_filter:
-                    if not passes_signal_filter(df, last_n=filter_last_n):
-                        continue  # 🔥 skip rendering
+                # hash off the UI thread; chart view redraws only on change
+                fingerprint = df_fingerprint(df)
 
                 # 🔁 Marshal UI update to main thread
                 chart_view.widget.after(
                     0,
-                    lambda t=ticker, d=df: chart_view.append_data(
+                    lambda t=ticker, d=df, fp=fingerprint: chart_view.append_data(
                         ticker=t,
                         df=d,
+                        fingerprint=fp,
                     )
                 )
 
             except Exception as e:
                 print(f"[ERROR] Failed for {ticker}: {e}")
 
+        if profiler.enabled:
+            # chart stages land after this (UI thread) → see next run's report
+            print(profiler.report())
+            print(f"[CACHE] indicators: {controller.indicator_cache.stats()}")
+
+        # drop charts of tickers not shown in this run
+        chart_view.widget.after(0, chart_view.prune)
+
     # ---------- START THREAD ----------
     threading.Thread(
         target=worker,
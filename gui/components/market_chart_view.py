@@ -1,5 +1,6 @@
 import tkinter as tk
 
+from core.fingerprint import df_fingerprint
 from gui.components.base.base_ui_component import UIComponent
 from gui.components.stock_chart import StockChartComponent
 
@@ -7,7 +8,9 @@ from gui.components.stock_chart import StockChartComponent
 class MarketChartView(UIComponent):
     def __init__(self):
         super().__init__()
-        self._charts = {}  # ticker -> SingleTickerChart
+        self._charts = {}        # ticker -> StockChartComponent
+        self._fingerprints = {}  # ticker -> fingerprint of last rendered df
+        self._stale = set()      # tickers not re-appended since clear()
 
     def build(self, parent):
         frame = tk.Frame(parent)
@@ -47,20 +50,66 @@ class MarketChartView(UIComponent):
     # ---------- API ----------
 
     def clear(self):
+        """
+        Logical reset before a new run.
+        Charts are hidden, not destroyed, so unchanged tickers
+        can be re-shown without redrawing.
+        """
         for chart in self._charts.values():
-            chart.widget.destroy()
-        self._charts.clear()
+            chart.widget.pack_forget()
+        self._stale = set(self._charts)
+
+    def prune(self):
+        """
+        Destroy charts that were not re-appended since the last clear().
+        """
+        for ticker in self._stale:
+            self._drop(ticker)
+        self._stale.clear()
 
-    def append_data(self, *, ticker: str, df):
-        chart = StockChartComponent(title=ticker)
-        chart.build(self.inner)
+    def reset(self):
+        """
+        Hard reset: destroy every chart and forget cached renders.
+        """
+        for ticker in list(self._charts):
+            self._drop(ticker)
+        self._stale.clear()
 
-        # 🔥 THIS WAS MISSING
+    def append_data(self, *, ticker: str, df, fingerprint: str | None = None):
+        """
+        Show chart for `ticker`.
+        Redraws only if the data (incl. indicator / signal columns)
+        differs from what the cached chart last rendered.
+        """
+        if fingerprint is None:
+            fingerprint = df_fingerprint(df)
+
+        chart = self._charts.get(ticker)
+        if chart is None:
+            chart = StockChartComponent(title=ticker)
+            chart.build(self.inner)
+            self._charts[ticker] = chart
+
+        # re-pack in append order (keeps scan order stable)
         chart.widget.pack(
             fill="x",
             expand=True,
             padx=8,
             pady=8,
         )
+        self._stale.discard(ticker)
+
+        # 🔥 cache hit → reuse existing artists, no redraw
+        if self._fingerprints.get(ticker) == fingerprint:
+            return
+
         chart.set_data(df)
-        self._charts[ticker] = chart
+        self._fingerprints[ticker] = fingerprint
+
+    # ---------- INTERNAL ----------
+
+    def _drop(self, ticker: str):
+        chart = self._charts.pop(ticker, None)
+        self._fingerprints.pop(ticker, None)
+        if chart is not None:
+            chart.destroy()
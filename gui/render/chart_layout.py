@@ -0,0 +1,202 @@
+# gui/render/chart_layout.py
+"""
+Backend-agnostic chart layout.
+
+Draws candles, indicator overlays and strategy signals onto plain
+matplotlib axes. No tkinter / pyplot imports, so the same layout is
+shared by the Tk chart component and the headless renderer.
+"""
+import numpy as np
+import pandas as pd
+import matplotlib.dates as mdates
+
+from core.time_index import ensure_sorted, time_slice
+from strategies.base.signal_type import Signal
+
+
+PRICE_COLUMNS = {
+    "open", "high", "low", "close", "adjclose", "volume", "timestamp"
+}
+
+REQUIRED_COLUMNS = {"timestamp", "open", "high", "low", "close"}
+
+
+# ---------- CLASSIFICATION ----------
+
+def indicator_scale(name: str) -> str:
+    """
+    Decide which Y-axis an indicator belongs to.
+    """
+    lname = name.lower()
+    if "pct" in lname or "percent" in lname or "range" in lname:
+        return "secondary"
+    return "primary"
+
+
+def is_indicator_column(name: str, series: pd.Series) -> bool:
+    if name in PRICE_COLUMNS:
+        return False
+    if not pd.api.types.is_numeric_dtype(series):
+        return False
+    return True
+
+
+def is_signal_column(series: pd.Series) -> bool:
+    if series.dtype != object:
+        return False
+    return series.isin([Signal.BUY, Signal.SELL]).any()
+
+
+# ---------- RENDER ----------
+
+def _message(ax, text: str):
+    ax.text(
+        0.5, 0.5,
+        text,
+        ha="center",
+        va="center",
+        transform=ax.transAxes,
+    )
+
+
+def draw_chart(ax_price, ax_secondary, source: pd.DataFrame, window: tuple | None = None) -> None:
+    """
+    Render `source` onto the given (already cleared) axes.
+    window=(start, end) → only bars in [start, end) (either may be None);
+    found by binary search, so only the visible rows are copied.
+    """
+    if window is not None and not source.empty and "timestamp" in source:
+        source = time_slice(ensure_sorted(source), *window)
+
+    df = source.copy()
+
+    # ---- EMPTY DF SAFETY ----
+    if df.empty:
+        _message(ax_price, "No data available")
+        return
+
+    # ---- REQUIRED COLUMNS ----
+    if not REQUIRED_COLUMNS.issubset(df.columns):
+        _message(ax_price, "Missing OHLC data")
+        return
+
+    # ---- TIMESTAMP NORMALIZATION ----
+    df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
+    df = df.dropna(subset=["timestamp"])
+    if df.empty:
+        _message(ax_price, "Invalid timestamps")
+        return
+
+    dates = mdates.date2num(df["timestamp"])
+
+    # ---------- CANDLESTICKS ----------
+    # one collection per artist type instead of one artist per candle
+
+    o = df["open"].to_numpy(dtype="float64")
+    h = df["high"].to_numpy(dtype="float64")
+    l = df["low"].to_numpy(dtype="float64")
+    c = df["close"].to_numpy(dtype="float64")
+
+    colors = np.where(c >= o, "green", "red")
+
+    # 0.6 of the typical bar spacing (== 0.6 day for daily candles)
+    width = 0.6 * float(np.median(np.diff(dates))) if len(dates) > 1 else 0.6
+
+    # Wicks
+    ax_price.vlines(dates, l, h, colors=colors, linewidth=1)
+
+    # Bodies
+    ax_price.bar(
+        dates,
+        np.abs(c - o),
+        bottom=np.minimum(o, c),
+        width=width,
+        color=colors,
+        align="center",
+    )
+
+    # ---------- INDICATOR OVERLAYS ----------
+
+    for col in source.columns:
+        series = source[col]
+
+        if not is_indicator_column(col, series):
+            continue
+
+        target_ax = (
+            ax_secondary
+            if indicator_scale(col) == "secondary"
+            else ax_price
+        )
+
+        target_ax.plot(
+            source["timestamp"],
+            series,
+            label=col,
+            linewidth=1.2,
+            linestyle="--" if target_ax is ax_secondary else "-",
+            alpha=0.85,
+        )
+
+    # ---------- STRATEGY SIGNALS ----------
+
+    for col in df.columns:
+        series = df[col]
+
+        if not is_signal_column(series):
+            continue
+
+        buy_idx = series == Signal.BUY
+        sell_idx = series == Signal.SELL
+
+        ax_price.scatter(
+            df.loc[buy_idx, "timestamp"],
+            df.loc[buy_idx, "close"],
+            marker="^",
+            s=90,
+            color="green",
+            zorder=5,
+            label=f"{col} BUY",
+        )
+
+        ax_price.scatter(
+            df.loc[sell_idx, "timestamp"],
+            df.loc[sell_idx, "close"],
+            marker="v",
+            s=90,
+            color="red",
+            zorder=5,
+            label=f"{col} SELL",
+        )
+
+    # ---------- AXIS CONFIG ----------
+
+    ax_price.set_title("Candlestick Chart")
+    ax_price.set_xlabel("Date")
+    ax_price.set_ylabel("Price / MA / VWAP")
+    ax_secondary.set_ylabel("Percent / Ratio")
+
+    ax_price.xaxis_date()
+    ax_price.xaxis.set_major_formatter(
+        mdates.DateFormatter("%Y-%m-%d")
+    )
+
+    ax_price.grid(True, alpha=0.3)
+
+    # ---------- LEGEND (BOTH AXES) ----------
+
+    h1, l1 = ax_price.get_legend_handles_labels()
+    h2, l2 = ax_secondary.get_legend_handles_labels()
+
+    handles = h1 + h2
+    labels = l1 + l2
+
+    if labels:
+        ax_price.legend(
+            handles,
+            labels,
+            loc="upper left",
+            fontsize=8,
+        )
+
+    ax_price.figure.autofmt_xdate()
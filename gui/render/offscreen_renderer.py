@@ -0,0 +1,157 @@
+# gui/render/offscreen_renderer.py
+"""
+Headless chart rendering (Agg backend).
+
+Uses the same layout as StockChartComponent, but draws onto a bare
+matplotlib Figure (no pyplot, no Tk), so charts can be produced from
+worker processes on a server without a display.
+"""
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from core.profiler import profiler
+from gui.render.chart_layout import draw_chart
+
+
+SUPPORTED_FORMATS = {"png", "svg"}
+
+
+def _safe_filename(ticker: str) -> str:
+    # upstox keys look like "NSE_EQ|INE848E01016"
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", ticker)
+
+
+def render_chart(
+    df: pd.DataFrame,
+    path: str | Path,
+    *,
+    title: str | None = None,
+    size: tuple[float, float] = (14, 6),
+    dpi: int = 100,
+    window: tuple | None = None,
+) -> Path:
+    """
+    Render one chart to `path`. Format is taken from the file suffix.
+    window=(start, end) limits it to that time range.
+    """
+    path = Path(path)
+    fmt = path.suffix.lstrip(".").lower()
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported chart format: {fmt!r}")
+
+    with profiler.stage("chart_offscreen", ticker=title) as span:
+        fig = Figure(figsize=size, dpi=dpi)
+        FigureCanvasAgg(fig)
+
+        ax_price = fig.add_subplot(1, 1, 1)
+        ax_secondary = ax_price.twinx()
+
+        draw_chart(ax_price, ax_secondary, df, window)
+
+        if title:
+            fig.suptitle(title)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fig.savefig(path, format=fmt)
+        span.rows = len(df)
+        span.bytes = path.stat().st_size
+
+    return path
+
+
+def _render_job(args) -> tuple[str, str | None, str | None]:
+    ticker, df, path, title, size, dpi, window = args
+    try:
+        out = render_chart(df, path, title=title, size=size, dpi=dpi, window=window)
+        return ticker, str(out), None
+    except Exception as e:
+        return ticker, None, f"{type(e).__name__}: {e}"
+
+
+class OffscreenChartRenderer:
+    """
+    Render many tickers to image files in a process pool.
+    """
+
+    def __init__(
+        self,
+        out_dir: str | Path,
+        *,
+        fmt: str = "png",
+        size: tuple[float, float] = (14, 6),
+        dpi: int = 100,
+        window: tuple | None = None,
+        max_workers: int | None = None,
+    ):
+        fmt = fmt.lower()
+        if fmt not in SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported chart format: {fmt!r}")
+
+        self.out_dir = Path(out_dir)
+        self.fmt = fmt
+        self.size = size
+        self.dpi = dpi
+        self.window = window
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def path_for(self, ticker: str) -> Path:
+        return self.out_dir / f"{_safe_filename(ticker)}.{self.fmt}"
+
+    def render(self, ticker: str, df: pd.DataFrame) -> Path:
+        """
+        Render a single chart in the calling process.
+        """
+        return render_chart(
+            df,
+            self.path_for(ticker),
+            title=ticker,
+            size=self.size,
+            dpi=self.dpi,
+            window=self.window,
+        )
+
+    def render_many(self, frames: dict[str, pd.DataFrame]) -> dict[str, Path]:
+        """
+        Render every (ticker -> df) in parallel.
+        Returns ticker -> written path; failures are reported, not raised.
+        """
+        jobs = [
+            (ticker, df, self.path_for(ticker), ticker, self.size, self.dpi, self.window)
+            for ticker, df in frames.items()
+        ]
+
+        if not jobs:
+            return {}
+
+        if self.max_workers <= 1 or len(jobs) == 1:
+            results = [_render_job(job) for job in jobs]
+        else:
+            results = []
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = [pool.submit(_render_job, job) for job in jobs]
+                for fut in as_completed(futures):
+                    results.append(fut.result())
+
+        written = {}
+        for ticker, path, error in results:
+            if error is not None:
+                print(f"[ERROR] Chart render failed for {ticker}: {error}")
+                continue
+            written[ticker] = Path(path)
+
+        return written
+
+
+from core.test_data_generator import make_test_df
+
+if __name__ == "__main__":
+    demo = {f"DEMO{i}": make_test_df(200) for i in range(8)}
+    renderer = OffscreenChartRenderer("charts_out", fmt="png")
+    out = renderer.render_many(demo)
+    print(f"Rendered {len(out)} charts → {renderer.out_dir.resolve()}")
@@ -173,11 +173,10 @@ def run_pipeline():
     # ---------------- STRATEGY (OPTIONAL) ----------------
 
     if indicator:
-        TheStrategyManager._indicator_manager.add(indicator)
+        TheStrategyManager.add_indicator(indicator)
 
     if strategy:
         TheStrategyManager.add(strategy)
-    TheStrategyManager._indicator_manager.run(df)
     TheStrategyManager.run(df)
 
     chart.set_data(df)
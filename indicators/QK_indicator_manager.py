@@ -1,28 +1,43 @@
 import pandas as pd
+from core.profiler import profiler
 from indicators.base.indicator_base import IndicatorBase
+from indicators.base.timeframe_indicator import OnTimeframe
 
 
 class IndicatorManager:
-    def __init__(self):
+    def __init__(self, cache=None):
         self._indicators = {}  # key -> indicator instance
+        self.cache = cache     # optional IndicatorCache
 
     def clear(self):
         self._indicators.clear()
 
+    @property
+    def indicators(self) -> list[IndicatorBase]:
+        return list(self._indicators.values())
+
     def _make_key(self, indicator: IndicatorBase):
         # unique key per indicator configuration
-        return (indicator.__class__, tuple(sorted(indicator.__dict__.items())))
+        return indicator.cache_key
 
     def add(self, indicator: IndicatorBase):
         key = self._make_key(indicator)
         self._indicators[key] = indicator
         return self
 
+    def remove(self, indicator: IndicatorBase):
+        self._indicators.pop(self._make_key(indicator), None)
+        return self
+
     def run(self, df: pd.DataFrame) -> pd.DataFrame:
         base_index = df.index
+        # timeframe → resampled bars, built once per run on first use
+        bars: dict = {}
 
         for indicator in self._indicators.values():
-            out = indicator.compute(df)
+            with profiler.stage(f"indicator:{type(indicator).__name__}") as span:
+                out = self._compute(indicator, df, bars)
+                span.rows = len(df)
 
             for name, series in out.items():
                 if not series.index.equals(base_index):
@@ -34,6 +49,32 @@ class IndicatorManager:
 
         return df
 
+    def _compute(self, indicator: IndicatorBase, df: pd.DataFrame, bars: dict) -> dict:
+        if self.cache is None:
+            return self._compute_uncached(indicator, df, bars)
+
+        key = self.cache.key(indicator, df)
+        if key is None:
+            return self._compute_uncached(indicator, df, bars)
+
+        out = self.cache.get(key, df.index)
+        if out is None:
+            out = self._compute_uncached(indicator, df, bars)
+            self.cache.put(key, out)
+        return out
+
+    @staticmethod
+    def _compute_uncached(indicator: IndicatorBase, df: pd.DataFrame, bars: dict) -> dict:
+        if not isinstance(indicator, OnTimeframe):
+            return indicator.compute(df)
+
+        frame = bars.get(indicator.timeframe)
+        if frame is None:
+            with profiler.stage("resample") as span:
+                frame = bars[indicator.timeframe] = indicator.resample(df)
+                span.rows = len(df)
+        return indicator.compute_on(df, frame)
+
 
 from indicators.base.indicator_type import IndicatorType
 from core.test_data_generator import make_test_df
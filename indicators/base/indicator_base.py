@@ -1,5 +1,10 @@
 import pandas as pd
 
+from core.stable_id import param_signature, public_params
+
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
 
 class IndicatorBase:
     def compute(self, df: pd.DataFrame) -> dict[str, pd.Series]:
@@ -9,3 +14,56 @@ class IndicatorBase:
         Missing values should be NaN.
         """
         raise NotImplementedError
+
+    # ---------------- IDENTITY ----------------
+
+    def params(self) -> dict:
+        return public_params(self)
+
+    @property
+    def cache_key(self) -> str:
+        """
+        Stable across runs and processes (unlike id() / class objects).
+        """
+        return param_signature(self, self.params())
+
+    def on(self, timeframe) -> "IndicatorBase":
+        """
+        This indicator computed on higher-timeframe bars, e.g.
+        MovingAverage(20).on((Unit.days, 1)) on a 5-minute frame.
+        """
+        from indicators.base.timeframe_indicator import OnTimeframe
+        return OnTimeframe(self, timeframe)
+
+    # ---------------- SCHEMA ----------------
+
+    def inputs(self) -> list[str]:
+        """
+        Columns compute() reads.
+        """
+        return list(OHLCV_COLUMNS)
+
+    def columns(self) -> list[str] | None:
+        """
+        Columns compute() returns. None → only known after running.
+        """
+        return None
+
+    # ---------------- TAIL EVALUATION ----------------
+
+    def warmup(self) -> int | None:
+        """
+        Bars of history needed before a value is fully valid.
+        None → value depends on the whole history (no tail evaluation).
+        """
+        return None
+
+    def tail_start(self, df: pd.DataFrame, last_n: int) -> int:
+        """
+        Row position compute() must start from so that the last
+        `last_n` rows match a full-history run.
+        """
+        warmup = self.warmup()
+        if warmup is None:
+            return 0
+        return max(0, len(df) - last_n - warmup)
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+from core.market_calendar import NSE, MarketCalendar
+from data.resampler import Timeframe, asof_indexer, resample, session_buckets, timeframe_label, timeframe_minutes
+from indicators.base.indicator_base import IndicatorBase
+
+
+class OnTimeframe(IndicatorBase):
+    """
+    `indicator` computed on `timeframe` bars, aligned back to the base
+    frame's rows. Built with indicator.on(timeframe), e.g.
+
+        MovingAverage(20).on((Unit.days, 1))     → column "ma_20_1d"
+
+    A base row only sees higher-timeframe bars that had closed by the
+    end of that row (as-of join), so there is no lookahead.
+
+    IndicatorManager groups these by timeframe and resamples once per
+    timeframe per run; compute() is the standalone path.
+    """
+
+    def __init__(self, indicator: IndicatorBase, timeframe: Timeframe, calendar: MarketCalendar = NSE):
+        self.indicator = indicator
+        self.timeframe = timeframe
+        self._calendar = calendar
+
+    # ---------------- IDENTITY ----------------
+
+    def params(self) -> dict:
+        return {"indicator": self.indicator.cache_key, "timeframe": timeframe_label(self.timeframe)}
+
+    @property
+    def label(self) -> str:
+        return timeframe_label(self.timeframe)
+
+    def column(self, name: str) -> str:
+        return f"{name}_{self.label}"
+
+    # ---------------- SCHEMA ----------------
+
+    def inputs(self) -> list[str]:
+        return ["timestamp", *self.indicator.inputs()]
+
+    def columns(self) -> list[str] | None:
+        inner = self.indicator.columns()
+        return None if inner is None else [self.column(c) for c in inner]
+
+    # ---------------- COMPUTE ----------------
+
+    def resample(self, df: pd.DataFrame) -> pd.DataFrame:
+        return resample(df, self.timeframe, calendar=self._calendar)
+
+    def compute_on(self, df: pd.DataFrame, bars: pd.DataFrame) -> dict[str, pd.Series]:
+        """
+        Compute on already resampled `bars` and align onto `df`.
+        """
+        out = self.indicator.compute(bars)
+        rows = asof_indexer(df["timestamp"], bars["timestamp"], self.timeframe, calendar=self._calendar)
+        known = rows >= 0
+
+        aligned = {}
+        for name, series in out.items():
+            values = np.full(len(df), np.nan)
+            values[known] = series.to_numpy(dtype=np.float64)[rows[known]]
+            aligned[self.column(name)] = pd.Series(values, index=df.index)
+        return aligned
+
+    def compute(self, df: pd.DataFrame) -> dict[str, pd.Series]:
+        return self.compute_on(df, self.resample(df))
+
+    # ---------------- TAIL EVALUATION ----------------
+
+    def tail_start(self, df: pd.DataFrame, last_n: int) -> int:
+        """
+        First base row of the higher bar that starts the inner
+        indicator's warm-up for the tail (one extra bar: a base row
+        reads the previous, completed higher bar).
+        """
+        warmup = self.indicator.warmup()
+        target = len(df) - last_n
+        if warmup is None or target <= 0:
+            return 0
+
+        key, _, _ = session_buckets(df["timestamp"], timeframe_minutes(self.timeframe), self._calendar)
+        first = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+        bucket = int(np.searchsorted(first, target, side="right")) - 1
+        return int(first[max(0, bucket - warmup - 1)])
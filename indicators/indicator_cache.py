@@ -0,0 +1,172 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.fingerprint import df_fingerprint
+from indicators.base.indicator_base import IndicatorBase
+
+
+class IndicatorCache:
+    """
+    Memoized indicator outputs.
+
+    Key = (indicator.cache_key, fingerprint of its input columns + index),
+    so an entry is reused only when the indicator config and the exact
+    data it reads are unchanged.
+
+    - memory: LRU bounded by `max_bytes` of stored arrays
+    - disk (optional): one .npz per key under `disk_dir`, survives restarts
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 256 * 1024 * 1024,
+        disk_dir: str | Path | None = None,
+    ):
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries: OrderedDict[str, dict[str, np.ndarray]] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ---------------- KEYS ----------------
+
+    def key(self, indicator: IndicatorBase, df: pd.DataFrame) -> str | None:
+        """
+        None → inputs not present in df; caller computes uncached.
+        """
+        inputs = indicator.inputs()
+        if any(col not in df.columns for col in inputs):
+            return None
+        return f"{indicator.cache_key}|{df_fingerprint(df, inputs)}"
+
+    def _disk_path(self, key: str) -> Path:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.disk_dir / f"{digest}.npz"
+
+    # ---------------- LOOKUP ----------------
+
+    def get(self, key: str, index: pd.Index) -> dict[str, pd.Series] | None:
+        with self._lock:
+            arrays = self._entries.get(key)
+            if arrays is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._to_series(arrays, index)
+
+        arrays = self._load_disk(key)
+        if arrays is not None:
+            with self._lock:
+                self.disk_hits += 1
+            self._store(key, arrays)
+            return self._to_series(arrays, index)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, out: dict[str, pd.Series]) -> None:
+        # copy → cached arrays never alias a caller's frame
+        arrays = {name: np.array(series.to_numpy(), copy=True) for name, series in out.items()}
+        self._store(key, arrays)
+        self._save_disk(key, arrays)
+
+    # ---------------- INTERNAL ----------------
+
+    @staticmethod
+    def _to_series(arrays: dict[str, np.ndarray], index: pd.Index) -> dict[str, pd.Series]:
+        return {
+            name: pd.Series(values, index=index, name=name, copy=True)
+            for name, values in arrays.items()
+        }
+
+    def _store(self, key: str, arrays: dict[str, np.ndarray]) -> None:
+        size = sum(a.nbytes for a in arrays.values())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._sizes[key]
+
+            self._entries[key] = arrays
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            self._bytes += size
+
+            # 🔥 size-based LRU eviction
+            while self._bytes > self.max_bytes and self._entries:
+                old_key, _ = self._entries.popitem(last=False)
+                self._bytes -= self._sizes.pop(old_key)
+                self.evictions += 1
+
+    def _load_disk(self, key: str) -> dict[str, np.ndarray] | None:
+        if self.disk_dir is None:
+            return None
+
+        path = self._disk_path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data["__key__"]) != key:
+                    return None  # digest collision
+                return {
+                    name: data[name] for name in data.files if name != "__key__"
+                }
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _save_disk(self, key: str, arrays: dict[str, np.ndarray]) -> None:
+        if self.disk_dir is None:
+            return
+
+        # object columns would need pickle → memory only
+        if any(a.dtype == object for a in arrays.values()):
+            return
+
+        path = self._disk_path(key)
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp, "wb") as f:
+                np.savez(f, __key__=np.array(key), **arrays)
+            tmp.replace(path)
+        except OSError as e:
+            print(f"[ERROR] Indicator cache write failed: {e}")
+
+    # ---------------- METRICS ----------------
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (
+                    (self.hits + self.disk_hits) / lookups if lookups else 0.0
+                ),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
@@ -6,3 +6,12 @@ class DayRangePct(IndicatorBase):
         return {
             "day_range_pct": (df["high"] - df["low"]) / df["low"]
         }
+
+    def inputs(self) -> list[str]:
+        return ["high", "low"]
+
+    def columns(self) -> list[str]:
+        return ["day_range_pct"]
+
+    def warmup(self) -> int:
+        return 0
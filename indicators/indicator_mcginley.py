@@ -1,8 +1,12 @@
+import math
 
 from indicators.base.indicator_base import*
 
 
 class McGinleyDynamic(IndicatorBase):
+    # relative error of the seed value tolerated after warm-up
+    CONVERGENCE_TOL = 1e-6
+
     def __init__(self, period: int = 14, source: str = "close", k: float = 0.6):
         self.period = period
         self.source = source
@@ -30,4 +34,15 @@ class McGinleyDynamic(IndicatorBase):
 
         return {f"mcginley_{self.period}": md}
 
+    def inputs(self) -> list[str]:
+        return [self.source]
+
+    def columns(self) -> list[str]:
+        return [f"mcginley_{self.period}"]
+
+    def warmup(self) -> int:
+        # each step closes ~1 / (k * period) of the gap to price,
+        # so the seed's influence decays like (1 - 1 / (k * period)) ** n
+        return math.ceil(self.k * self.period * math.log(1 / self.CONVERGENCE_TOL))
+
 
@@ -13,3 +13,12 @@ class MovingAverage(IndicatorBase):
         ).mean()
 
         return {f"ma_{self.period}": ma}
+
+    def inputs(self) -> list[str]:
+        return [self.source]
+
+    def columns(self) -> list[str]:
+        return [f"ma_{self.period}"]
+
+    def warmup(self) -> int:
+        return self.period - 1
@@ -1,4 +1,6 @@
+import numpy as np
 import pandas as pd
+from core.time_index import epoch_ns
 from indicators.base.indicator_base import IndicatorBase
 
 
@@ -36,5 +38,35 @@ class VWAP(IndicatorBase):
 
         return {self.column_name(): vwap}
 
+    def inputs(self) -> list[str]:
+        return ["timestamp", "high", "low", "close", "volume"]
+
+    def columns(self) -> list[str]:
+        return [self.column_name()]
+
+    def tail_start(self, df: pd.DataFrame, last_n: int) -> int:
+        """
+        Start of the N-day window containing the first tail row.
+        Windows are anchored at the first bar, so this replays the
+        reset rule of compute() one window at a time: each reset is the
+        first bar at or after the window's end (binary search).
+        """
+        target = len(df) - last_n
+        if target <= 0:
+            return 0
+
+        stamps = df["timestamp"]
+        epoch = epoch_ns(stamps)
+        window = pd.Timedelta(days=self.days)
+
+        start_pos = 0
+        current_start = stamps.iloc[0].floor("D")
+        while True:
+            pos = int(np.searchsorted(epoch, (current_start + window).value, "left"))
+            if pos > target or pos >= len(df):
+                return start_pos
+            start_pos = pos
+            current_start = stamps.iloc[pos].floor("D")
+
     def column_name(self):
         return f"vwap_{self.days}d"
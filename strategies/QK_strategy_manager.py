@@ -1,60 +1,80 @@
 
-import pandas as pd
-from strategies.base.strategy_base import StrategyBase
 from indicators.QK_indicator_manager import IndicatorManager
+from strategies.strategy_plan import StrategyPlan, strategy_key
 from strategies.strategy_day_range_breakout import DayRangeBreakoutStrategy
 from strategies.strategy_mcginley_breakout import McGinleyBreakoutStrategy
 
 
 class StrategyManager:
+    """
+    Mutable registration front-end over a compiled StrategyPlan.
+    Every add / remove / clear drops the plan; compile() rebuilds it
+    lazily. Register through these methods only.
+    """
+
     def __init__(self):
         self._strategies = {}   # key -> strategy instance
         self._indicator_manager = IndicatorManager()
-
-    def _make_key(self, strategy):
-        # unique per class + params
-        return (
-            strategy.__class__,
-            tuple(sorted(strategy.__dict__.items()))
-        )
+        self._plan: StrategyPlan | None = None
 
     def add(self, strategy):
-        # key must NOT include _instance_id
-        key = (
-            strategy.__class__,
-            tuple(
-                (k, v) for k, v in strategy.__dict__.items()
-                if k != "_instance_id"
-            )
-        )
+        key = strategy_key(strategy)
 
         # 🔥 if already exists → do nothing
         if key in self._strategies:
             return self
 
-        strategy.increment_counter()
-
         # register indicators
         for ind in strategy.indicators():
             self._indicator_manager.add(ind)
 
         self._strategies[key] = strategy
+        self._plan = None
+        return self
+
+    def add_indicator(self, indicator):
+        self._indicator_manager.add(indicator)
+        self._plan = None
         return self
 
+    def remove(self, strategy):
+        # its indicators stay registered: other strategies may share them
+        self._strategies.pop(strategy_key(strategy), None)
+        self._plan = None
+        return self
+
+    def remove_indicator(self, indicator):
+        self._indicator_manager.remove(indicator)
+        self._plan = None
+        return self
+
+    def compile(self) -> StrategyPlan:
+        if self._plan is None:
+            self._plan = StrategyPlan.compile(
+                self._indicator_manager.indicators,
+                self._strategies.values(),
+            )
+        return self._plan
 
-    def run(self, df):
-        df = self._indicator_manager.run(df)
+    @property
+    def signal_columns(self) -> list[str]:
+        return self.compile().signal_columns
 
-        for strategy in self._strategies.values():
-            print(strategy)
-            signal = strategy.compute(df)
-            df[strategy.signal_name] = signal
+    def tail_start(self, df, last_n: int) -> int:
+        return self.compile().tail_start(df, last_n)
 
-        return df
+    def run(self, df, tail: int | None = None):
+        """
+        tail=None → full history.
+        tail=N    → compute only over the suffix needed for the last N
+                    rows; returns that suffix.
+        """
+        return self.compile().run(df, tail=tail)
 
     def clear(self):
         self._strategies.clear()
         self._indicator_manager.clear()
+        self._plan = None
 
 
 
@@ -2,14 +2,14 @@
 from abc import ABC, abstractmethod
 import pandas as pd
 
+from core.stable_id import param_signature, param_slug, public_params
 
-class StrategyBase(ABC):
-    _counter = 0  # class-level counter
 
+class StrategyBase(ABC):
     signal_column: str  # must be overridden
 
-    def __init__(self):
-        self._instance_id = None
+    # rows before a bar that compute() reads (shift(1) crossovers)
+    lookback: int = 1
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -23,19 +23,35 @@ class StrategyBase(ABC):
                 f"{cls.__name__}.signal_column must be a string"
             )
 
-    def increment_counter(self):
-        type(self)._counter += 1
-        self._instance_id = self._counter
-
+    def params(self) -> dict:
+        return public_params(self)
 
     @property
     def signal_name(self):
-        return f"{self.signal_column}_{self._instance_id}"
+        """
+        Derived from params only (e.g. "ma_cross_9_21"), so the same
+        configuration gets the same column in every run and process.
+        """
+        slug = param_slug(self.params())
+        return f"{self.signal_column}_{slug}" if slug else self.signal_column
+
+    @property
+    def cache_key(self) -> str:
+        return param_signature(self, self.params())
 
     @abstractmethod
     def indicators(self):
         return []
 
+    def required_columns(self) -> list[str]:
+        """
+        Columns compute() reads; defaults to its indicators' outputs.
+        """
+        cols = []
+        for ind in self.indicators():
+            cols.extend(ind.columns() or [])
+        return cols
+
     @abstractmethod
     def compute(self, df: pd.DataFrame) -> pd.Series:
         pass
@@ -0,0 +1,56 @@
+# strategies/signal_filter.py
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from core.time_index import bars_since
+from strategies.base.signal_type import Signal
+
+
+class SignalFilter:
+    """
+    Pipeline stage: keep a ticker only if any strategy emitted
+    BUY or SELL within the last `last_n` candles, or — with `within`
+    (e.g. "3D", "90min") — within that span of the last candle.
+
+    Only the tail of the known signal columns is inspected; a time span
+    is turned into a bar count by binary search on the timestamps.
+    """
+
+    def __init__(self, last_n: int = 0, within=None):
+        self.last_n = last_n
+        self.within = pd.Timedelta(within) if within is not None else None
+
+    @property
+    def enabled(self) -> bool:
+        return self.last_n > 0 or self.within is not None
+
+    def bars(self, df: pd.DataFrame) -> int:
+        """
+        Trailing bars of `df` the filter looks at.
+        """
+        if self.within is None:
+            return min(self.last_n, len(df))
+        return bars_since(df, self.within)
+
+    def passes(self, df: pd.DataFrame, signal_columns: Iterable[str]) -> bool:
+        if not self.enabled:
+            return True
+
+        n = self.bars(df)
+        if n == 0:
+            return False
+
+        for col in signal_columns:
+            if col not in df:
+                continue
+
+            tail = df[col].iloc[-n:].to_numpy()
+
+            # 🔥 early exit on first actionable column
+            if np.any((tail == Signal.BUY) | (tail == Signal.SELL)):
+                return True
+
+        # HOLD-only → skip
+        return False
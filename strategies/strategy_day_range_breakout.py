@@ -7,6 +7,7 @@ from strategies.base.signal_type import Signal
 
 class DayRangeBreakoutStrategy(StrategyBase):
     signal_column = "day_range_break"
+    lookback = 0
 
     def __init__(self, threshold=0.05):
         self.threshold = threshold
@@ -9,17 +9,27 @@ from strategies.base.signal_type import Signal
 class McGinleyBreakoutStrategy(StrategyBase):
     signal_column = "mcg_break_signal"
 
-    def __init__(self, period :int =14, k : float =0.6, price_col="close", mcg_col="mcginley"):
+    def __init__(self, period :int =14, k : float =0.6, price_col="close", mcg_col=None):
         self.period = period
         self.k = k
         self.price = price_col
-        self.mcg = mcg_col
+        # McGinleyDynamic writes "mcginley_<period>"
+        self.mcg = mcg_col or f"mcginley_{period}"
 
     def indicators(self):
         return [
             McGinleyDynamic(period=self.period,source=self.price,k= self.k )
         ]
 
+    def params(self) -> dict:
+        params = super().params()
+        if params["mcg"] == f"mcginley_{self.period}":
+            del params["mcg"]  # derived from period, not a free param
+        return params
+
+    def required_columns(self) -> list[str]:
+        return [self.price, self.mcg]
+
     def compute(self, df: pd.DataFrame) -> pd.Series:
         signal = pd.Series(Signal.HOLD, index=df.index)
 
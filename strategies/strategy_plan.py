@@ -0,0 +1,172 @@
+# strategies/strategy_plan.py
+from typing import Iterable
+
+import pandas as pd
+
+from core.profiler import profiler
+from indicators.QK_indicator_manager import IndicatorManager
+from indicators.base.indicator_base import IndicatorBase, OHLCV_COLUMNS
+from strategies.base.strategy_base import StrategyBase
+
+
+# columns every fetcher frame carries
+BASE_COLUMNS = {"timestamp", "adjclose", *OHLCV_COLUMNS}
+
+
+def strategy_key(strategy: StrategyBase):
+    # unique per class + params
+    return strategy.cache_key
+
+
+def _toposort(indicators: list[IndicatorBase]) -> list[IndicatorBase]:
+    """
+    Order indicators so producers run before consumers of their columns.
+    Stable: independent indicators keep registration order.
+    """
+    producer = {}
+    for i, ind in enumerate(indicators):
+        for col in ind.columns() or []:
+            producer[col] = i
+
+    deps = {
+        i: {
+            producer[col] for col in ind.inputs()
+            if col in producer and producer[col] != i
+        }
+        for i, ind in enumerate(indicators)
+    }
+
+    ordered, done = [], set()
+    while len(ordered) < len(indicators):
+        ready = [i for i in range(len(indicators)) if i not in done and deps[i] <= done]
+        if not ready:
+            cycle = [type(indicators[i]).__name__ for i in range(len(indicators)) if i not in done]
+            raise ValueError(f"Indicator dependency cycle: {cycle}")
+        for i in ready:
+            done.add(i)
+            ordered.append(indicators[i])
+
+    return ordered
+
+
+class StrategyPlan:
+    """
+    Compile once, run many.
+
+    compile() resolves the indicator set (user + strategy dependencies),
+    dedupes it, orders it by column dependencies and fixes every output
+    column name. run() then applies it to each ticker's frame with no
+    per-ticker registration / key building.
+    """
+
+    def __init__(
+        self,
+        indicators: list[IndicatorBase],
+        strategies: list[tuple[str, StrategyBase]],
+        cache=None,
+    ):
+        self._indicator_manager = IndicatorManager(cache=cache)
+        for ind in indicators:
+            self._indicator_manager.add(ind)
+
+        self._strategies = strategies
+        self._lookback = max((s.lookback for _, s in strategies), default=0)
+
+    # ---------------- COMPILE ----------------
+
+    @classmethod
+    def compile(
+        cls,
+        indicators: Iterable[IndicatorBase] = (),
+        strategies: Iterable[StrategyBase] = (),
+        cache=None,
+    ) -> "StrategyPlan":
+        """
+        `cache` (an IndicatorCache) memoizes indicator outputs across
+        runs of this plan and any other plan sharing it.
+        """
+        # ---- STRATEGIES: dedupe + fix signal column names ----
+        resolved: dict = {}
+        for strategy in strategies:
+            resolved.setdefault(strategy_key(strategy), strategy)
+
+        # ---- INDICATORS: user + strategy deps, deduped ----
+        dedup = IndicatorManager()
+        for ind in indicators:
+            dedup.add(ind)
+        for strategy in resolved.values():
+            for ind in strategy.indicators():
+                dedup.add(ind)
+
+        plan = cls(
+            _toposort(dedup.indicators),
+            [(s.signal_name, s) for s in resolved.values()],
+            cache=cache,
+        )
+        plan._validate()
+        return plan
+
+    def _validate(self) -> None:
+        produced = set(BASE_COLUMNS)
+        for ind in self.indicators:
+            cols = ind.columns()
+            if cols is None:
+                return  # dynamic outputs → can only check at run time
+            produced.update(cols)
+
+        for name, strategy in self._strategies:
+            missing = [c for c in strategy.required_columns() if c not in produced]
+            if missing:
+                raise ValueError(
+                    f"Strategy '{name}' needs columns no indicator produces: {missing}"
+                )
+
+    # ---------------- INSPECTION ----------------
+
+    @property
+    def indicators(self) -> list[IndicatorBase]:
+        return self._indicator_manager.indicators
+
+    @property
+    def indicator_columns(self) -> list[str]:
+        return [c for ind in self.indicators for c in (ind.columns() or [])]
+
+    @property
+    def signal_columns(self) -> list[str]:
+        return [name for name, _ in self._strategies]
+
+    # ---------------- EXECUTION ----------------
+
+    def tail_start(self, df: pd.DataFrame, last_n: int) -> int:
+        """
+        Smallest suffix start that keeps the last `last_n` signals exact:
+        each indicator's warm-up plus the strategies' own lookback.
+        """
+        need = last_n + self._lookback
+
+        return min(
+            (ind.tail_start(df, need) for ind in self.indicators),
+            default=max(0, len(df) - need),
+        )
+
+    def run(self, df: pd.DataFrame, tail: int | None = None) -> pd.DataFrame:
+        """
+        tail=None → full history.
+        tail=N    → compute only over the suffix needed for the last N
+                    rows; returns that suffix.
+        """
+        if tail is not None:
+            start = self.tail_start(df, tail)
+            df = df.iloc[start:].copy()
+
+        with profiler.stage("indicators") as span:
+            df = self._indicator_manager.run(df)
+            span.rows = len(df)
+
+        with profiler.stage("strategies") as span:
+            for name, strategy in self._strategies:
+                df[name] = strategy.compute(df)
+            span.rows = len(df)
+            span.bytes = int(df.memory_usage(index=False).sum())
+
+        return df
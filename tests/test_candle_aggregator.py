@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from core.test_data_generator import make_test_df
+from data.live_data.candle_aggregator import CandleAggregator
+from data.live_data.tick_source_replay import ReplayTickSource, load_ticks, synthetic_ticks
+
+
+def test_preload_us_frame_keeps_timestamps():
+    df = make_test_df(5, freq="1min", seed=1)
+    assert df["timestamp"].dt.unit == "us"
+
+    agg = CandleAggregator(minutes=1)
+    agg.preload("X", df)
+    out = agg.frame("X")
+    assert list(out["timestamp"]) == list(df["timestamp"])
+    np.testing.assert_array_equal(out["close"].to_numpy(), df["close"].to_numpy())
+
+
+def test_load_ticks_parses_to_epoch_ns():
+    ticks = load_ticks(pd.DataFrame({
+        "timestamp": ["2025-01-01 09:15:00", "2025-01-01 09:15:01"],
+        "symbol": ["X", "X"],
+        "price": [100.0, 101.0],
+        "volume": [10, 20],
+    }))
+    expected = pd.Timestamp("2025-01-01 09:15:00", tz="Asia/Kolkata").value
+    assert ticks["timestamp"].tolist() == [expected, expected + 10**9]
+
+
+def test_synthetic_ticks_reaggregate_us_frame():
+    df = make_test_df(30, freq="1min", seed=2)
+    tape = load_ticks(synthetic_ticks(df, "X", seed=0))
+    assert tape["timestamp"].iloc[0] == df["timestamp"].iloc[0].value
+
+    agg = CandleAggregator(minutes=1)
+    for tick in ReplayTickSource(tape):
+        agg.on_tick(tick)
+    out = agg.frame("X")
+
+    assert list(out["timestamp"]) == list(df["timestamp"])
+    np.testing.assert_allclose(out[["open", "high", "low", "close"]].to_numpy(), df[["open", "high", "low", "close"]].to_numpy())
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+from core.common_types import QKApi, Unit
+from core.test_data_generator import make_test_df
+from data.columnar_store import ColumnarStore
+
+
+def test_roundtrip_us_frame(tmp_path):
+    df = make_test_df(50, freq="1D", seed=1)
+    assert df["timestamp"].dt.unit == "us"
+
+    store = ColumnarStore(tmp_path)
+    series = store.write("X", df, unit=Unit.days, interval=1)
+
+    out = series.frame()
+    pd.testing.assert_series_equal(out["timestamp"].dt.as_unit("us"), df["timestamp"])
+    np.testing.assert_array_equal(out["close"].to_numpy(), df["close"].to_numpy())
+
+    lo, hi = series.bounds("2025-01-10", "2025-01-20")
+    assert (lo, hi) == (9, 19)
+    assert series.frame("2025-01-10", "2025-01-20")["timestamp"].iloc[0] == pd.Timestamp("2025-01-10 09:15", tz="Asia/Kolkata")
+    store.close()
+
+
+def test_merge_mixed_resolutions(tmp_path):
+    df = make_test_df(40, freq="1D", seed=2)
+    store = ColumnarStore(tmp_path)
+    store.write("X", df.iloc[:25])
+    tail = df.iloc[20:].assign(timestamp=df["timestamp"].iloc[20:].dt.as_unit("ns"))
+    series = store.write("X", tail)
+
+    assert len(series) == 40
+    pd.testing.assert_series_equal(
+        series.frame()["timestamp"].dt.as_unit("us"), df["timestamp"], check_names=False,
+    )
+    store.close()
+
+
+def test_series_are_keyed_by_api(tmp_path):
+    store = ColumnarStore(tmp_path)
+    store.write("X", make_test_df(10, freq="1D", seed=1), api=QKApi.upstox, covered=("2025-01-01", "2025-01-10"))
+    store.write("X", make_test_df(5, freq="1D", seed=2), api=QKApi.dhan)
+
+    assert len(store.open("X", api=QKApi.upstox)) == 10
+    assert len(store.open("X", api=QKApi.dhan)) == 5
+    assert store.open("X") is None
+    assert store.covers("X", Unit.days, 1, "2025-01-02", "2025-01-05", api=QKApi.upstox)
+    assert not store.covers("X", Unit.days, 1, "2025-01-02", "2025-01-05", api=QKApi.dhan)
+    assert store.symbols(api=QKApi.upstox) == ["X"]
+    assert (tmp_path / "upstox" / "1d" / "X" / "meta.json").is_file()
+    store.close()
+
+
+def test_write_without_coverage_keeps_stored_range(tmp_path):
+    df = make_test_df(20, freq="1D", seed=3)
+    store = ColumnarStore(tmp_path)
+    store.write("X", df.iloc[:15], covered=("2025-01-01", "2025-01-15"))
+    series = store.write("X", df.iloc[10:])
+
+    assert len(series) == 20
+    assert series.covered == ("2025-01-01", "2025-01-15")
+    store.close()
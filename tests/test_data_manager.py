@@ -0,0 +1,50 @@
+from core.common_types import QKApi
+from data.columnar_store import ColumnarStore
+from data.fetch_request import QKFetchRequest
+from data.QK_data_manager import QKHistoricalData
+from data.historical_data.fetcher_registry import FetcherRegistry
+from data.historical_data.fetcher_synthetic import SyntheticFetcher
+
+
+def test_close_leaves_shared_registry_open():
+    registry = FetcherRegistry({QKApi.yfinance: lambda: SyntheticFetcher(seed=1)})
+    first = QKHistoricalData(registry=registry)
+    second = QKHistoricalData(registry=registry)
+
+    fetcher = first.fetcher
+    first.close()
+    assert registry.active() == [QKApi.yfinance]
+    assert second.fetcher is fetcher
+
+
+class _Flaky(SyntheticFetcher):
+    """
+    Answers empty until `ready` is set.
+    """
+
+    def __init__(self):
+        super().__init__(seed=1)
+        self.ready = False
+        self.calls = 0
+
+    def _fetch_historical(self, symbol, start, end, unit, interval):
+        self.calls += 1
+        if not self.ready:
+            return []
+        return super()._fetch_historical(symbol, start, end, unit, interval)
+
+
+def test_empty_fetch_is_not_recorded_as_covered(tmp_path):
+    fetcher = _Flaky()
+    registry = FetcherRegistry({QKApi.yfinance: lambda: fetcher})
+    data = QKHistoricalData(registry=registry, store=ColumnarStore(tmp_path))
+    request = QKFetchRequest(from_date="2025-01-06", to_date="2025-01-10")
+
+    assert data.fetch("AAA", request).empty
+    assert data.store.open("AAA", api=QKApi.yfinance).covered is None
+
+    fetcher.ready = True
+    assert not data.fetch("AAA", request).empty
+    data.fetch("AAA", request)
+    assert fetcher.calls == 2   # the third call is served from the store
+    data.close()
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from backtest.event_backtester import BacktestConfig, EventBacktester
+from core.market_panel import MarketPanel
+from core.test_data_generator import make_test_df
+
+
+def _daily():
+    frames = {s: make_test_df(300, freq="1D", seed=i) for i, s in enumerate("AB")}
+    panel = MarketPanel.from_frames(frames)
+    signals = np.zeros(panel.shape, dtype=np.int8)
+    signals[10::40] = 1
+    signals[30::40] = -1
+    return panel, signals
+
+
+def test_daily_panel_carries_orders_and_positions():
+    panel, signals = _daily()
+    result = EventBacktester(BacktestConfig(square_off=None, allow_short=False)).run(panel, signals)
+
+    trades = result.trades
+    assert len(trades) == 2 * 8  # last BUY is closed at the end of data
+    # entered the bar after the BUY, held across sessions until the bar after the SELL
+    closed = trades[trades["reason"] == "SIGNAL"]
+    assert len(closed) == 2 * 7
+    assert ((closed["exit_time"] - closed["entry_time"]) == np.timedelta64(20, "D")).all()
+
+
+def test_daily_panel_rejects_square_off():
+    panel, signals = _daily()
+    with pytest.raises(ValueError, match="square_off"):
+        EventBacktester().run(panel, signals)
+
+
+def test_intraday_orders_do_not_carry_overnight():
+    df = make_test_df(750, freq="1min", seed=3)
+    df = df[df["timestamp"].dt.strftime("%H:%M") < "15:30"]
+    panel = MarketPanel.from_frames({"A": df})
+    signals = np.zeros(panel.shape, dtype=np.int8)
+    signals[-1, 0] = 1  # last bar of the data: nothing left to fill on
+
+    assert EventBacktester().run(panel, signals).stats()["trades"] == 0
@@ -0,0 +1,90 @@
+import time
+from datetime import datetime
+
+from core.common_types import QKApi
+from core.test_data_generator import make_test_df
+from data.historical_data.base.data_fetcher_base import DataFetcherBase
+from data.historical_data.fetcher_composite import CompositeFetcher
+
+
+class _Fetcher(DataFetcherBase):
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+
+    def _connect(self) -> None:
+        return
+
+    def _fetch_historical(self, symbol, start, end, unit, interval):
+        self.calls += 1
+        time.sleep(self.delay)
+        return make_test_df(10, seed=1)
+
+    def _fetch_intraday(self, symbol, unit, interval):
+        return self._fetch_historical(symbol, None, None, unit, interval)
+
+
+def _fetch(fetcher):
+    return fetcher.fetch_df(symbol="X", intraday=False, start=datetime(2025, 1, 1), end=datetime(2025, 2, 1))
+
+
+def test_hooks_delegate_to_primary():
+    primary, backup = _Fetcher(0.0), _Fetcher(0.0)
+    composite = CompositeFetcher([(QKApi.upstox, primary), (QKApi.dhan, backup)])
+
+    out = composite._fetch_historical("X", datetime(2025, 1, 1), datetime(2025, 2, 1), None, 1)
+    assert len(out) == 10
+    assert (primary.calls, backup.calls) == (1, 0)
+    composite.close()
+
+
+def test_demoted_provider_is_probed():
+    slow, fast = _Fetcher(0.0), _Fetcher(0.0)
+    composite = CompositeFetcher(
+        [(QKApi.upstox, slow), (QKApi.dhan, fast)],
+        min_samples=2, probe_interval=0.2,
+    )
+    # upstox looked slow earlier; dhan's hedge delay (1s) is never reached
+    for _ in range(2):
+        composite.stats[QKApi.upstox].record(5.0, ok=True)
+        composite.stats[QKApi.dhan].record(1.0, ok=True)
+
+    for _ in range(4):
+        _fetch(composite)
+    assert (slow.calls, fast.calls) == (0, 4)
+
+    time.sleep(0.25)
+    _fetch(composite)
+    assert slow.calls == 1
+    assert composite.stats[QKApi.upstox].probes == 1
+
+    _fetch(composite)
+    assert slow.calls == 1  # one probe per interval
+    composite.close()
+
+
+class _Failing(_Fetcher):
+    def _fetch_historical(self, symbol, start, end, unit, interval):
+        self.calls += 1
+        raise ConnectionError("down")
+
+
+def test_failover_is_not_counted_as_hedge():
+    composite = CompositeFetcher([(QKApi.upstox, _Failing(0.0)), (QKApi.dhan, _Fetcher(0.0))], adaptive=False)
+    _fetch(composite)
+
+    dhan = composite.stats[QKApi.dhan]
+    assert (dhan.hedges_won, dhan.failovers_won) == (0, 1)
+    composite.close()
+
+
+def test_hedge_win_is_counted():
+    slow, fast = _Fetcher(0.3), _Fetcher(0.0)
+    composite = CompositeFetcher([(QKApi.upstox, slow), (QKApi.dhan, fast)], min_samples=2, adaptive=False)
+    for _ in range(2):
+        composite.stats[QKApi.upstox].record(0.01, ok=True)
+
+    _fetch(composite)
+    dhan = composite.stats[QKApi.dhan]
+    assert (dhan.hedges_won, dhan.failovers_won) == (1, 0)
+    composite.close()
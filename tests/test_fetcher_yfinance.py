@@ -0,0 +1,83 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from data.historical_data.fetcher_yfinance import YahooFetcher
+
+
+def _history_frame(rows: int = 5) -> pd.DataFrame:
+    # Ticker.history shape: tz-aware "Date" index, flat columns
+    index = pd.date_range("2025-01-01", periods=rows, freq="1D", tz="Asia/Kolkata", name="Date")
+    close = np.linspace(100, 104, rows)
+    return pd.DataFrame({
+        "Open": close - 1, "High": close + 1, "Low": close - 2, "Close": close,
+        "Volume": np.arange(rows) * 1000.0, "Dividends": 0.0, "Stock Splits": 0.0,
+    }, index=index)
+
+
+def test_history_frame_to_schema(monkeypatch):
+    monkeypatch.setattr(YahooFetcher, "_history", staticmethod(lambda symbol, **kw: _history_frame()))
+    df = YahooFetcher().fetch_df(symbol="X.NS", intraday=False, start=datetime(2025, 1, 1), end=datetime(2025, 1, 6))
+
+    assert list(df.columns) == ["timestamp", "open", "high", "low", "close", "adjclose", "volume"]
+    np.testing.assert_array_equal(df["adjclose"], df["close"])
+    assert df["volume"].dtype == np.int64
+
+
+def test_fetches_run_concurrently(monkeypatch):
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def history(symbol, **kw):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return _history_frame()
+
+    monkeypatch.setattr(YahooFetcher, "_history", staticmethod(history))
+    fetcher = YahooFetcher()
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(lambda s: fetcher.fetch_df(
+            symbol=s, intraday=False, start=datetime(2025, 1, 1), end=datetime(2025, 1, 6),
+        ), ["A", "B", "C", "D"]))
+    assert peak[0] > 1
+
+
+def test_normalize_df_coerces_dtypes():
+    raw = pd.DataFrame({
+        "timestamp": pd.date_range("2025-01-01", periods=3, freq="1D"),
+        "open": [1, 2, 3],                                  # int → float64
+        "high": np.array([2.0, 3.0, 4.0], dtype="float32"),
+        "low": pd.array([0.5, 1.5, 2.5], dtype="Float64"),  # nullable
+        "close": [1.5, 2.5, 3.5],
+        "volume": [100.0, np.nan, 300.0],
+    })
+    df = YahooFetcher._normalize_df(raw)
+
+    assert list(df.columns) == ["timestamp", "open", "high", "low", "close", "adjclose", "volume"]
+    assert (df.dtypes.drop(["timestamp", "volume"]) == np.float64).all()
+    assert df["volume"].dtype == np.int64
+    assert df["volume"].tolist() == [100, 0, 300]                # missing volume → 0
+    np.testing.assert_array_equal(df["adjclose"], raw["close"])  # no adjclose → close
+
+    nullable = raw.assign(volume=pd.array([1, None, 3], dtype="Int64"), adjclose=[1.0, 2.0, 3.0])
+    df = YahooFetcher._normalize_df(nullable)
+    assert df["volume"].tolist() == [1, 0, 3]
+    assert df["adjclose"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_download_multiindex_columns_are_flattened():
+    flat = _history_frame(3).drop(columns=["Dividends", "Stock Splits"]).assign(**{"Adj Close": 9.0})
+    raw = flat.set_axis(pd.MultiIndex.from_product([flat.columns, ["X.NS"]], names=["Price", "Ticker"]), axis=1)
+
+    df = YahooFetcher._normalize_df(YahooFetcher._to_frame(raw))
+    assert df["adjclose"].tolist() == [9.0] * 3
+    np.testing.assert_array_equal(df["close"], flat["Close"])
+    assert df["timestamp"].tolist() == flat.index.tolist()
@@ -0,0 +1,31 @@
+from core.fingerprint import df_fingerprint
+from core.test_data_generator import make_test_df
+
+
+def test_equal_content_equal_fingerprint():
+    df = make_test_df(200, seed=1)
+    assert df_fingerprint(df) == df_fingerprint(df.copy())
+    assert df_fingerprint(df) == df_fingerprint(make_test_df(200, seed=1))
+
+
+def test_any_change_changes_fingerprint():
+    df = make_test_df(200, seed=1)
+    base = df_fingerprint(df)
+
+    edited = df.copy()
+    edited.loc[150, "close"] += 0.01
+    assert df_fingerprint(edited) != base
+
+    assert df_fingerprint(df.assign(signal=0)) != base                  # new column (e.g. a signal)
+    assert df_fingerprint(df.astype({"volume": "float64"})) != base     # dtype
+    assert df_fingerprint(df.iloc[:-1]) != base                         # one bar less
+    assert df_fingerprint(df.iloc[:0]) != df_fingerprint(df.iloc[:0].assign(signal=0))
+
+
+def test_columns_and_index_selection():
+    df = make_test_df(50, seed=2)
+    shifted = df.set_axis(df.index + 10)
+
+    assert df_fingerprint(df) != df_fingerprint(shifted)
+    assert df_fingerprint(df, include_index=False) == df_fingerprint(shifted, include_index=False)
+    assert df_fingerprint(df, ["close"]) == df_fingerprint(df.assign(open=0.0), ["close"])
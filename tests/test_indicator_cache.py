@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+from core.test_data_generator import make_test_df
+from indicators.QK_indicator_manager import IndicatorManager
+from indicators.indicator_cache import IndicatorCache
+from indicators.indicator_moving_average import MovingAverage
+
+
+def _out(n: int, value: float = 1.0) -> dict[str, pd.Series]:
+    return {"x": pd.Series(np.full(n, value))}   # n × 8 bytes
+
+
+def test_manager_reuses_outputs_for_unchanged_inputs():
+    cache = IndicatorCache()
+    manager = IndicatorManager(cache=cache).add(MovingAverage(5)).add(MovingAverage(9))
+    df = make_test_df(200, seed=1)
+
+    first = manager.run(df.copy())
+    second = manager.run(df.copy())
+    pd.testing.assert_frame_equal(first, second)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # only the close column is read → volume edits still hit
+    manager.run(df.assign(volume=0))
+    assert cache.hits == 4
+
+    edited = df.copy()
+    edited.loc[199, "close"] += 1.0
+    out = manager.run(edited)
+    assert cache.misses == 4
+    assert out["ma_5"].iloc[-1] != first["ma_5"].iloc[-1]
+
+
+def test_key_tracks_config_and_data():
+    cache = IndicatorCache()
+    df = make_test_df(50, seed=2)
+    assert cache.key(MovingAverage(5), df) == cache.key(MovingAverage(5), df.copy())
+    assert cache.key(MovingAverage(5), df) != cache.key(MovingAverage(6), df)
+    assert cache.key(MovingAverage(5), df) != cache.key(MovingAverage(5), df.iloc[1:])
+    assert cache.key(MovingAverage(5, source="ma_9"), df) is None
+
+
+def test_lru_eviction_by_bytes():
+    cache = IndicatorCache(max_bytes=2_000)
+    cache.put("a", _out(100))
+    cache.put("b", _out(100))
+    assert cache.stats()["bytes"] == 1_600
+
+    assert cache.get("a", pd.RangeIndex(100)) is not None   # a is now most recent
+    cache.put("c", _out(100))
+
+    assert cache.evictions == 1
+    assert cache.get("b", pd.RangeIndex(100)) is None
+    assert cache.get("a", pd.RangeIndex(100)) is not None
+    assert cache.stats()["bytes"] == 1_600
+
+    cache.put("big", _out(1_000))                            # larger than the whole budget
+    assert cache.get("big", pd.RangeIndex(1_000)) is None
+    assert cache.stats()["entries"] == 2
+
+
+def test_hit_returns_fresh_series_on_the_callers_index(tmp_path):
+    cache = IndicatorCache(disk_dir=tmp_path)
+    cache.put("k", _out(3, 2.0))
+
+    index = pd.RangeIndex(10, 13)
+    out = cache.get("k", index)["x"]
+    assert out.index.equals(index)
+    out.iloc[0] = -1.0
+    assert cache.get("k", index)["x"].iloc[0] == 2.0
+
+    cache.clear()
+    assert cache.get("k", index)["x"].tolist() == [2.0] * 3
+    assert cache.disk_hits == 1
@@ -0,0 +1,44 @@
+import threading
+import time
+
+import pandas as pd
+
+from core.test_data_generator import make_test_df
+from data.live_data.candle_aggregator import CandleAggregator
+from data.live_data.live_pipeline import LivePipeline
+from data.live_data.tick_source_dhan import DhanTickSource
+from data.live_data.tick_source_replay import ReplayTickSource, synthetic_ticks
+from strategies.strategy_ma_crossover import MACrossoverStrategy
+from strategies.strategy_plan import StrategyPlan
+
+
+def test_join_never_evaluates_a_symbol_concurrently():
+    frames = {s: make_test_df(120, freq="1min", seed=i) for i, s in enumerate(("A", "B", "C"))}
+    tape = pd.concat([synthetic_ticks(df, s, seed=i) for i, (s, df) in enumerate(frames.items())])
+
+    busy, overlaps, last = set(), [], {}
+    lock = threading.Lock()
+
+    def on_update(update):
+        with lock:
+            if update.symbol in busy:
+                overlaps.append(update.symbol)
+            busy.add(update.symbol)
+        time.sleep(0.001)  # widen the window a race would need
+        with lock:
+            busy.discard(update.symbol)
+            last[update.symbol] = update.frame["timestamp"].iloc[-1]
+
+    plan = StrategyPlan.compile(strategies=[MACrossoverStrategy(9, 21)])
+    pipe = LivePipeline(plan, CandleAggregator(minutes=1), on_update, partial=False, max_wait=0.001)
+    pipe.start(ReplayTickSource(tape)).join()
+
+    assert overlaps == []
+    assert last == {s: df["timestamp"].iloc[-1] for s, df in frames.items()}
+    assert pipe.latency_report()["evaluations"] == pipe.evaluations
+
+
+def test_dhan_day_anchor_is_exchange_midnight():
+    midnight = pd.Timestamp(DhanTickSource._today_ns(), tz="UTC").tz_convert("Asia/Kolkata")
+    assert (midnight.hour, midnight.minute) == (0, 0)
+    assert midnight.date() == pd.Timestamp.now(tz="Asia/Kolkata").date()
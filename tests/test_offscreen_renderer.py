@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+from core.test_data_generator import make_test_df
+from gui.render.chart_layout import draw_chart, indicator_scale
+from gui.render.offscreen_renderer import OffscreenChartRenderer, render_chart
+from strategies.base.signal_type import Signal
+
+
+def _axes():
+    ax = Figure().add_subplot(1, 1, 1)
+    return ax, ax.twinx()
+
+
+def _wicks(ax) -> int:
+    return sum(len(c.get_segments()) for c in ax.collections if isinstance(c, LineCollection))
+
+
+def test_draw_chart_layout():
+    df = make_test_df(60, seed=1)
+    df["ma_9"] = df["close"].rolling(9).mean()
+    df["day_range_pct"] = 0.5
+    df["signal"] = np.where(df.index % 20 == 5, Signal.BUY, Signal.HOLD).astype(object)
+    df.loc[15, "signal"] = Signal.SELL
+
+    price, secondary = _axes()
+    draw_chart(price, secondary, df)
+
+    assert _wicks(price) == 60
+    assert [line.get_label() for line in price.get_lines()] == ["ma_9"]
+    assert [line.get_label() for line in secondary.get_lines()] == ["day_range_pct"]
+    labels = price.get_legend_handles_labels()[1]
+    assert "signal BUY" in labels and "signal SELL" in labels
+    assert indicator_scale("VWAP") == "primary"
+
+
+def test_draw_chart_window_and_empty():
+    df = make_test_df(60, seed=2)
+    price, secondary = _axes()
+    draw_chart(price, secondary, df, window=(df["timestamp"].iloc[10], df["timestamp"].iloc[30]))
+    assert _wicks(price) == 20
+
+    price, secondary = _axes()
+    draw_chart(price, secondary, df.iloc[:0])
+    assert [t.get_text() for t in price.texts] == ["No data available"]
+
+    price, secondary = _axes()
+    draw_chart(price, secondary, df.drop(columns="low"))
+    assert [t.get_text() for t in price.texts] == ["Missing OHLC data"]
+
+
+@pytest.mark.parametrize("fmt, magic", [("png", b"\x89PNG"), ("svg", b"<?xml")])
+def test_render_chart_formats(tmp_path, fmt, magic):
+    path = render_chart(make_test_df(30, seed=3), tmp_path / "sub" / f"x.{fmt}", title="X")
+    assert path.read_bytes().startswith(magic)
+
+    with pytest.raises(ValueError):
+        render_chart(make_test_df(30), tmp_path / "x.jpg")
+
+
+def test_render_many_in_processes(tmp_path):
+    renderer = OffscreenChartRenderer(tmp_path, max_workers=2)
+    frames = {f"NSE_EQ|DEMO{i}": make_test_df(40, seed=i) for i in range(3)}
+    frames["BROKEN"] = None   # failures are reported, not raised
+
+    written = renderer.render_many(frames)
+
+    assert set(written) == set(frames) - {"BROKEN"}
+    for ticker, path in written.items():
+        assert path == tmp_path / f"{ticker.replace('|', '_')}.png"
+        assert path.read_bytes().startswith(b"\x89PNG")
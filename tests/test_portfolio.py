@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.portfolio import PortfolioConfig, PortfolioEngine, bars_per_year
+from core.market_panel import MarketPanel
+
+
+def _panel(timestamps):
+    close = np.array([
+        [100.0, 50.0],
+        [102.0, 51.0],
+        [101.0, 53.0],
+        [105.0, 52.0],
+        [108.0, 55.0],
+    ])
+    open_ = close - 1.0
+    return MarketPanel(
+        symbols=("A", "B"),
+        timestamps=pd.DatetimeIndex(timestamps),
+        open=open_,
+        high=close + 1.0,
+        low=open_ - 1.0,
+        close=close,
+        volume=np.full(close.shape, 1000, dtype=np.int64),
+        valid=np.ones(close.shape, dtype=bool),
+    )
+
+
+def _signals():
+    signals = np.zeros((5, 2), dtype=np.int8)
+    signals[0, 0] = 1     # A: bought at bar 1's open, held to the end
+    signals[1, 1] = 1     # B: bought at bar 2's open ...
+    signals[2, 1] = -1    # ... sold at bar 3's open
+    return signals
+
+
+CFG = PortfolioConfig(initial_capital=10_000.0, max_positions=2, max_weight=0.5)
+DAILY = pd.date_range("2025-01-06", periods=5, freq="B", tz="Asia/Kolkata")
+INTRADAY = pd.date_range("2025-01-06 09:15", periods=5, freq="5min", tz="Asia/Kolkata")
+
+
+def test_equity_on_tiny_fixture():
+    result = PortfolioEngine(CFG).run(_panel(DAILY), _signals())
+
+    # A: half of 10000 at 101 → 49 shares; B: half of equity at bar 2's
+    # open (5051 cash + 49 × 100) at 52 → 95
+    assert result.shares[:, 0].tolist() == [0, 49, 49, 49, 49]
+    assert result.shares[:, 1].tolist() == [0, 0, 95, 0, 0]
+
+    cash = 10_000.0 - 49 * 101.0 - 95 * 52.0 + 95 * 51.0
+    np.testing.assert_allclose(result.equity.to_numpy()[-1], cash + 49 * 108.0)
+    np.testing.assert_allclose(result.symbol_pnl.to_numpy(), [49 * (108 - 101), 95 * (51 - 52)])
+    np.testing.assert_allclose(
+        result.symbol_pnl.sum(), result.equity.iloc[-1] - result.equity.iloc[0]
+    )
+
+
+@pytest.mark.parametrize("timestamps, periods", [(DAILY, 252), (INTRADAY, 252 * 75)])
+def test_sharpe_is_annualized_from_bar_spacing(timestamps, periods):
+    result = PortfolioEngine(CFG).run(_panel(timestamps), _signals())
+    assert result.periods_per_year == periods
+
+    eq = result.equity.to_numpy()
+    rets = np.diff(eq) / eq[:-1]
+    expected = rets.mean() / rets.std() * np.sqrt(periods)
+    assert result.stats()["sharpe"] == pytest.approx(expected)
+
+
+def test_periods_per_year_override():
+    cfg = PortfolioConfig(initial_capital=10_000.0, max_positions=2, max_weight=0.5, periods_per_year=52)
+    assert PortfolioEngine(cfg).run(_panel(DAILY), _signals()).periods_per_year == 52
+
+
+def test_bars_per_year_ignores_overnight_gaps():
+    stamps = pd.date_range("2025-01-06 09:15", "2025-01-07 15:29", freq="15min", tz="Asia/Kolkata")
+    stamps = stamps[stamps.indexer_between_time("09:15", "15:29")]
+    assert bars_per_year(stamps) == 252 * 25
@@ -0,0 +1,24 @@
+from core.profiler import Profiler
+
+
+def test_events_are_bounded():
+    prof = Profiler(enabled=True, max_events=10)
+    for i in range(25):
+        with prof.stage("fetch", ticker=f"T{i}") as span:
+            span.rows = 1
+
+    assert len(prof.events) == 10
+    assert prof.dropped == 15
+    assert prof.events[-1]["ticker"] == "T24"
+    assert prof.summary()["fetch"]["count"] == 10
+    assert "15 older dropped" in prof.report()
+
+    prof.reset()
+    assert prof.events == [] and prof.dropped == 0
+
+
+def test_disabled_records_nothing():
+    prof = Profiler(enabled=False)
+    with prof.stage("fetch") as span:
+        span.rows = 5
+    assert prof.events == []
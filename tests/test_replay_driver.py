@@ -0,0 +1,29 @@
+from core.test_data_generator import make_test_df
+from data.live_data.replay_driver import ReplayDriver, candles_tape, load_candles
+from strategies.strategy_ma_crossover import MACrossoverStrategy
+from strategies.strategy_plan import StrategyPlan
+
+
+def _driver() -> ReplayDriver:
+    return ReplayDriver(StrategyPlan.compile(strategies=[MACrossoverStrategy(9, 21)]), minutes=1)
+
+
+def test_replay_us_frames_matches_batch():
+    frames = {s: make_test_df(200, freq="1min", seed=i) for i, s in enumerate(("X", "Y"))}
+    assert frames["X"]["timestamp"].dt.unit == "us"
+
+    driver = _driver()
+    result = driver.run(candles_tape(frames))
+    assert result.bars == 400
+    assert driver.compare_batch(result, frames).empty
+
+
+def test_replay_stored_candles(tmp_path):
+    path = tmp_path / "X.csv"
+    make_test_df(120, freq="1min", seed=3).to_csv(path, index=False)
+    frames = {"X": load_candles(path)}
+
+    driver = _driver()
+    result = driver.run(candles_tape(frames))
+    assert result.bars == 120
+    assert driver.compare_batch(result, frames).empty
@@ -0,0 +1,106 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.common_types import Unit
+from core.test_data_generator import make_test_df
+from data.fetch_request import QKFetchRequest
+from data.resampler import Resampler, asof_indexer, resample
+
+
+def _reference(df: pd.DataFrame, rule: str) -> pd.DataFrame:
+    # 09:15-anchored groupby over in-session bars; make_test_df runs
+    # straight through the clock from the open, so origin="start"
+    grouped = df.set_index("timestamp").between_time("09:15", "15:29").resample(rule, origin="start", label="left")
+    out = grouped.agg({"open": "first", "high": "max", "low": "min", "close": "last", "adjclose": "last", "volume": "sum"})
+    return out.dropna().reset_index()
+
+
+def test_resample_us_frame_matches_groupby():
+    df = make_test_df(750, freq="1min", seed=3)
+    assert df["timestamp"].dt.unit == "us"
+
+    bars = resample(df, (Unit.minutes, 15))
+    assert len(bars) == 25
+    assert bars["timestamp"].dtype == df["timestamp"].dtype
+
+    expected = _reference(df, "15min")
+    pd.testing.assert_frame_equal(bars, expected, check_dtype=False)
+
+
+def test_resample_same_for_us_and_ns():
+    df = make_test_df(750, freq="1min", seed=4)
+    ns = df.assign(timestamp=df["timestamp"].dt.as_unit("ns"))
+    for target in [(Unit.minutes, 5), (Unit.hours, 1), (Unit.days, 1)]:
+        a = resample(df, target)
+        b = resample(ns, target)
+        pd.testing.assert_frame_equal(a.assign(timestamp=a["timestamp"].dt.as_unit("ns")), b)
+
+
+def test_asof_indexer_us_frame_uses_closed_bars_only():
+    df = make_test_df(120, freq="5min", seed=5)
+    bars = resample(df, (Unit.minutes, 15))
+    rows = asof_indexer(df["timestamp"], bars["timestamp"], (Unit.minutes, 15))
+
+    # 5m bars 0-1 precede the first 15m close; bar 2 ends as it closes
+    np.testing.assert_array_equal(rows[:6], [-1, -1, 0, 0, 0, 1])
+    bar_end = df["timestamp"] + pd.Timedelta("5min")
+    used = rows >= 0
+    closes = bars["timestamp"].iloc[rows[used]].to_numpy() + pd.Timedelta("15min")
+    assert (closes <= bar_end[used].to_numpy()).all()
+
+
+class _SlowData:
+    """
+    data_manager stand-in: every fetch takes a while and is counted.
+    """
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def fetch(self, ticker, request):
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.1)
+        if self.fail:
+            raise ConnectionError("down")
+        return make_test_df(750, freq="1min", seed=6)
+
+
+TIMEFRAMES = [(Unit.minutes, 1), (Unit.minutes, 15), (Unit.hours, 1)]
+REQUEST = QKFetchRequest(mode="intraday")
+
+
+def test_concurrent_frames_fetch_and_derive_once():
+    data = _SlowData()
+    resampler = Resampler(data)
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: resampler.frames("AAA", REQUEST, TIMEFRAMES), range(8)))
+
+    assert data.calls == 1
+    stats = resampler.stats()
+    assert (stats["fetches"], stats["derived"]) == (1, 2)
+    assert stats["hits"] == 7 * 3
+    for tf in TIMEFRAMES:
+        assert all(r[tf] is results[0][tf] for r in results)
+
+
+def test_concurrent_failure_reaches_every_waiter_and_is_not_cached():
+    data = _SlowData(fail=True)
+    resampler = Resampler(data)
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(resampler.base, "AAA", REQUEST, (Unit.minutes, 1)) for _ in range(4)]
+        for f in futures:
+            with pytest.raises(ConnectionError):
+                f.result()
+    assert data.calls == 1
+
+    data.fail = False
+    assert len(resampler.base("AAA", REQUEST, (Unit.minutes, 1))) == 750
+    assert data.calls == 2
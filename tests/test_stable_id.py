@@ -0,0 +1,61 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from core.common_types import Unit
+from core.stable_id import param_signature, param_slug
+from indicators.indicator_mcginley import McGinleyDynamic
+from indicators.indicator_moving_average import MovingAverage
+from strategies.strategy_ma_crossover import MACrossoverStrategy
+from strategies.strategy_mcginley_breakout import McGinleyBreakoutStrategy
+from strategies.strategy_vwap_crossover import VWAPCrossoverStrategy
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class _Obj:
+    def __init__(self, **params):
+        vars(self).update(params)
+        self._private = object()
+
+
+def test_signature_depends_on_params_only():
+    a = param_signature(_Obj(period=14, source="close"))
+    assert a == param_signature(_Obj(source="close", period=14))    # order-free
+    assert a == param_signature(_Obj(period=14.0, source="close"))  # 14.0 == 14
+    assert a != param_signature(_Obj(period=15, source="close"))
+    assert a.startswith(f"{__name__}._Obj(")
+    assert param_signature(_Obj(unit=Unit.minutes, spans=(1, 2))).endswith("(spans=1-2,unit=m)")
+
+
+def test_slug_keeps_assignment_order():
+    assert param_slug({"fast": 9, "slow": 21}) == "9_21"
+    assert param_slug({"symbol": "NSE_EQ|INE848E01016"}) == "NSE-EQ-INE848E01016"   # "_" is the separator
+
+
+def test_names_do_not_drift_between_instances():
+    first = [MACrossoverStrategy(9, 21), VWAPCrossoverStrategy(1, 7), McGinleyBreakoutStrategy(14)]
+    second = [MACrossoverStrategy(9, 21), VWAPCrossoverStrategy(1, 7), McGinleyBreakoutStrategy(14)]
+    assert [s.signal_name for s in first] == [s.signal_name for s in second]
+    assert [s.cache_key for s in first] == [s.cache_key for s in second]
+    assert first[0].signal_name == "ma_cross_9_21"
+    assert first[2].signal_name == "mcg_break_signal_14_0.6_close"
+    assert MovingAverage(21).cache_key == "indicators.indicator_moving_average.MovingAverage(period=21,source=close)"
+
+
+def test_keys_are_stable_across_processes():
+    code = (
+        "from indicators.indicator_mcginley import McGinleyDynamic\n"
+        "from strategies.strategy_ma_crossover import MACrossoverStrategy\n"
+        "print(McGinleyDynamic(14).cache_key)\n"
+        "s = MACrossoverStrategy(9, 21)\n"
+        "print(s.cache_key)\n"
+        "print(s.signal_name)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout.split()
+
+    s = MACrossoverStrategy(9, 21)
+    assert out == [McGinleyDynamic(14).cache_key, s.cache_key, s.signal_name]
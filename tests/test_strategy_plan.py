@@ -0,0 +1,60 @@
+import pytest
+
+from core.test_data_generator import make_test_df
+from indicators.indicator_moving_average import MovingAverage
+from strategies.QK_strategy_manager import StrategyManager
+from strategies.strategy_ma_crossover import MACrossoverStrategy
+from strategies.strategy_plan import StrategyPlan, _toposort
+
+
+def test_toposort_runs_producers_first():
+    smooth = MovingAverage(3, source="ma_5")     # reads ma_5
+    plan = StrategyPlan.compile([smooth, MovingAverage(20), MovingAverage(5)])
+
+    names = [ind.cache_key for ind in plan.indicators]
+    assert names.index(MovingAverage(5).cache_key) < names.index(smooth.cache_key)
+    # independent indicators keep registration order
+    assert names.index(MovingAverage(20).cache_key) < names.index(MovingAverage(5).cache_key)
+
+    out = plan.run(make_test_df(50, seed=1))
+    assert out["ma_3"].notna().any()
+
+
+def test_toposort_rejects_cycles():
+    a = MovingAverage(3, source="ma_4")
+    b = MovingAverage(4, source="ma_3")
+    with pytest.raises(ValueError, match="cycle"):
+        _toposort([a, b])
+
+
+def test_compile_dedupes_indicators_and_strategies():
+    plan = StrategyPlan.compile(
+        [MovingAverage(9)],
+        [MACrossoverStrategy(9, 21), MACrossoverStrategy(9, 21), MACrossoverStrategy(5, 21)],
+    )
+    assert sorted(plan.indicator_columns) == ["ma_21", "ma_5", "ma_9"]
+    assert len(plan.signal_columns) == 2
+
+
+def test_compile_rejects_missing_inputs():
+    class NeedsRsi(MACrossoverStrategy):
+        def required_columns(self):
+            return ["rsi_14"]
+
+    with pytest.raises(ValueError, match="rsi_14"):
+        StrategyPlan.compile(strategies=[NeedsRsi(9, 21)])
+
+
+def test_manager_recompiles_after_swap():
+    mgr = StrategyManager()
+    mgr.add_indicator(MovingAverage(5))
+    assert mgr.compile().indicator_columns == ["ma_5"]
+
+    # same indicator count, different indicator
+    mgr.remove_indicator(MovingAverage(5)).add_indicator(MovingAverage(7))
+    assert mgr.compile().indicator_columns == ["ma_7"]
+
+    mgr.add(MACrossoverStrategy(9, 21))
+    assert mgr.signal_columns == [MACrossoverStrategy(9, 21).signal_name]
+    mgr.remove(MACrossoverStrategy(9, 21))
+    assert mgr.signal_columns == []
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.test_data_generator import make_test_df
+from indicators.indicator_day_range_percentage import DayRangePct
+from indicators.indicator_mcginley import McGinleyDynamic
+from indicators.indicator_moving_average import MovingAverage
+from indicators.indicator_vwap import VWAP
+from strategies.strategy_day_range_breakout import DayRangeBreakoutStrategy
+from strategies.strategy_ma_crossover import MACrossoverStrategy
+from strategies.strategy_mcginley_breakout import McGinleyBreakoutStrategy
+from strategies.strategy_plan import StrategyPlan
+from strategies.strategy_vwap_crossover import VWAPCrossoverStrategy
+
+
+LAST_N = 40
+
+
+def _values(indicator, df) -> np.ndarray:
+    (column,) = indicator.compute(df.reset_index(drop=True)).values()
+    return column.to_numpy()
+
+
+@pytest.mark.parametrize("indicator, rtol", [
+    (MovingAverage(20), 1e-12),
+    (DayRangePct(), 0),
+    (VWAP(2), 1e-12),
+    (VWAP(3), 1e-12),
+    # the seed's remaining influence is bounded by CONVERGENCE_TOL
+    (McGinleyDynamic(14), McGinleyDynamic.CONVERGENCE_TOL),
+])
+def test_tail_matches_full_history(indicator, rtol):
+    df = make_test_df(1500, freq="5min", seed=11)
+    start = indicator.tail_start(df, LAST_N)
+    assert 0 < start <= len(df) - LAST_N
+
+    full = _values(indicator, df)[-LAST_N:]
+    tail = _values(indicator, df.iloc[start:])[-LAST_N:]
+    assert np.isfinite(full).all()
+    np.testing.assert_allclose(tail, full, rtol=rtol)
+
+
+def test_vwap_tail_starts_at_a_window_reset():
+    df = make_test_df(1500, freq="5min", seed=12)
+    start = VWAP(2).tail_start(df, LAST_N)
+    # starting one bar later splits the window → the tail no longer matches
+    full = _values(VWAP(2), df)[-LAST_N:]
+    late = _values(VWAP(2), df.iloc[start + 1:])[-LAST_N:]
+    assert not np.allclose(late, full)
+
+
+def test_plan_tail_run_matches_full_run():
+    df = make_test_df(1500, freq="5min", seed=13)
+    plan = StrategyPlan.compile(strategies=[
+        MACrossoverStrategy(9, 21),
+        VWAPCrossoverStrategy(1, 2),
+        DayRangeBreakoutStrategy(0.01),
+        McGinleyBreakoutStrategy(14),
+    ])
+    assert plan.tail_start(df, LAST_N) > 0
+
+    full = plan.run(df).iloc[-LAST_N:]
+    tail = plan.run(df, tail=LAST_N).iloc[-LAST_N:]
+
+    pd.testing.assert_frame_equal(
+        tail[plan.signal_columns].reset_index(drop=True),
+        full[plan.signal_columns].reset_index(drop=True),
+    )
+    pd.testing.assert_frame_equal(
+        tail[plan.indicator_columns].reset_index(drop=True),
+        full[plan.indicator_columns].reset_index(drop=True),
+        rtol=McGinleyDynamic.CONVERGENCE_TOL,
+    )
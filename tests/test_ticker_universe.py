@@ -0,0 +1,76 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+from core.common_types import QKApi
+from data.ticker_symbols.ticker_universe import TickerUniverse, base_symbol
+
+
+CONFIG = {
+    "providers": {
+        "yfinance": {"symbols": ["ABB.NS", "TCS.NS", "INFY.BO"]},
+        "upstox": {"symbols": ["NSE_EQ|INE117A01022"]},
+        "dhan": {"symbol_security_pairs": [
+            {"symbol": "ABB", "security_id": 13},
+            {"symbol": "TCS", "security_id": "11536"},
+        ]},
+    }
+}
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "tickers.yaml"
+    path.write_text(yaml.safe_dump(CONFIG))
+    TickerUniverse.invalidate()
+    yield SimpleNamespace(value=str(path))   # stands in for a TickerSource
+    TickerUniverse.invalidate()
+
+
+def test_lookups():
+    universe = TickerUniverse(None, CONFIG, 0)
+
+    assert universe.symbols(QKApi.yfinance) == ["ABB.NS", "TCS.NS", "INFY.BO"]
+    assert universe.index_of(QKApi.yfinance, "TCS.NS") == 1
+    assert universe.contains(QKApi.upstox, "NSE_EQ|INE117A01022")
+    assert not universe.contains(QKApi.yfinance, "TCS")
+    assert universe.index_of(QKApi.dhan, "TCS") == 1
+
+    # any provider's naming maps to the same dhan id
+    assert universe.security_id("ABB.NS", api=QKApi.yfinance) == "13"
+    assert universe.security_id("TCS") == "11536"
+    assert universe.symbol_for_security_id(11536) == "TCS"
+    assert universe.security_id("NOPE") is None
+
+    assert base_symbol(QKApi.yfinance, "INFY.BO") == "INFY"
+    assert base_symbol(QKApi.upstox, "ABB.NS") == "ABB.NS"
+
+
+def test_load_is_cached_until_the_file_changes(source):
+    first = TickerUniverse.load(source)
+    assert TickerUniverse.load(source) is first
+
+    path = first.path
+    assert TickerUniverse._snapshot_path(path).is_file()
+
+    config = {"providers": {"yfinance": {"symbols": ["WIPRO.NS"]}}}
+    path.write_text(yaml.safe_dump(config))
+    os.utime(path, ns=(first.mtime_ns + 10**9, first.mtime_ns + 10**9))
+
+    second = TickerUniverse.load(source)
+    assert second is not first
+    assert second.symbols(QKApi.yfinance) == ["WIPRO.NS"]
+    assert second.symbols(QKApi.dhan) == []
+
+
+def test_snapshot_is_used_while_mtime_matches(source):
+    path = TickerUniverse.load(source).path
+    mtime_ns = path.stat().st_mtime_ns
+    TickerUniverse.invalidate()
+
+    # same mtime → the snapshot is read, not the (now unparseable) yaml
+    path.write_text("providers: [not, parsed]")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    assert TickerUniverse.load(source).symbols(QKApi.yfinance) == ["ABB.NS", "TCS.NS", "INFY.BO"]
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+from core.test_data_generator import make_test_df
+from core.time_index import bars_since, epoch_ns, time_bounds, time_slice, to_epoch
+from indicators.indicator_vwap import VWAP
+
+
+def _as_ns(df: pd.DataFrame) -> pd.DataFrame:
+    return df.assign(timestamp=df["timestamp"].dt.as_unit("ns"))
+
+
+def test_fetcher_frames_are_microsecond():
+    # the case below only means something if the generator still emits µs
+    assert make_test_df(10)["timestamp"].dt.unit == "us"
+
+
+def test_epoch_ns_is_ns_for_us_frames():
+    df = make_test_df(10)
+    stamps = epoch_ns(df)
+    assert stamps.dtype == np.int64
+    assert stamps[0] == to_epoch(df["timestamp"].iloc[0])
+    np.testing.assert_array_equal(stamps, epoch_ns(_as_ns(df)))
+
+
+def test_time_bounds_on_us_frame():
+    df = make_test_df(100)
+    lo, hi = time_bounds(df, "2025-01-01 10:00", "2025-01-01 11:00")
+    assert (lo, hi) == (9, 21)
+
+    window = time_slice(df, "2025-01-01 10:00", "2025-01-01 11:00")
+    assert window["timestamp"].iloc[0] == pd.Timestamp("2025-01-01 10:00", tz="Asia/Kolkata")
+    assert window["timestamp"].iloc[-1] == pd.Timestamp("2025-01-01 10:55", tz="Asia/Kolkata")
+
+
+def test_bars_since_on_us_frame():
+    df = make_test_df(100)
+    assert bars_since(df, "30min") == 7
+    assert bars_since(df, "30min") == bars_since(_as_ns(df), "30min")
+
+
+def test_vwap_tail_start_on_us_frame():
+    df = make_test_df(3000)
+    assert VWAP(1).tail_start(df, 10) == 2769
+    assert VWAP(1).tail_start(df, 10) == VWAP(1).tail_start(_as_ns(df), 10)
+
+
+def test_vwap_tail_matches_full_run():
+    df = make_test_df(3000)
+    ind = VWAP(1)
+    start = ind.tail_start(df, 10)
+    full = ind.compute(df)[ind.column_name()]
+    tail = ind.compute(df.iloc[start:].reset_index(drop=True))[ind.column_name()]
+    np.testing.assert_allclose(tail.to_numpy()[-10:], full.to_numpy()[-10:])
@@ -0,0 +1,47 @@
+import numpy as np
+
+from core.common_types import Unit
+from core.test_data_generator import make_test_df
+from indicators.indicator_moving_average import MovingAverage
+
+
+HOURLY = (Unit.hours, 1)
+
+
+def _values(indicator, df) -> np.ndarray:
+    (column,) = indicator.compute(df).values()
+    return column.to_numpy()
+
+
+def test_as_of_alignment_on_us_frame():
+    df = make_test_df(3000, freq="5min", seed=6)
+    assert df["timestamp"].dt.unit == "us"
+    ind = MovingAverage(3).on(HOURLY)
+
+    values = _values(ind, df)
+    assert np.isfinite(values).sum() > 2900
+
+    ns = df.assign(timestamp=df["timestamp"].dt.as_unit("ns"))
+    np.testing.assert_array_equal(values, _values(ind, ns))
+
+
+def test_no_lookahead_on_us_frame():
+    df = make_test_df(600, freq="5min", seed=7)
+    ind = MovingAverage(3).on(HOURLY)
+    full = _values(ind, df)
+
+    for cut in (100, 250, 433):
+        part = _values(ind, df.iloc[:cut])
+        np.testing.assert_array_equal(part, full[:cut])
+
+
+def test_tail_start_on_us_frame():
+    df = make_test_df(3000, freq="5min", seed=8)
+    ind = MovingAverage(3).on(HOURLY)
+    start = ind.tail_start(df, 50)
+    assert 0 < start < len(df) - 50
+
+    full = _values(ind, df)
+    tail = _values(ind, df.iloc[start:].reset_index(drop=True))
+    # rolling sums restart at a different row → last-ulp differences
+    np.testing.assert_allclose(tail[-50:], full[-50:], rtol=1e-12)
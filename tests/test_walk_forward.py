@@ -0,0 +1,60 @@
+import numpy as np
+
+from backtest.walk_forward import WalkForwardRunner, grid
+from core.test_data_generator import make_test_df
+from data.fetch_request import QKFetchRequest
+from strategies.strategy_ma_crossover import MACrossoverStrategy
+
+
+class FrameData:
+    """
+    data_manager stand-in serving fetcher-resolution (µs) frames.
+    """
+    def __init__(self, frames: dict):
+        self.frames = frames
+
+    def fetch(self, ticker, request):
+        return self.frames.get(ticker)
+
+
+def _runner(frames, candidates=None):
+    candidates = candidates or grid(MACrossoverStrategy, fast=[5, 10], slow=[20, 40])
+    return WalkForwardRunner(
+        FrameData(frames), QKFetchRequest(from_date="2020-01-01", to_date="2024-12-31"), candidates,
+        train="365D", test="90D", max_workers=1,
+    )
+
+
+def test_folds_pick_on_us_frames():
+    frames = {f"T{i}": make_test_df(1500, start="2020-01-01", freq="1D", seed=i) for i in range(3)}
+    assert frames["T0"]["timestamp"].dt.unit == "us"
+
+    result = _runner(frames).run(list(frames))
+    assert len(result.folds) > 0
+    assert result.folds["chosen"].notna().all()
+    assert len(result.oos_returns) > 0
+    assert result.summary()["folds"] == len(result.folds)
+
+
+def test_us_and_ns_frames_agree():
+    frames = {"T": make_test_df(1200, start="2020-01-01", freq="1D", seed=9)}
+    ns = {k: df.assign(timestamp=df["timestamp"].dt.as_unit("ns")) for k, df in frames.items()}
+
+    a = _runner(frames).run(list(frames))
+    b = _runner(ns).run(list(ns))
+    assert list(a.folds["chosen"]) == list(b.folds["chosen"])
+    np.testing.assert_array_equal(a.oos_returns.to_numpy(), b.oos_returns.to_numpy())
+
+
+def test_summary_without_picks():
+    # flat prices: no candidate has a train sharpe, so no fold picks one
+    df = make_test_df(900, start="2020-01-01", freq="1D", seed=1)
+    df[["open", "high", "low", "close", "adjclose"]] = 100.0
+
+    result = _runner({"FLAT": df}).run(["FLAT"])
+    assert result.folds["chosen"].isna().all()
+
+    summary = result.summary()
+    assert summary["efficiency"] is None
+    assert summary["picks"] == {}
+    assert (result.by_candidate()["picked"] == 0).all()